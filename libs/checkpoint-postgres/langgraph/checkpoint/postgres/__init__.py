@@ -4,6 +4,7 @@ import threading
 from collections import defaultdict
 from collections.abc import Iterator, Sequence
 from contextlib import contextmanager
+from datetime import timedelta
 from typing import Any
 
 from langchain_core.runnables import RunnableConfig
@@ -30,7 +31,20 @@ Conn = _internal.Conn  # For backward compatibility
 
 
 class PostgresSaver(BasePostgresSaver):
-    """Checkpointer that stores checkpoints in a Postgres database."""
+    """Checkpointer that stores checkpoints in a Postgres database.
+
+    Args:
+        conn: The Postgres connection or connection pool.
+        pipe: The pipeline to use with a single connection.
+        serde: The serializer to use for serializing and deserializing checkpoints.
+        dedupe_threshold: Enables content-addressed storage of channel values of
+            at least this many bytes once serialized. Identical values, such as
+            a system prompt or documents shared by many threads, are then stored
+            once in the `checkpoint_blob_contents` table rather than once per
+            thread and version. Contents no longer referenced are removed by
+            `prune_blob_contents`. Defaults to None, which stores every value
+            with its thread.
+    """
 
     lock: threading.Lock
 
@@ -39,6 +53,8 @@ class PostgresSaver(BasePostgresSaver):
         conn: _internal.Conn,
         pipe: Pipeline | None = None,
         serde: SerializerProtocol | None = None,
+        *,
+        dedupe_threshold: int | None = None,
     ) -> None:
         super().__init__(serde=serde)
         if isinstance(conn, ConnectionPool) and pipe is not None:
@@ -48,19 +64,26 @@ class PostgresSaver(BasePostgresSaver):
 
         self.conn = conn
         self.pipe = pipe
+        self.dedupe_threshold = dedupe_threshold
         self.lock = threading.Lock()
         self.supports_pipeline = Capabilities().has_pipeline()
 
     @classmethod
     @contextmanager
     def from_conn_string(
-        cls, conn_string: str, *, pipeline: bool = False
+        cls,
+        conn_string: str,
+        *,
+        pipeline: bool = False,
+        dedupe_threshold: int | None = None,
     ) -> Iterator[PostgresSaver]:
         """Create a new PostgresSaver instance from a connection string.
 
         Args:
             conn_string: The Postgres connection info string.
             pipeline: whether to use Pipeline
+            dedupe_threshold: The minimum size of channel values to store once
+                by content, see `PostgresSaver`.
 
         Returns:
             PostgresSaver: A new PostgresSaver instance.
@@ -70,9 +93,9 @@ class PostgresSaver(BasePostgresSaver):
         ) as conn:
             if pipeline:
                 with conn.pipeline() as pipe:
-                    yield cls(conn, pipe)
+                    yield cls(conn, pipe, dedupe_threshold=dedupe_threshold)
             else:
-                yield cls(conn)
+                yield cls(conn, dedupe_threshold=dedupe_threshold)
 
     def setup(self) -> None:
         """Set up the checkpoint database asynchronously.
@@ -107,6 +130,7 @@ class PostgresSaver(BasePostgresSaver):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> Iterator[CheckpointTuple]:
         """List checkpoints from the database.
 
@@ -118,6 +142,7 @@ class PostgresSaver(BasePostgresSaver):
             filter: Additional filtering criteria for metadata.
             before: If provided, only checkpoints before the specified checkpoint ID are returned.
             limit: The maximum number of checkpoints to return.
+            metadata_only: Skip loading channel values and pending writes.
 
         Yields:
             An iterator of checkpoint tuples.
@@ -141,7 +166,10 @@ class PostgresSaver(BasePostgresSaver):
             [CheckpointTuple(...), ...]
         """
         where, args = self._search_where(config, filter, before)
-        query = self.SELECT_SQL + where + " ORDER BY checkpoint_id DESC"
+        if metadata_only:
+            query = self.SELECT_METADATA_SQL + where + " ORDER BY checkpoint_id DESC"
+        else:
+            query = self.SELECT_SQL + where + " ORDER BY checkpoint_id DESC"
         if limit:
             query += f" LIMIT {limit}"
         # if we change this to use .stream() we need to make sure to close the cursor
@@ -150,6 +178,10 @@ class PostgresSaver(BasePostgresSaver):
             values = cur.fetchall()
             if not values:
                 return
+            if metadata_only:
+                for value in values:
+                    yield self._load_metadata_tuple(value)
+                return
             # migrate pending sends if necessary
             if to_migrate := [
                 v
@@ -308,15 +340,21 @@ class PostgresSaver(BasePostgresSaver):
             if blob_versions := {
                 k: v for k, v in new_versions.items() if k in blob_values
             }:
-                cur.executemany(
-                    self.UPSERT_CHECKPOINT_BLOBS_SQL,
-                    self._dump_blobs(
-                        thread_id,
-                        checkpoint_ns,
-                        blob_values,
-                        blob_versions,
-                    ),
+                blobs = self._dump_blobs(
+                    thread_id,
+                    checkpoint_ns,
+                    blob_values,
+                    blob_versions,
                 )
+                if self.dedupe_threshold is None:
+                    cur.executemany(self.UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
+                else:
+                    contents, refs = self._dedupe_blobs(blobs)
+                    if contents:
+                        cur.executemany(
+                            self.UPSERT_CHECKPOINT_BLOB_CONTENTS_SQL, contents
+                        )
+                    cur.executemany(self.UPSERT_CHECKPOINT_BLOB_REFS_SQL, refs)
             cur.execute(
                 self.UPSERT_CHECKPOINTS_SQL,
                 (
@@ -387,6 +425,23 @@ class PostgresSaver(BasePostgresSaver):
                 (str(thread_id),),
             )
 
+    def prune_blob_contents(self, older_than: timedelta = timedelta(hours=1)) -> None:
+        """Delete deduplicated channel values no longer referenced by any thread.
+
+        Args:
+            older_than: Only delete contents last written longer ago than this,
+                so that contents being written concurrently are kept. Must be
+                at least three minutes: twice the interval at which the last
+                write time of contents written again is updated, plus a
+                margin for writes still being committed.
+
+        Raises:
+            ValueError: If `older_than` is shorter than three minutes.
+        """
+        self._check_prune_age(older_than)
+        with self._cursor(pipeline=True) as cur:
+            cur.execute(self.PRUNE_CHECKPOINT_BLOB_CONTENTS_SQL, (older_than,))
+
     @contextmanager
     def _cursor(self, *, pipeline: bool = False) -> Iterator[Cursor[DictRow]]:
         """Create a database cursor as a context manager.
@@ -4,6 +4,7 @@ import asyncio
 from collections import defaultdict
 from collections.abc import AsyncIterator, Iterator, Sequence
 from contextlib import asynccontextmanager
+from datetime import timedelta
 from typing import Any
 
 from langchain_core.runnables import RunnableConfig
@@ -30,7 +31,16 @@ Conn = _ainternal.Conn  # For backward compatibility
 
 
 class AsyncPostgresSaver(BasePostgresSaver):
-    """Asynchronous checkpointer that stores checkpoints in a Postgres database."""
+    """Asynchronous checkpointer that stores checkpoints in a Postgres database.
+
+    Args:
+        conn: The Postgres connection or connection pool.
+        pipe: The pipeline to use with a single connection.
+        serde: The serializer to use for serializing and deserializing checkpoints.
+        dedupe_threshold: Enables content-addressed storage of channel values of
+            at least this many bytes once serialized, see `PostgresSaver`.
+            Defaults to None, which stores every value with its thread.
+    """
 
     lock: asyncio.Lock
 
@@ -39,6 +49,8 @@ class AsyncPostgresSaver(BasePostgresSaver):
         conn: _ainternal.Conn,
         pipe: AsyncPipeline | None = None,
         serde: SerializerProtocol | None = None,
+        *,
+        dedupe_threshold: int | None = None,
     ) -> None:
         super().__init__(serde=serde)
         if isinstance(conn, AsyncConnectionPool) and pipe is not None:
@@ -48,6 +60,7 @@ class AsyncPostgresSaver(BasePostgresSaver):
 
         self.conn = conn
         self.pipe = pipe
+        self.dedupe_threshold = dedupe_threshold
         self.lock = asyncio.Lock()
         self.loop = asyncio.get_running_loop()
         self.supports_pipeline = Capabilities().has_pipeline()
@@ -60,12 +73,15 @@ class AsyncPostgresSaver(BasePostgresSaver):
         *,
         pipeline: bool = False,
         serde: SerializerProtocol | None = None,
+        dedupe_threshold: int | None = None,
     ) -> AsyncIterator[AsyncPostgresSaver]:
         """Create a new AsyncPostgresSaver instance from a connection string.
 
         Args:
             conn_string: The Postgres connection info string.
             pipeline: whether to use AsyncPipeline
+            dedupe_threshold: The minimum size of channel values to store once
+                by content, see `PostgresSaver`.
 
         Returns:
             AsyncPostgresSaver: A new AsyncPostgresSaver instance.
@@ -75,9 +91,14 @@ class AsyncPostgresSaver(BasePostgresSaver):
         ) as conn:
             if pipeline:
                 async with conn.pipeline() as pipe:
-                    yield cls(conn=conn, pipe=pipe, serde=serde)
+                    yield cls(
+                        conn=conn,
+                        pipe=pipe,
+                        serde=serde,
+                        dedupe_threshold=dedupe_threshold,
+                    )
             else:
-                yield cls(conn=conn, serde=serde)
+                yield cls(conn=conn, serde=serde, dedupe_threshold=dedupe_threshold)
 
     async def setup(self) -> None:
         """Set up the checkpoint database asynchronously.
@@ -112,6 +133,7 @@ class AsyncPostgresSaver(BasePostgresSaver):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> AsyncIterator[CheckpointTuple]:
         """List checkpoints from the database asynchronously.
 
@@ -123,12 +145,16 @@ class AsyncPostgresSaver(BasePostgresSaver):
             filter: Additional filtering criteria for metadata.
             before: If provided, only checkpoints before the specified checkpoint ID are returned.
             limit: Maximum number of checkpoints to return.
+            metadata_only: Skip loading channel values and pending writes.
 
         Yields:
             An asynchronous iterator of matching checkpoint tuples.
         """
         where, args = self._search_where(config, filter, before)
-        query = self.SELECT_SQL + where + " ORDER BY checkpoint_id DESC"
+        if metadata_only:
+            query = self.SELECT_METADATA_SQL + where + " ORDER BY checkpoint_id DESC"
+        else:
+            query = self.SELECT_SQL + where + " ORDER BY checkpoint_id DESC"
         if limit:
             query += f" LIMIT {limit}"
         # if we change this to use .stream() we need to make sure to close the cursor
@@ -137,6 +163,10 @@ class AsyncPostgresSaver(BasePostgresSaver):
             values = await cur.fetchall()
             if not values:
                 return
+            if metadata_only:
+                for value in values:
+                    yield self._load_metadata_tuple(value)
+                return
             # migrate pending sends if necessary
             if to_migrate := [
                 v
@@ -265,16 +295,22 @@ class AsyncPostgresSaver(BasePostgresSaver):
             if blob_versions := {
                 k: v for k, v in new_versions.items() if k in blob_values
             }:
-                await cur.executemany(
-                    self.UPSERT_CHECKPOINT_BLOBS_SQL,
-                    await asyncio.to_thread(
-                        self._dump_blobs,
-                        thread_id,
-                        checkpoint_ns,
-                        blob_values,
-                        blob_versions,
-                    ),
+                blobs = await asyncio.to_thread(
+                    self._dump_blobs,
+                    thread_id,
+                    checkpoint_ns,
+                    blob_values,
+                    blob_versions,
                 )
+                if self.dedupe_threshold is None:
+                    await cur.executemany(self.UPSERT_CHECKPOINT_BLOBS_SQL, blobs)
+                else:
+                    contents, refs = self._dedupe_blobs(blobs)
+                    if contents:
+                        await cur.executemany(
+                            self.UPSERT_CHECKPOINT_BLOB_CONTENTS_SQL, contents
+                        )
+                    await cur.executemany(self.UPSERT_CHECKPOINT_BLOB_REFS_SQL, refs)
             await cur.execute(
                 self.UPSERT_CHECKPOINTS_SQL,
                 (
@@ -344,6 +380,25 @@ class AsyncPostgresSaver(BasePostgresSaver):
                 (str(thread_id),),
             )
 
+    async def aprune_blob_contents(
+        self, older_than: timedelta = timedelta(hours=1)
+    ) -> None:
+        """Delete deduplicated channel values no longer referenced by any thread.
+
+        Args:
+            older_than: Only delete contents last written longer ago than this,
+                so that contents being written concurrently are kept. Must be
+                at least three minutes: twice the interval at which the last
+                write time of contents written again is updated, plus a
+                margin for writes still being committed.
+
+        Raises:
+            ValueError: If `older_than` is shorter than three minutes.
+        """
+        self._check_prune_age(older_than)
+        async with self._cursor(pipeline=True) as cur:
+            await cur.execute(self.PRUNE_CHECKPOINT_BLOB_CONTENTS_SQL, (older_than,))
+
     @asynccontextmanager
     async def _cursor(
         self, *, pipeline: bool = False
@@ -435,6 +490,7 @@ class AsyncPostgresSaver(BasePostgresSaver):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> Iterator[CheckpointTuple]:
         """List checkpoints from the database.
 
@@ -446,6 +502,7 @@ class AsyncPostgresSaver(BasePostgresSaver):
             filter: Additional filtering criteria for metadata.
             before: If provided, only checkpoints before the specified checkpoint ID are returned.
             limit: Maximum number of checkpoints to return.
+            metadata_only: Skip loading channel values and pending writes.
 
         Yields:
             An iterator of matching checkpoint tuples.
@@ -462,7 +519,13 @@ class AsyncPostgresSaver(BasePostgresSaver):
                 )
         except RuntimeError:
             pass
-        aiter_ = self.alist(config, filter=filter, before=before, limit=limit)
+        aiter_ = self.alist(
+            config,
+            filter=filter,
+            before=before,
+            limit=limit,
+            metadata_only=metadata_only,
+        )
         while True:
             try:
                 yield asyncio.run_coroutine_threadsafe(
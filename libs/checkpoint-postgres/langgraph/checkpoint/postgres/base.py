@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import hashlib
 import random
 import warnings
 from collections.abc import Sequence
+from datetime import timedelta
 from importlib.metadata import version as get_version
 from typing import Any, Optional, cast
 
@@ -11,6 +13,7 @@ from langgraph.checkpoint.base import (
     WRITES_IDX_MAP,
     BaseCheckpointSaver,
     ChannelVersions,
+    CheckpointTuple,
     get_checkpoint_id,
 )
 from langgraph.checkpoint.serde.types import TASKS
@@ -82,6 +85,16 @@ MIGRATIONS = [
     CREATE INDEX CONCURRENTLY IF NOT EXISTS checkpoint_writes_thread_id_idx ON checkpoint_writes(thread_id);
     """,
     """ALTER TABLE checkpoint_writes ADD COLUMN task_path TEXT NOT NULL DEFAULT '';""",
+    """CREATE TABLE IF NOT EXISTS checkpoint_blob_contents (
+    hash BYTEA PRIMARY KEY,
+    type TEXT NOT NULL,
+    blob BYTEA NOT NULL,
+    used_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);""",
+    "ALTER TABLE checkpoint_blobs ADD COLUMN IF NOT EXISTS content_hash BYTEA;",
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS checkpoint_blobs_content_hash_idx ON checkpoint_blobs(content_hash) WHERE content_hash IS NOT NULL;
+    """,
 ]
 
 SELECT_SQL = """
@@ -93,13 +106,15 @@ select
     parent_checkpoint_id,
     metadata,
     (
-        select array_agg(array[bl.channel::bytea, bl.type::bytea, bl.blob])
+        select array_agg(array[bl.channel::bytea, bl.type::bytea, coalesce(bc.blob, bl.blob)])
         from jsonb_each_text(checkpoint -> 'channel_versions')
         inner join checkpoint_blobs bl
             on bl.thread_id = checkpoints.thread_id
             and bl.checkpoint_ns = checkpoints.checkpoint_ns
             and bl.channel = jsonb_each_text.key
             and bl.version = jsonb_each_text.value
+        left join checkpoint_blob_contents bc
+            on bc.hash = bl.content_hash
     ) as channel_values,
     (
         select
@@ -111,6 +126,16 @@ select
     ) as pending_writes
 from checkpoints """
 
+SELECT_METADATA_SQL = """
+select
+    thread_id,
+    checkpoint,
+    checkpoint_ns,
+    checkpoint_id,
+    parent_checkpoint_id,
+    metadata
+from checkpoints """
+
 SELECT_PENDING_SENDS_SQL = f"""
 select
     checkpoint_id,
@@ -128,6 +153,35 @@ UPSERT_CHECKPOINT_BLOBS_SQL = """
     ON CONFLICT (thread_id, checkpoint_ns, channel, version) DO NOTHING
 """
 
+UPSERT_CHECKPOINT_BLOB_REFS_SQL = """
+    INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob, content_hash)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (thread_id, checkpoint_ns, channel, version) DO NOTHING
+"""
+
+# touching used_at keeps contents written again from being pruned before
+# the rows referencing them are inserted, at most once per this interval
+BLOB_CONTENTS_TOUCH_INTERVAL = timedelta(minutes=1)
+# a put that skipped the touch may find used_at up to one interval old, and
+# its references are only visible once committed, so pruning waits for twice
+# the interval plus a margin for slow puts
+MIN_BLOB_CONTENTS_PRUNE_AGE = 2 * BLOB_CONTENTS_TOUCH_INTERVAL + timedelta(minutes=1)
+
+UPSERT_CHECKPOINT_BLOB_CONTENTS_SQL = """
+    INSERT INTO checkpoint_blob_contents (hash, type, blob)
+    VALUES (%s, %s, %s)
+    ON CONFLICT (hash) DO UPDATE SET used_at = now()
+    WHERE checkpoint_blob_contents.used_at < now() - interval '1 minute'
+"""
+
+PRUNE_CHECKPOINT_BLOB_CONTENTS_SQL = """
+    DELETE FROM checkpoint_blob_contents bc
+    WHERE bc.used_at < now() - %s
+        AND NOT EXISTS (
+            SELECT 1 FROM checkpoint_blobs bl WHERE bl.content_hash = bc.hash
+        )
+"""
+
 UPSERT_CHECKPOINTS_SQL = """
     INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint, metadata)
     VALUES (%s, %s, %s, %s, %s, %s)
@@ -155,14 +209,19 @@ INSERT_CHECKPOINT_WRITES_SQL = """
 
 class BasePostgresSaver(BaseCheckpointSaver[str]):
     SELECT_SQL = SELECT_SQL
+    SELECT_METADATA_SQL = SELECT_METADATA_SQL
     SELECT_PENDING_SENDS_SQL = SELECT_PENDING_SENDS_SQL
     MIGRATIONS = MIGRATIONS
     UPSERT_CHECKPOINT_BLOBS_SQL = UPSERT_CHECKPOINT_BLOBS_SQL
+    UPSERT_CHECKPOINT_BLOB_REFS_SQL = UPSERT_CHECKPOINT_BLOB_REFS_SQL
+    UPSERT_CHECKPOINT_BLOB_CONTENTS_SQL = UPSERT_CHECKPOINT_BLOB_CONTENTS_SQL
+    PRUNE_CHECKPOINT_BLOB_CONTENTS_SQL = PRUNE_CHECKPOINT_BLOB_CONTENTS_SQL
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
     UPSERT_CHECKPOINT_WRITES_SQL = UPSERT_CHECKPOINT_WRITES_SQL
     INSERT_CHECKPOINT_WRITES_SQL = INSERT_CHECKPOINT_WRITES_SQL
 
     supports_pipeline: bool
+    dedupe_threshold: int | None = None
 
     def _migrate_pending_sends(
         self,
@@ -176,7 +235,7 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
         enc, blob = self.serde.dumps_typed(
             [self.serde.loads_typed((c.decode(), b)) for c, b in pending_sends],
         )
-        channel_values.append((TASKS.encode(), enc.encode(), blob))
+        channel_values.append((TASKS.encode(), enc.encode(), bytes(blob)))
         # add to versions
         checkpoint["channel_versions"][TASKS] = (
             max(checkpoint["channel_versions"].values())
@@ -184,6 +243,15 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             else self.get_next_version(None, None)
         )
 
+    def _check_prune_age(self, older_than: timedelta) -> None:
+        # contents written again within the touch interval keep their old
+        # used_at, so a shorter age could prune them while they're referenced
+        if older_than < MIN_BLOB_CONTENTS_PRUNE_AGE:
+            raise ValueError(
+                f"older_than must be at least {MIN_BLOB_CONTENTS_PRUNE_AGE}, "
+                f"got {older_than}"
+            )
+
     def _load_blobs(
         self, blob_values: list[tuple[bytes, bytes, bytes]]
     ) -> dict[str, Any]:
@@ -201,7 +269,7 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
         checkpoint_ns: str,
         values: dict[str, Any],
         versions: ChannelVersions,
-    ) -> list[tuple[str, str, str, str, str, bytes | None]]:
+    ) -> list[tuple[str, str, str, str, str, bytes | memoryview | None]]:
         if not versions:
             return []
 
@@ -220,6 +288,58 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
             for k, ver in versions.items()
         ]
 
+    def _dedupe_blobs(
+        self, blobs: list[tuple[str, str, str, str, str, bytes | memoryview | None]]
+    ) -> tuple[
+        list[tuple[bytes, str, bytes | memoryview]],
+        list[tuple[str, str, str, str, str, bytes | memoryview | None, bytes | None]],
+    ]:
+        """Split dumped blobs into content-addressed contents and the rows
+        referencing them, for blobs of at least `dedupe_threshold` bytes."""
+        assert self.dedupe_threshold is not None
+        contents: dict[bytes, tuple[bytes, str, bytes | memoryview]] = {}
+        refs: list[
+            tuple[str, str, str, str, str, bytes | memoryview | None, bytes | None]
+        ] = []
+        for thread_id, checkpoint_ns, channel, version, type_, blob in blobs:
+            if blob is None or len(blob) < self.dedupe_threshold:
+                refs.append(
+                    (thread_id, checkpoint_ns, channel, version, type_, blob, None)
+                )
+                continue
+            h = hashlib.sha256(type_.encode() + b"\0")
+            h.update(blob)
+            digest = h.digest()
+            contents[digest] = (digest, type_, blob)
+            refs.append(
+                (thread_id, checkpoint_ns, channel, version, type_, None, digest)
+            )
+        return list(contents.values()), refs
+
+    def _load_metadata_tuple(self, value: dict[str, Any]) -> CheckpointTuple:
+        return CheckpointTuple(
+            {
+                "configurable": {
+                    "thread_id": value["thread_id"],
+                    "checkpoint_ns": value["checkpoint_ns"],
+                    "checkpoint_id": value["checkpoint_id"],
+                }
+            },
+            {**value["checkpoint"], "channel_values": {}},
+            value["metadata"],
+            (
+                {
+                    "configurable": {
+                        "thread_id": value["thread_id"],
+                        "checkpoint_ns": value["checkpoint_ns"],
+                        "checkpoint_id": value["parent_checkpoint_id"],
+                    }
+                }
+                if value["parent_checkpoint_id"]
+                else None
+            ),
+        )
+
     def _load_writes(
         self, writes: list[tuple[bytes, bytes, bytes, bytes]]
     ) -> list[tuple[str, str, Any]]:
@@ -244,7 +364,7 @@ class BasePostgresSaver(BaseCheckpointSaver[str]):
         task_id: str,
         task_path: str,
         writes: Sequence[tuple[str, Any]],
-    ) -> list[tuple[str, str, str, str, str, int, str, str, bytes]]:
+    ) -> list[tuple[str, str, str, str, str, int, str, str, bytes | memoryview]]:
         return [
             (
                 thread_id,
@@ -3,7 +3,7 @@ import threading
 import warnings
 from collections.abc import AsyncIterator, Iterator, Sequence
 from contextlib import asynccontextmanager, contextmanager
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
@@ -112,6 +112,14 @@ select
     ) as pending_sends
 from checkpoints """
 
+SELECT_METADATA_SQL = """
+select
+    thread_id,
+    checkpoint,
+    checkpoint_ns,
+    metadata
+from checkpoints """
+
 UPSERT_CHECKPOINT_BLOBS_SQL = """
     INSERT INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, type, blob)
     VALUES (%s, %s, %s, %s, %s)
@@ -151,7 +159,7 @@ def _dump_blobs(
     checkpoint_ns: str,
     values: dict[str, Any],
     versions: ChannelVersions,
-) -> list[tuple[str, str, str, str, Optional[bytes]]]:
+) -> list[tuple[str, str, str, str, Optional[Union[bytes, memoryview]]]]:
     if not versions:
         return []
 
@@ -166,6 +174,20 @@ def _dump_blobs(
     ]
 
 
+def _load_metadata_tuple(value: dict[str, Any]) -> CheckpointTuple:
+    return CheckpointTuple(
+        config={
+            "configurable": {
+                "thread_id": value["thread_id"],
+                "checkpoint_ns": value["checkpoint_ns"],
+                "checkpoint_id": value["checkpoint"]["id"],
+            }
+        },
+        checkpoint={**value["checkpoint"], "channel_values": {}},
+        metadata=value["metadata"],
+    )
+
+
 class ShallowPostgresSaver(BasePostgresSaver):
     """A checkpoint saver that uses Postgres to store checkpoints.
 
@@ -175,6 +197,7 @@ class ShallowPostgresSaver(BasePostgresSaver):
     """
 
     SELECT_SQL = SELECT_SQL
+    SELECT_METADATA_SQL = SELECT_METADATA_SQL
     MIGRATIONS = MIGRATIONS
     UPSERT_CHECKPOINT_BLOBS_SQL = UPSERT_CHECKPOINT_BLOBS_SQL
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
@@ -262,20 +285,26 @@ class ShallowPostgresSaver(BasePostgresSaver):
         filter: Optional[dict[str, Any]] = None,
         before: Optional[RunnableConfig] = None,
         limit: Optional[int] = None,
+        metadata_only: bool = False,
     ) -> Iterator[CheckpointTuple]:
         """List checkpoints from the database.
 
         This method retrieves a list of checkpoint tuples from the Postgres database based
         on the provided config. For ShallowPostgresSaver, this method returns a list with
-        ONLY the most recent checkpoint.
+        ONLY the most recent checkpoint. With `metadata_only`, channel values and
+        pending writes are not loaded, and left empty.
         """
         where, args = self._search_where(config, filter, before)
-        query = self.SELECT_SQL + where
+        select = self.SELECT_METADATA_SQL if metadata_only else self.SELECT_SQL
+        query = select + where
         if limit:
             query += f" LIMIT {limit}"
         with self._cursor() as cur:
-            cur.execute(self.SELECT_SQL + where, args, binary=True)
+            cur.execute(select + where, args, binary=True)
             for value in cur:
+                if metadata_only:
+                    yield _load_metadata_tuple(value)
+                    continue
                 checkpoint: Checkpoint = {
                     **value["checkpoint"],
                     "channel_values": self._load_blobs(value["channel_values"]),
@@ -532,6 +561,7 @@ class AsyncShallowPostgresSaver(BasePostgresSaver):
     """
 
     SELECT_SQL = SELECT_SQL
+    SELECT_METADATA_SQL = SELECT_METADATA_SQL
     MIGRATIONS = MIGRATIONS
     UPSERT_CHECKPOINT_BLOBS_SQL = UPSERT_CHECKPOINT_BLOBS_SQL
     UPSERT_CHECKPOINTS_SQL = UPSERT_CHECKPOINTS_SQL
@@ -623,20 +653,26 @@ class AsyncShallowPostgresSaver(BasePostgresSaver):
         filter: Optional[dict[str, Any]] = None,
         before: Optional[RunnableConfig] = None,
         limit: Optional[int] = None,
+        metadata_only: bool = False,
     ) -> AsyncIterator[CheckpointTuple]:
         """List checkpoints from the database asynchronously.
 
         This method retrieves a list of checkpoint tuples from the Postgres database based
         on the provided config. For ShallowPostgresSaver, this method returns a list with
-        ONLY the most recent checkpoint.
+        ONLY the most recent checkpoint. With `metadata_only`, channel values and
+        pending writes are not loaded, and left empty.
         """
         where, args = self._search_where(config, filter, before)
-        query = self.SELECT_SQL + where
+        select = self.SELECT_METADATA_SQL if metadata_only else self.SELECT_SQL
+        query = select + where
         if limit:
             query += f" LIMIT {limit}"
         async with self._cursor() as cur:
-            await cur.execute(self.SELECT_SQL + where, args, binary=True)
+            await cur.execute(select + where, args, binary=True)
             async for value in cur:
+                if metadata_only:
+                    yield _load_metadata_tuple(value)
+                    continue
                 checkpoint: Checkpoint = {
                     **value["checkpoint"],
                     "channel_values": self._load_blobs(value["channel_values"]),
@@ -866,14 +902,22 @@ class AsyncShallowPostgresSaver(BasePostgresSaver):
         filter: Optional[dict[str, Any]] = None,
         before: Optional[RunnableConfig] = None,
         limit: Optional[int] = None,
+        metadata_only: bool = False,
     ) -> Iterator[CheckpointTuple]:
         """List checkpoints from the database.
 
         This method retrieves a list of checkpoint tuples from the Postgres database based
         on the provided config. For ShallowPostgresSaver, this method returns a list with
-        ONLY the most recent checkpoint.
+        ONLY the most recent checkpoint. With `metadata_only`, channel values and
+        pending writes are not deserialized, and left empty.
         """
-        aiter_ = self.alist(config, filter=filter, before=before, limit=limit)
+        aiter_ = self.alist(
+            config,
+            filter=filter,
+            before=before,
+            limit=limit,
+            metadata_only=metadata_only,
+        )
         while True:
             try:
                 yield asyncio.run_coroutine_threadsafe(
@@ -138,12 +138,14 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
         deserializer: Callable[[bytes | orjson.Fragment], dict[str, Any]] | None = None,
         index: PostgresIndexConfig | None = None,
         ttl: TTLConfig | None = None,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
     ) -> None:
         if isinstance(conn, AsyncConnectionPool) and pipe is not None:
             raise ValueError(
                 "Pipeline should be used only with a single AsyncConnection, not AsyncConnectionPool."
             )
-        super().__init__()
+        super().__init__(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
         self._deserializer = deserializer
         self.conn = conn
         self.pipe = pipe
@@ -183,6 +185,8 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
         pool_config: PoolConfig | None = None,
         index: PostgresIndexConfig | None = None,
         ttl: TTLConfig | None = None,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
     ) -> AsyncIterator[AsyncPostgresStore]:
         """Create a new AsyncPostgresStore instance from a connection string.
 
@@ -193,6 +197,8 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
                 If provided, will create a connection pool and use it instead of a single connection.
                 This overrides the `pipeline` argument.
             index: The embedding config.
+            max_batch_size: Maximum number of operations sent to the database at once.
+            max_wait_ms: How long to hold a batch open for later operations, in milliseconds.
 
         Returns:
             AsyncPostgresStore: A new AsyncPostgresStore instance.
@@ -214,16 +220,35 @@ class AsyncPostgresStore(AsyncBatchedBaseStore, BasePostgresStore[_ainternal.Con
                     **cast(dict, pc),
                 ),
             ) as pool:
-                yield cls(conn=pool, index=index, ttl=ttl)
+                yield cls(
+                    conn=pool,
+                    index=index,
+                    ttl=ttl,
+                    max_batch_size=max_batch_size,
+                    max_wait_ms=max_wait_ms,
+                )
         else:
             async with await AsyncConnection.connect(
                 conn_string, autocommit=True, prepare_threshold=0, row_factory=dict_row
             ) as conn:
                 if pipeline:
                     async with conn.pipeline() as pipe:
-                        yield cls(conn=conn, pipe=pipe, index=index, ttl=ttl)
+                        yield cls(
+                            conn=conn,
+                            pipe=pipe,
+                            index=index,
+                            ttl=ttl,
+                            max_batch_size=max_batch_size,
+                            max_wait_ms=max_wait_ms,
+                        )
                 else:
-                    yield cls(conn=conn, index=index, ttl=ttl)
+                    yield cls(
+                        conn=conn,
+                        index=index,
+                        ttl=ttl,
+                        max_batch_size=max_batch_size,
+                        max_wait_ms=max_wait_ms,
+                    )
 
     async def setup(self) -> None:
         """Set up the store database asynchronously.
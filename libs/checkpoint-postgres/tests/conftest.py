@@ -27,6 +27,7 @@ async def clear_test_db(conn: AsyncConnection[DictRow]) -> None:
         await conn.execute("DELETE FROM checkpoint_blobs")
         await conn.execute("DELETE FROM checkpoint_writes")
         await conn.execute("DELETE FROM checkpoint_migrations")
+        await conn.execute("DELETE FROM checkpoint_blob_contents")
     except UndefinedTable:
         pass
     try:
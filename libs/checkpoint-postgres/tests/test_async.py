@@ -278,6 +278,26 @@ async def test_asearch(saver_name: str, test_data) -> None:
         } == {"", "inner"}
 
 
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe", "shallow"])
+async def test_alist_metadata_only(saver_name: str, test_data) -> None:
+    async with _saver(saver_name) as saver:
+        config = test_data["configs"][1]
+        chkpnt: Checkpoint = create_checkpoint(empty_checkpoint(), {}, 1)
+        chkpnt["channel_values"] = {"foo": "bar"}
+        chkpnt["channel_versions"] = {"foo": 1}
+        config = await saver.aput(config, chkpnt, test_data["metadata"][1], {"foo": 1})
+        await saver.aput_writes(config, [("foo", "baz")], "task-1")
+
+        thread = {"configurable": {"thread_id": "thread-2"}}
+        full = [c async for c in saver.alist(thread)]
+        light = [c async for c in saver.alist(thread, metadata_only=True)]
+        assert full[0].checkpoint["channel_values"] == {"foo": "bar"}
+        assert [c.config for c in light] == [c.config for c in full]
+        assert [c.metadata for c in light] == [c.metadata for c in full]
+        assert [c.checkpoint["channel_values"] for c in light] == [{}]
+        assert [c.pending_writes for c in light] == [None]
+
+
 @pytest.mark.parametrize("saver_name", ["base", "pool", "pipe", "shallow"])
 async def test_null_chars(saver_name: str, test_data) -> None:
     async with _saver(saver_name) as saver:
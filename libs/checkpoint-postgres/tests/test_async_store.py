@@ -278,6 +278,21 @@ async def test_abatch_order(store: AsyncPostgresStore) -> None:
     assert results_reordered[4].key == "key1"
 
 
+async def test_batch_options(store: AsyncPostgresStore) -> None:
+    batched = AsyncPostgresStore(store.conn, max_batch_size=2, max_wait_ms=10)
+    assert batched.max_batch_size == 2
+    assert batched.max_wait_ms == 10
+
+    await asyncio.gather(
+        *(batched.aput(("test",), f"key{i}", {"i": i}) for i in range(5))
+    )
+    results = await asyncio.gather(
+        *(batched.aget(("test",), f"key{i}") for i in range(5))
+    )
+    assert [r.value for r in results] == [{"i": i} for i in range(5)]
+    assert batched.batch_stats()["max_batch"] == 2
+
+
 async def test_batch_get_ops(store: AsyncPostgresStore) -> None:
     # Setup test data
     await store.aput(("test",), "key1", {"data": "value1"})
@@ -2,6 +2,7 @@
 
 import re
 from contextlib import contextmanager
+from datetime import timedelta
 from typing import Any
 from uuid import uuid4
 
@@ -20,6 +21,10 @@ from psycopg.rows import dict_row
 from psycopg_pool import ConnectionPool
 
 from langgraph.checkpoint.postgres import PostgresSaver, ShallowPostgresSaver
+from langgraph.checkpoint.postgres.base import (
+    BLOB_CONTENTS_TOUCH_INTERVAL,
+    MIN_BLOB_CONTENTS_PRUNE_AGE,
+)
 from tests.conftest import DEFAULT_POSTGRES_URI
 
 
@@ -258,6 +263,26 @@ def test_search(saver_name: str, test_data) -> None:
         } == {"", "inner"}
 
 
+@pytest.mark.parametrize("saver_name", ["base", "pool", "pipe", "shallow"])
+def test_list_metadata_only(saver_name: str, test_data) -> None:
+    with _saver(saver_name) as saver:
+        config = test_data["configs"][1]
+        chkpnt: Checkpoint = create_checkpoint(empty_checkpoint(), {}, 1)
+        chkpnt["channel_values"] = {"foo": "bar"}
+        chkpnt["channel_versions"] = {"foo": 1}
+        config = saver.put(config, chkpnt, test_data["metadata"][1], {"foo": 1})
+        saver.put_writes(config, [("foo", "baz")], "task-1")
+
+        thread = {"configurable": {"thread_id": "thread-2"}}
+        full = list(saver.list(thread))
+        light = list(saver.list(thread, metadata_only=True))
+        assert full[0].checkpoint["channel_values"] == {"foo": "bar"}
+        assert [c.config for c in light] == [c.config for c in full]
+        assert [c.metadata for c in light] == [c.metadata for c in full]
+        assert [c.checkpoint["channel_values"] for c in light] == [{}]
+        assert [c.pending_writes for c in light] == [None]
+
+
 @pytest.mark.parametrize("saver_name", ["base", "pool", "pipe", "shallow"])
 def test_null_chars(saver_name: str, test_data) -> None:
     with _saver(saver_name) as saver:
@@ -358,3 +383,106 @@ def test_get_checkpoint_no_channel_values(
 
         checkpoint = saver.get_tuple(config)
         assert checkpoint.checkpoint["channel_values"] == {}
+
+
+@pytest.mark.parametrize("saver_name", ["base", "pool"])
+def test_dedupe_blobs(saver_name: str) -> None:
+    with _saver(saver_name) as saver:
+        saver.dedupe_threshold = 64
+        docs = ["a shared document " * 20]
+
+        def count_contents() -> int:
+            with saver._cursor() as cur:
+                cur.execute("SELECT count(*) AS n FROM checkpoint_blob_contents")
+                return cur.fetchone()["n"]
+
+        configs = []
+        for thread_id in ("thread-1", "thread-2"):
+            checkpoint = empty_checkpoint()
+            checkpoint["channel_values"] = {"docs": docs, "small": ["a"]}
+            checkpoint["channel_versions"] = {"docs": "1", "small": "1"}
+            configs.append(
+                saver.put(
+                    {"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}},
+                    checkpoint,
+                    {},
+                    checkpoint["channel_versions"],
+                )
+            )
+
+        # identical large values are stored once, small ones with their thread
+        assert count_contents() == 1
+        for config in configs:
+            assert saver.get_tuple(config).checkpoint["channel_values"] == {
+                "docs": docs,
+                "small": ["a"],
+            }
+        assert list(saver.list(configs[0]))[0].checkpoint["channel_values"] == {
+            "docs": docs,
+            "small": ["a"],
+        }
+
+        # contents are pruned once no thread references them
+        def prune() -> None:
+            with saver._cursor() as cur:
+                cur.execute(
+                    "UPDATE checkpoint_blob_contents SET used_at = now() - interval '1 hour'"
+                )
+            saver.prune_blob_contents(MIN_BLOB_CONTENTS_PRUNE_AGE)
+
+        saver.delete_thread("thread-1")
+        prune()
+        assert count_contents() == 1
+        assert saver.get_tuple(configs[1]).checkpoint["channel_values"]["docs"] == docs
+        saver.delete_thread("thread-2")
+        prune()
+        assert count_contents() == 0
+
+        # contents written again within the last minute may not be touched
+        with pytest.raises(ValueError, match="older_than"):
+            saver.prune_blob_contents(timedelta(minutes=2))
+
+
+def test_prune_blob_contents_during_put() -> None:
+    with _saver("base") as saver:
+        saver.dedupe_threshold = 64
+        docs = ["a shared document " * 20]
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"docs": docs}
+        checkpoint["channel_versions"] = {"docs": "1"}
+        contents, _ = saver._dedupe_blobs(
+            saver._dump_blobs("thread-2", "", {"docs": docs}, {"docs": "1"})
+        )
+        saver.put(
+            {"configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}},
+            checkpoint,
+            {},
+            checkpoint["channel_versions"],
+        )
+        saver.delete_thread("thread-1")
+
+        with saver._cursor() as cur:
+            # a put finds the unreferenced contents written just under a
+            # touch interval ago, so doesn't touch them
+            cur.execute(
+                "UPDATE checkpoint_blob_contents SET used_at = now() - %s",
+                (BLOB_CONTENTS_TOUCH_INTERVAL - timedelta(seconds=1),),
+            )
+            cur.executemany(saver.UPSERT_CHECKPOINT_BLOB_CONTENTS_SQL, contents)
+            # and is slow to commit the rows referencing them
+            cur.execute(
+                "UPDATE checkpoint_blob_contents SET used_at = used_at - interval '30 seconds'"
+            )
+        # pruning meanwhile keeps them
+        saver.prune_blob_contents(MIN_BLOB_CONTENTS_PRUNE_AGE)
+        with saver._cursor() as cur:
+            cur.execute("SELECT count(*) AS n FROM checkpoint_blob_contents")
+            assert cur.fetchone()["n"] == 1
+
+        config = saver.put(
+            {"configurable": {"thread_id": "thread-2", "checkpoint_ns": ""}},
+            checkpoint,
+            {},
+            checkpoint["channel_versions"],
+        )
+        assert saver.get_tuple(config).checkpoint["channel_values"] == {"docs": docs}
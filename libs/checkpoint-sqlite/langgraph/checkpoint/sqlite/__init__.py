@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import queue
 import random
 import sqlite3
 import threading
@@ -15,13 +16,21 @@ from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
     CheckpointTuple,
+    LazyChannelValues,
     SerializerProtocol,
     get_checkpoint_id,
     get_checkpoint_metadata,
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    blob_queries,
+    blob_versions,
+    dump_blobs,
+    has_inline_blobs,
+    search_where,
+    split_channel_values,
+)
 
 _AIO_ERROR_MSG = (
     "The SqliteSaver does not support async methods. "
@@ -34,6 +43,50 @@ _AIO_ERROR_MSG = (
 )
 
 
+class _ReaderPool:
+    """A pool of read-only connections to a WAL-mode SQLite database file.
+
+    Connections are opened lazily, up to `size`. When all of them are in use,
+    `acquire` returns None instead of blocking, so that callers can fall back to
+    the shared connection.
+    """
+
+    def __init__(self, path: str, size: int) -> None:
+        self.path = path
+        self.size = size
+        self.idle: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self.opened = 0
+        self.closed = False
+        self.lock = threading.Lock()
+
+    def acquire(self) -> sqlite3.Connection | None:
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self.lock:
+            if self.closed or self.opened >= self.size:
+                return None
+            self.opened += 1
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if self.closed:
+            conn.close()
+        else:
+            self.idle.put(conn)
+
+    def close(self) -> None:
+        self.closed = True
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
 class SqliteSaver(BaseCheckpointSaver[str]):
     """A checkpoint saver that stores checkpoints in a SQLite database.
 
@@ -44,9 +97,15 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         For a similar sqlite saver with `async` support,
         consider using [AsyncSqliteSaver][langgraph.checkpoint.sqlite.aio.AsyncSqliteSaver].
 
+    Channel values are stored separately from the checkpoint, one blob per channel
+    and version, and only the channels updated in a step are written. For databases
+    backed by a file, reads go through a pool of separate connections so that
+    `get_tuple` and `list` don't wait behind writers (the database runs in WAL mode).
+
     Args:
         conn (sqlite3.Connection): The SQLite database connection.
         serde (Optional[SerializerProtocol]): The serializer to use for serializing and deserializing checkpoints. Defaults to JsonPlusSerializerCompat.
+        reader_pool_size (int): The maximum number of read-only connections to open for file-backed databases. Set to 0 to read through `conn`. Defaults to 4.
 
     Examples:
 
@@ -79,12 +138,17 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         conn: sqlite3.Connection,
         *,
         serde: SerializerProtocol | None = None,
+        reader_pool_size: int = 4,
     ) -> None:
         super().__init__(serde=serde)
         self.jsonplus_serde = JsonPlusSerializer()
         self.conn = conn
+        # (thread ID, checkpoint NS) of checkpoints loaded with values inline
+        self._legacy_threads: set[tuple[str, str]] = set()
         self.is_setup = False
         self.lock = threading.Lock()
+        self.reader_pool_size = reader_pool_size
+        self.readers: _ReaderPool | None = None
 
     @classmethod
     @contextmanager
@@ -116,7 +180,23 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 check_same_thread=False,
             )
         ) as conn:
-            yield cls(conn)
+            with cls(conn) as saver:
+                yield saver
+
+    def __enter__(self) -> SqliteSaver:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the read-only connections of the reader pool.
+
+        The connection passed to the saver is owned by the caller, and is left
+        open. Use the saver as a context manager to close the pool on exit.
+        """
+        if self.readers is not None:
+            self.readers.close()
 
     def setup(self) -> None:
         """Set up the checkpoint database.
@@ -152,8 +232,23 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 value BLOB,
                 PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
             );
+            CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                channel TEXT NOT NULL,
+                version TEXT NOT NULL,
+                type TEXT NOT NULL,
+                blob BLOB,
+                PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+            );
             """
         )
+        if self.reader_pool_size > 0:
+            # in-memory and temporary databases have no file, and can't be
+            # shared between connections
+            for _, name, path in self.conn.execute("PRAGMA database_list"):
+                if name == "main" and path:
+                    self.readers = _ReaderPool(path, self.reader_pool_size)
 
         self.is_setup = True
 
@@ -180,6 +275,52 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     self.conn.commit()
                 cur.close()
 
+    @contextmanager
+    def _read_cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Get a cursor for reading, from the reader pool when available."""
+        if not self.is_setup:
+            with self.lock:
+                self.setup()
+        conn = self.readers.acquire() if self.readers is not None else None
+        if conn is None:
+            with self.cursor(transaction=False) as cur:
+                yield cur
+            return
+        try:
+            with closing(conn.cursor()) as cur:
+                yield cur
+        finally:
+            self.readers.release(conn)  # type: ignore[union-attr]
+
+    def _load_blobs(
+        self,
+        cur: sqlite3.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint: Checkpoint,
+    ) -> Checkpoint:
+        if has_inline_blobs(checkpoint):
+            self._legacy_threads.add((thread_id, checkpoint_ns))
+        if versions := blob_versions(checkpoint):
+            blobs: dict[str, tuple[str, bytes]] = {}
+            for query, params in blob_queries(
+                "channel, type, blob", thread_id, checkpoint_ns, versions
+            ):
+                cur.execute(query, params)
+                for channel, type_, blob in cur.fetchall():
+                    blobs[channel] = (type_, blob)
+            # blobs are deserialized when the channel is first read
+            checkpoint["channel_values"] = LazyChannelValues(
+                self._load_blob,
+                blobs,
+                checkpoint.get("channel_values"),
+                (self, thread_id, checkpoint_ns),
+            )
+        return checkpoint
+
+    def _load_blob(self, channel: str, blob: tuple[str, bytes]) -> Any:
+        return self.serde.loads_typed(blob)
+
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database.
 
@@ -216,7 +357,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             CheckpointTuple(...)
         """  # noqa
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
-        with self.cursor(transaction=False) as cur:
+        with self._read_cursor() as cur:
             # find the latest checkpoint for the thread_id
             if checkpoint_id := get_checkpoint_id(config):
                 cur.execute(
@@ -250,6 +391,13 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # load channel values stored as blobs
+                loaded = self._load_blobs(
+                    cur,
+                    thread_id,
+                    checkpoint_ns,
+                    self.serde.loads_typed((type, checkpoint)),
+                )
                 # find any pending writes
                 cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -259,10 +407,10 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
+                # deserialize the metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     cast(
                         CheckpointMetadata,
                         self.jsonplus_serde.loads(metadata)
@@ -293,6 +441,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> Iterator[CheckpointTuple]:
         """List checkpoints from the database.
 
@@ -304,6 +453,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             filter: Additional filtering criteria for metadata.
             before: If provided, only checkpoints before the specified checkpoint ID are returned.
             limit: The maximum number of checkpoints to return.
+            metadata_only: Skip loading channel values and pending writes.
 
         Yields:
             An iterator of checkpoint tuples.
@@ -332,7 +482,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         ORDER BY checkpoint_id DESC"""
         if limit:
             query += f" LIMIT {limit}"
-        with self.cursor(transaction=False) as cur, closing(self.conn.cursor()) as wcur:
+        with self._read_cursor() as cur, closing(cur.connection.cursor()) as wcur:
             cur.execute(query, param_values)
             for (
                 thread_id,
@@ -343,10 +493,20 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
-                wcur.execute(
-                    "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
-                    (thread_id, checkpoint_ns, checkpoint_id),
-                )
+                loaded = self.serde.loads_typed((type, checkpoint))
+                if metadata_only:
+                    loaded["channel_values"] = {}
+                    pending_writes = None
+                else:
+                    loaded = self._load_blobs(wcur, thread_id, checkpoint_ns, loaded)
+                    wcur.execute(
+                        "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+                        (thread_id, checkpoint_ns, checkpoint_id),
+                    )
+                    pending_writes = [
+                        (task_id, channel, self.serde.loads_typed((type, value)))
+                        for task_id, channel, type, value in wcur
+                    ]
                 yield CheckpointTuple(
                     {
                         "configurable": {
@@ -355,7 +515,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     cast(
                         CheckpointMetadata,
                         self.jsonplus_serde.loads(metadata)
@@ -373,10 +533,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                         if parent_checkpoint_id
                         else None
                     ),
-                    [
-                        (task_id, channel, self.serde.loads_typed((type, value)))
-                        for task_id, channel, type, value in wcur
-                    ],
+                    pending_writes,
                 )
 
     def put(
@@ -412,11 +569,52 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         """
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        # only the channels updated since the parent checkpoint are written
+        source = (self, str(thread_id), checkpoint_ns)
+        copy, blob_values = split_channel_values(checkpoint, new_versions, source)
+        blobs = dump_blobs(
+            self.serde, str(thread_id), checkpoint_ns, blob_values, new_versions
+        )
+        type_, serialized_checkpoint = self.serde.dumps_typed(copy)
         serialized_metadata = self.jsonplus_serde.dumps(
             get_checkpoint_metadata(config, metadata)
         )
+        legacy = (str(thread_id), checkpoint_ns) in self._legacy_threads
+        values = checkpoint["channel_values"]
+        backfill = legacy or (
+            isinstance(values, LazyChannelValues) and values.source != source
+        )
         with self.cursor() as cur:
+            # write blobs of unchanged channels that were never stored, for
+            # threads resumed from checkpoints saved with values inline, or
+            # checkpoints loaded from another thread or namespace
+            if backfill and (
+                unchanged := [
+                    (k, str(checkpoint["channel_versions"][k]))
+                    for k in blob_values
+                    if k not in new_versions
+                ]
+            ):
+                stored: set[tuple[str, str]] = set()
+                for query, params in blob_queries(
+                    "channel, version", str(thread_id), checkpoint_ns, unchanged
+                ):
+                    cur.execute(query, params)
+                    stored.update(tuple(row) for row in cur.fetchall())
+                blobs.extend(
+                    dump_blobs(
+                        self.serde,
+                        str(thread_id),
+                        checkpoint_ns,
+                        blob_values,
+                        {k: v for k, v in unchanged if (k, v) not in stored},
+                    )
+                )
+            if blobs:
+                cur.executemany(
+                    "INSERT OR REPLACE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob) VALUES (?, ?, ?, ?, ?, ?)",
+                    blobs,
+                )
             cur.execute(
                 "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (
@@ -429,6 +627,8 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                     serialized_metadata,
                 ),
             )
+        if legacy:
+            self._legacy_threads.discard((str(thread_id), checkpoint_ns))
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -477,7 +677,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
             )
 
     def delete_thread(self, thread_id: str) -> None:
-        """Delete all checkpoints and writes associated with a thread ID.
+        """Delete all checkpoints, writes and blobs associated with a thread ID.
 
         Args:
             thread_id: The thread ID to delete.
@@ -494,6 +694,10 @@ class SqliteSaver(BaseCheckpointSaver[str]):
                 "DELETE FROM writes WHERE thread_id = ?",
                 (str(thread_id),),
             )
+            cur.execute(
+                "DELETE FROM checkpoint_blobs WHERE thread_id = ?",
+                (str(thread_id),),
+            )
 
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database asynchronously.
@@ -511,6 +715,7 @@ class SqliteSaver(BaseCheckpointSaver[str]):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> AsyncIterator[CheckpointTuple]:
         """List checkpoints from the database asynchronously.
 
@@ -15,13 +15,21 @@ from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
     CheckpointTuple,
+    LazyChannelValues,
     SerializerProtocol,
     get_checkpoint_id,
     get_checkpoint_metadata,
 )
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 
-from langgraph.checkpoint.sqlite.utils import search_where
+from langgraph.checkpoint.sqlite.utils import (
+    blob_queries,
+    blob_versions,
+    dump_blobs,
+    has_inline_blobs,
+    search_where,
+    split_channel_values,
+)
 
 T = TypeVar("T", bound=Callable)
 
@@ -115,6 +123,8 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         super().__init__(serde=serde)
         self.jsonplus_serde = JsonPlusSerializer()
         self.conn = conn
+        # (thread ID, checkpoint NS) of checkpoints loaded with values inline
+        self._legacy_threads: set[tuple[str, str]] = set()
         self.lock = asyncio.Lock()
         self.loop = asyncio.get_running_loop()
         self.is_setup = False
@@ -172,6 +182,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> Iterator[CheckpointTuple]:
         """List checkpoints from the database asynchronously.
 
@@ -183,6 +194,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             filter: Additional filtering criteria for metadata.
             before: If provided, only checkpoints before the specified checkpoint ID are returned.
             limit: Maximum number of checkpoints to return.
+            metadata_only: Skip loading channel values and pending writes.
 
         Yields:
             An iterator of matching checkpoint tuples.
@@ -199,7 +211,13 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 )
         except RuntimeError:
             pass
-        aiter_ = self.alist(config, filter=filter, before=before, limit=limit)
+        aiter_ = self.alist(
+            config,
+            filter=filter,
+            before=before,
+            limit=limit,
+            metadata_only=metadata_only,
+        )
         while True:
             try:
                 yield asyncio.run_coroutine_threadsafe(
@@ -246,7 +264,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         ).result()
 
     def delete_thread(self, thread_id: str) -> None:
-        """Delete all checkpoints and writes associated with a thread ID.
+        """Delete all checkpoints, writes and blobs associated with a thread ID.
 
         Args:
             thread_id: The thread ID to delete.
@@ -306,12 +324,50 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     value BLOB,
                     PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
                 );
+                CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                    thread_id TEXT NOT NULL,
+                    checkpoint_ns TEXT NOT NULL DEFAULT '',
+                    channel TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    blob BLOB,
+                    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+                );
                 """
             ):
                 await self.conn.commit()
 
             self.is_setup = True
 
+    async def _load_blobs(
+        self,
+        cur: aiosqlite.Cursor,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint: Checkpoint,
+    ) -> Checkpoint:
+        if has_inline_blobs(checkpoint):
+            self._legacy_threads.add((thread_id, checkpoint_ns))
+        if versions := blob_versions(checkpoint):
+            blobs: dict[str, tuple[str, bytes]] = {}
+            for query, params in blob_queries(
+                "channel, type, blob", thread_id, checkpoint_ns, versions
+            ):
+                await cur.execute(query, params)
+                for channel, type_, blob in await cur.fetchall():
+                    blobs[channel] = (type_, blob)
+            # blobs are deserialized when the channel is first read
+            checkpoint["channel_values"] = LazyChannelValues(
+                self._load_blob,
+                blobs,
+                checkpoint.get("channel_values"),
+                (self, thread_id, checkpoint_ns),
+            )
+        return checkpoint
+
+    def _load_blob(self, channel: str, blob: tuple[str, bytes]) -> Any:
+        return self.serde.loads_typed(blob)
+
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the database asynchronously.
 
@@ -362,6 +418,13 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     }
+                # load channel values stored as blobs
+                loaded = await self._load_blobs(
+                    cur,
+                    thread_id,
+                    checkpoint_ns,
+                    self.serde.loads_typed((type, checkpoint)),
+                )
                 # find any pending writes
                 await cur.execute(
                     "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
@@ -371,10 +434,10 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                         str(config["configurable"]["checkpoint_id"]),
                     ),
                 )
-                # deserialize the checkpoint and metadata
+                # deserialize the metadata
                 return CheckpointTuple(
                     config,
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     cast(
                         CheckpointMetadata,
                         self.jsonplus_serde.loads(metadata)
@@ -405,6 +468,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> AsyncIterator[CheckpointTuple]:
         """List checkpoints from the database asynchronously.
 
@@ -416,6 +480,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             filter: Additional filtering criteria for metadata.
             before: If provided, only checkpoints before the specified checkpoint ID are returned.
             limit: Maximum number of checkpoints to return.
+            metadata_only: Skip loading channel values and pending writes.
 
         Yields:
             An asynchronous iterator of matching checkpoint tuples.
@@ -442,10 +507,22 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 checkpoint,
                 metadata,
             ) in cur:
-                await wcur.execute(
-                    "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
-                    (thread_id, checkpoint_ns, checkpoint_id),
-                )
+                loaded = self.serde.loads_typed((type, checkpoint))
+                if metadata_only:
+                    loaded["channel_values"] = {}
+                    pending_writes = None
+                else:
+                    loaded = await self._load_blobs(
+                        wcur, thread_id, checkpoint_ns, loaded
+                    )
+                    await wcur.execute(
+                        "SELECT task_id, channel, type, value FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+                        (thread_id, checkpoint_ns, checkpoint_id),
+                    )
+                    pending_writes = [
+                        (task_id, channel, self.serde.loads_typed((type, value)))
+                        async for task_id, channel, type, value in wcur
+                    ]
                 yield CheckpointTuple(
                     {
                         "configurable": {
@@ -454,7 +531,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                             "checkpoint_id": checkpoint_id,
                         }
                     },
-                    self.serde.loads_typed((type, checkpoint)),
+                    loaded,
                     cast(
                         CheckpointMetadata,
                         self.jsonplus_serde.loads(metadata)
@@ -472,10 +549,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                         if parent_checkpoint_id
                         else None
                     ),
-                    [
-                        (task_id, channel, self.serde.loads_typed((type, value)))
-                        async for task_id, channel, type, value in wcur
-                    ],
+                    pending_writes,
                 )
 
     async def aput(
@@ -502,13 +576,53 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
         await self.setup()
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
-        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        # only the channels updated since the parent checkpoint are written
+        source = (self, str(thread_id), checkpoint_ns)
+        copy, blob_values = split_channel_values(checkpoint, new_versions, source)
+        blobs = dump_blobs(
+            self.serde, str(thread_id), checkpoint_ns, blob_values, new_versions
+        )
+        type_, serialized_checkpoint = self.serde.dumps_typed(copy)
         serialized_metadata = self.jsonplus_serde.dumps(
             get_checkpoint_metadata(config, metadata)
         )
-        async with (
-            self.lock,
-            self.conn.execute(
+        legacy = (str(thread_id), checkpoint_ns) in self._legacy_threads
+        values = checkpoint["channel_values"]
+        backfill = legacy or (
+            isinstance(values, LazyChannelValues) and values.source != source
+        )
+        async with self.lock, self.conn.cursor() as cur:
+            # write blobs of unchanged channels that were never stored, for
+            # threads resumed from checkpoints saved with values inline, or
+            # checkpoints loaded from another thread or namespace
+            if backfill and (
+                unchanged := [
+                    (k, str(checkpoint["channel_versions"][k]))
+                    for k in blob_values
+                    if k not in new_versions
+                ]
+            ):
+                stored: set[tuple[str, str]] = set()
+                for query, params in blob_queries(
+                    "channel, version", str(thread_id), checkpoint_ns, unchanged
+                ):
+                    await cur.execute(query, params)
+                    stored.update(tuple(row) for row in await cur.fetchall())
+                blobs.extend(
+                    dump_blobs(
+                        self.serde,
+                        str(thread_id),
+                        checkpoint_ns,
+                        blob_values,
+                        {k: v for k, v in unchanged if (k, v) not in stored},
+                    )
+                )
+            if blobs:
+                await cur.executemany(
+                    "INSERT OR REPLACE INTO checkpoint_blobs (thread_id, checkpoint_ns, channel, version, type, blob) VALUES (?, ?, ?, ?, ?, ?)",
+                    blobs,
+                )
+            await cur.execute(
                 "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (
                     str(config["configurable"]["thread_id"]),
@@ -519,9 +633,10 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                     serialized_checkpoint,
                     serialized_metadata,
                 ),
-            ),
-        ):
+            )
             await self.conn.commit()
+        if legacy:
+            self._legacy_threads.discard((str(thread_id), checkpoint_ns))
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -572,7 +687,7 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
             await self.conn.commit()
 
     async def adelete_thread(self, thread_id: str) -> None:
-        """Delete all checkpoints and writes associated with a thread ID.
+        """Delete all checkpoints, writes and blobs associated with a thread ID.
 
         Args:
             thread_id: The thread ID to delete.
@@ -589,6 +704,10 @@ class AsyncSqliteSaver(BaseCheckpointSaver[str]):
                 "DELETE FROM writes WHERE thread_id = ?",
                 (str(thread_id),),
             )
+            await cur.execute(
+                "DELETE FROM checkpoint_blobs WHERE thread_id = ?",
+                (str(thread_id),),
+            )
             await self.conn.commit()
 
     def get_next_version(self, current: str | None, channel: None) -> str:
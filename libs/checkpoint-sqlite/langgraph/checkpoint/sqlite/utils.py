@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 import json
-from collections.abc import Sequence
-from typing import Any
+from collections.abc import Iterator, Sequence
+from typing import Any, cast
 
 from langchain_core.runnables import RunnableConfig
-from langgraph.checkpoint.base import get_checkpoint_id
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    LazyChannelValues,
+    SerializerProtocol,
+    get_checkpoint_id,
+)
+
+# Maximum number of (channel, version) pairs bound in a single blob query,
+# keeps us well below SQLITE_MAX_VARIABLE_NUMBER on older SQLite builds.
+BLOB_CHUNK_SIZE = 400
 
 
 def _metadata_predicate(
@@ -93,3 +103,116 @@ def search_where(
         param_values.append(get_checkpoint_id(before))
 
     return ("WHERE " + " AND ".join(wheres) if wheres else "", param_values)
+
+
+def split_channel_values(
+    checkpoint: Checkpoint,
+    new_versions: ChannelVersions,
+    source: Any,
+) -> tuple[Checkpoint, dict[str, Any]]:
+    """Split the channel values of a checkpoint into inline and blob values.
+
+    Primitive values, and values of channels without a version, stay inline in
+    the checkpoint row. All other values are stored in the `checkpoint_blobs`
+    table, keyed by channel and version.
+
+    Values of a `LazyChannelValues` loaded from `source`, the thread and
+    namespace being written to, that were never read are still serialized, and
+    so already stored as blobs, and are left out unless their channel has a new
+    version.
+
+    Returns a tuple of the checkpoint to store in the checkpoint row and a dict
+    of the values to store as blobs.
+    """
+    copy = checkpoint.copy()
+    copy["channel_values"] = inline = {}
+    blob_values = {}
+    versions = checkpoint["channel_versions"]
+    values = checkpoint["channel_values"]
+    lazy = (
+        values
+        if isinstance(values, LazyChannelValues) and values.source == source
+        else None
+    )
+    for k in values:
+        if lazy is not None and not lazy.is_loaded(k) and k not in new_versions:
+            continue
+        v = values[k]
+        if v is None or isinstance(v, (str, int, float, bool)) or k not in versions:
+            inline[k] = v
+        else:
+            blob_values[k] = v
+    return copy, blob_values
+
+
+def blob_queries(
+    columns: str,
+    thread_id: str,
+    checkpoint_ns: str,
+    versions: Sequence[tuple[str, str]],
+) -> Iterator[tuple[str, list[Any]]]:
+    """Return (query, params) pairs selecting the given (channel, version) blobs.
+
+    The pairs are split into chunks of at most `BLOB_CHUNK_SIZE` so that wide
+    checkpoints don't exceed the bound parameter limit.
+    """
+    for i in range(0, len(versions), BLOB_CHUNK_SIZE):
+        chunk = versions[i : i + BLOB_CHUNK_SIZE]
+        params: list[Any] = [thread_id, checkpoint_ns]
+        for channel, version in chunk:
+            params.append(channel)
+            params.append(version)
+        yield (
+            f"SELECT {columns} FROM checkpoint_blobs WHERE thread_id = ? AND checkpoint_ns = ? AND (channel, version) IN (VALUES {', '.join(['(?, ?)'] * len(chunk))})",
+            params,
+        )
+
+
+def has_inline_blobs(checkpoint: Checkpoint) -> bool:
+    """Whether a checkpoint row holds values that belong in `checkpoint_blobs`.
+
+    This is the case for checkpoints saved before channel values were split out
+    of checkpoints, whose unchanged channels need to be written as blobs when
+    the next checkpoint of the thread is saved.
+    """
+    values = checkpoint.get("channel_values") or {}
+    versions = checkpoint["channel_versions"]
+    return any(
+        k in versions and not (v is None or isinstance(v, (str, int, float, bool)))
+        for k, v in values.items()
+    )
+
+
+def blob_versions(checkpoint: Checkpoint) -> list[tuple[str, str]]:
+    """Return the (channel, version) pairs of a checkpoint to look up in blobs.
+
+    Channels with an inline value (including all channels of checkpoints saved
+    before blobs were split out) are skipped.
+    """
+    values = checkpoint.get("channel_values") or {}
+    return [
+        (k, str(v))
+        for k, v in checkpoint["channel_versions"].items()
+        if k not in values
+    ]
+
+
+def dump_blobs(
+    serde: SerializerProtocol,
+    thread_id: str,
+    checkpoint_ns: str,
+    values: dict[str, Any],
+    versions: ChannelVersions,
+) -> list[tuple[str, str, str, str, str, bytes | memoryview | None]]:
+    """Serialize channel values into `checkpoint_blobs` rows."""
+    return [
+        (
+            thread_id,
+            checkpoint_ns,
+            k,
+            str(cast(str, ver)),
+            *serde.dumps_typed(values[k]),
+        )
+        for k, ver in versions.items()
+        if k in values
+    ]
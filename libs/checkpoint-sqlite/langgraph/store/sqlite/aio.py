@@ -94,6 +94,8 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
         | None = None,
         index: SqliteIndexConfig | None = None,
         ttl: TTLConfig | None = None,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
     ):
         """Initialize the async SQLite store.
 
@@ -102,8 +104,12 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
             deserializer: Optional custom deserializer function for values.
             index: Optional vector search configuration.
             ttl: Optional time-to-live configuration.
+            max_batch_size: Optional maximum number of operations sent to the
+                database at once.
+            max_wait_ms: Optional time to hold a batch open for later
+                operations, in milliseconds.
         """
-        super().__init__()
+        super().__init__(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
         self._deserializer = deserializer
         self.conn = conn
         self.lock = asyncio.Lock()
@@ -126,6 +132,8 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
         *,
         index: SqliteIndexConfig | None = None,
         ttl: TTLConfig | None = None,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
     ) -> AsyncIterator[AsyncSqliteStore]:
         """Create a new AsyncSqliteStore instance from a connection string.
 
@@ -133,12 +141,22 @@ class AsyncSqliteStore(AsyncBatchedBaseStore, BaseSqliteStore):
             conn_string: The SQLite connection string.
             index: Optional vector search configuration.
             ttl: Optional time-to-live configuration.
+            max_batch_size: Optional maximum number of operations sent to the
+                database at once.
+            max_wait_ms: Optional time to hold a batch open for later
+                operations, in milliseconds.
 
         Returns:
             An AsyncSqliteStore instance wrapped in an async context manager.
         """
         async with aiosqlite.connect(conn_string, isolation_level=None) as conn:
-            yield cls(conn, index=index, ttl=ttl)
+            yield cls(
+                conn,
+                index=index,
+                ttl=ttl,
+                max_batch_size=max_batch_size,
+                max_wait_ms=max_wait_ms,
+            )
 
     async def setup(self) -> None:
         """Set up the store database.
@@ -73,6 +73,34 @@ class TestAsyncSqliteSaver:
                 "run_id": "my_run_id",
             }
 
+    async def test_channel_blobs(self) -> None:
+        async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            chkpnt_1 = empty_checkpoint()
+            chkpnt_1["channel_values"] = {"messages": ["a"], "count": 1}
+            chkpnt_1["channel_versions"] = {"messages": "1", "count": "1"}
+            config = await saver.aput(
+                config, chkpnt_1, {}, {"messages": "1", "count": "1"}
+            )
+            chkpnt_2 = create_checkpoint(chkpnt_1, None, 1)
+            chkpnt_2["channel_values"] = {"messages": ["a"], "count": 2}
+            chkpnt_2["channel_versions"] = {"messages": "1", "count": "2"}
+            config = await saver.aput(config, chkpnt_2, {}, {"count": "2"})
+
+            async with saver.conn.execute(
+                "SELECT channel, version FROM checkpoint_blobs"
+            ) as cur:
+                assert await cur.fetchall() == [("messages", "1")]
+            tuple_2 = await saver.aget_tuple(config)
+            assert tuple_2 is not None
+            assert tuple_2.checkpoint["channel_values"] == chkpnt_2["channel_values"]
+            assert [
+                t.checkpoint["channel_values"]
+                async for t in saver.alist({"configurable": {"thread_id": "thread-1"}})
+            ] == [chkpnt_2["channel_values"], chkpnt_1["channel_values"]]
+
     async def test_asearch(self) -> None:
         async with AsyncSqliteSaver.from_conn_string(":memory:") as saver:
             await saver.aput(self.config_1, self.chkpnt_1, self.metadata_1, {})
@@ -151,6 +151,25 @@ async def test_large_batches_async(store: AsyncSqliteStore) -> None:
     assert len(results) == M * N * 6
 
 
+async def test_batch_options(conn_string: str) -> None:
+    """Test that batching options are passed through to the batched base store."""
+    async with AsyncSqliteStore.from_conn_string(
+        conn_string, max_batch_size=2, max_wait_ms=10
+    ) as store:
+        await store.setup()
+        assert store.max_batch_size == 2
+        assert store.max_wait_ms == 10
+
+        await asyncio.gather(
+            *(store.aput(("test",), f"key{i}", {"i": i}) for i in range(5))
+        )
+        results = await asyncio.gather(
+            *(store.aget(("test",), f"key{i}") for i in range(5))
+        )
+        assert [r.value for r in results] == [{"i": i} for i in range(5)]
+        assert store.batch_stats()["max_batch"] == 2
+
+
 async def test_abatch_order(store: AsyncSqliteStore) -> None:
     """Test ordering of batch operations in async context."""
     # Setup test data
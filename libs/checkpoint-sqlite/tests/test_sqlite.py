@@ -1,3 +1,5 @@
+import sqlite3
+from pathlib import Path
 from typing import Any, cast
 
 import pytest
@@ -5,6 +7,7 @@ from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
+    LazyChannelValues,
     create_checkpoint,
     empty_checkpoint,
 )
@@ -128,6 +131,182 @@ class TestSqliteSaver:
             assert len(search_results_7) == 1
             assert search_results_7[0].config["configurable"]["thread_id"] == "thread-2"
 
+    def test_channel_blobs(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            chkpnt_1 = empty_checkpoint()
+            chkpnt_1["channel_values"] = {"messages": ["a"], "count": 1}
+            chkpnt_1["channel_versions"] = {"messages": "1", "count": "1"}
+            config = saver.put(config, chkpnt_1, {}, {"messages": "1", "count": "1"})
+            chkpnt_2 = create_checkpoint(chkpnt_1, None, 1)
+            chkpnt_2["channel_values"] = {
+                "messages": ["a"],
+                "count": 2,
+                "items": {"b": 1},
+            }
+            chkpnt_2["channel_versions"] = {
+                "messages": "1",
+                "count": "2",
+                "items": "2",
+            }
+            config = saver.put(config, chkpnt_2, {}, {"count": "2", "items": "2"})
+
+            # primitive values are kept inline, others are written once per version
+            assert saver.conn.execute(
+                "SELECT channel, version FROM checkpoint_blobs ORDER BY channel"
+            ).fetchall() == [("items", "2"), ("messages", "1")]
+
+            tuple_2 = saver.get_tuple(config)
+            assert tuple_2 is not None
+            assert tuple_2.checkpoint["channel_values"] == chkpnt_2["channel_values"]
+            assert [
+                t.checkpoint["channel_values"]
+                for t in saver.list({"configurable": {"thread_id": "thread-1"}})
+            ] == [chkpnt_2["channel_values"], chkpnt_1["channel_values"]]
+
+            saver.delete_thread("thread-1")
+            (count,) = saver.conn.execute(
+                "SELECT COUNT(*) FROM checkpoint_blobs"
+            ).fetchone()
+            assert count == 0
+
+    def test_channel_blobs_backfill(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            # a checkpoint saved with all channel values inline
+            chkpnt_1 = empty_checkpoint()
+            chkpnt_1["channel_values"] = {"messages": ["a"]}
+            chkpnt_1["channel_versions"] = {"messages": "1"}
+            saver.setup()
+            saver.conn.execute(
+                "INSERT INTO checkpoints (thread_id, checkpoint_ns, checkpoint_id, type, checkpoint, metadata) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    "thread-1",
+                    "",
+                    chkpnt_1["id"],
+                    *saver.serde.dumps_typed(chkpnt_1),
+                    saver.jsonplus_serde.dumps({}),
+                ),
+            )
+            tuple_1 = saver.get_tuple(config)
+            assert tuple_1 is not None
+            assert tuple_1.checkpoint["channel_values"] == {"messages": ["a"]}
+
+            assert saver._legacy_threads == {("thread-1", "")}
+
+            # the unchanged channel is written when the next checkpoint is saved
+            chkpnt_2 = create_checkpoint(chkpnt_1, None, 1)
+            chkpnt_2["channel_versions"]["other"] = "2"
+            chkpnt_2["channel_values"]["other"] = ["b"]
+            config = saver.put(tuple_1.config, chkpnt_2, {}, {"other": "2"})
+            assert not saver._legacy_threads
+            tuple_2 = saver.get_tuple(config)
+            assert tuple_2 is not None
+            assert tuple_2.checkpoint["channel_values"] == {
+                "messages": ["a"],
+                "other": ["b"],
+            }
+
+    def test_lazy_channel_values(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config: RunnableConfig = {
+                "configurable": {"thread_id": "thread-1", "checkpoint_ns": ""}
+            }
+            chkpnt_1 = empty_checkpoint()
+            chkpnt_1["channel_values"] = {"messages": ["a"], "count": 1}
+            chkpnt_1["channel_versions"] = {"messages": "1", "count": "1"}
+            config = saver.put(config, chkpnt_1, {}, {"messages": "1", "count": "1"})
+
+            tuple_1 = saver.get_tuple(config)
+            assert tuple_1 is not None
+            values = tuple_1.checkpoint["channel_values"]
+            assert isinstance(values, LazyChannelValues)
+            assert values.is_loaded("count")
+            assert not values.is_loaded("messages")
+
+            # unread values are not deserialized to save the next checkpoint
+            chkpnt_2 = create_checkpoint(tuple_1.checkpoint, None, 1)
+            chkpnt_2["channel_values"]["count"] = 2
+            chkpnt_2["channel_versions"]["count"] = "2"
+            config = saver.put(tuple_1.config, chkpnt_2, {}, {"count": "2"})
+            assert not values.is_loaded("messages")
+
+            tuple_2 = saver.get_tuple(config)
+            assert tuple_2 is not None
+            assert tuple_2.checkpoint["channel_values"] == {
+                "messages": ["a"],
+                "count": 2,
+            }
+
+            # unread values are stored when saved to another thread
+            chkpnt_3 = create_checkpoint(tuple_2.checkpoint, None, 2)
+            chkpnt_3["channel_values"]["count"] = 3
+            chkpnt_3["channel_versions"]["count"] = "3"
+            config = saver.put(
+                {"configurable": {"thread_id": "thread-2", "checkpoint_ns": ""}},
+                chkpnt_3,
+                {},
+                {"count": "3"},
+            )
+            tuple_3 = saver.get_tuple(config)
+            assert tuple_3 is not None
+            assert tuple_3.checkpoint["channel_values"] == {
+                "messages": ["a"],
+                "count": 3,
+            }
+
+    def test_list_metadata_only(self) -> None:
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            config = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            saver.put_writes(config, [("foo", "bar")], "task")
+            saver.put(self.config_2, self.chkpnt_2, self.metadata_2, {})
+
+            full = list(saver.list({"configurable": {"thread_id": "thread-1"}}))
+            projected = list(
+                saver.list(
+                    {"configurable": {"thread_id": "thread-1"}}, metadata_only=True
+                )
+            )
+            assert [t.config for t in projected] == [t.config for t in full]
+            assert [t.metadata for t in projected] == [t.metadata for t in full]
+            assert all(t.checkpoint["channel_values"] == {} for t in projected)
+            assert all(t.pending_writes is None for t in projected)
+            assert full[0].pending_writes == [("task", "foo", "bar")]
+
+    def test_reader_pool(self, tmp_path: Path) -> None:
+        with SqliteSaver.from_conn_string(str(tmp_path / "db.sqlite")) as saver:
+            config = saver.put(self.config_1, self.chkpnt_1, self.metadata_1, {})
+            assert saver.readers is not None
+            # reads don't need the write lock
+            with saver.lock:
+                assert saver.get_tuple(config) is not None
+                assert len(list(saver.list(None))) == 1
+            # nested reads beyond the pool size fall back to the shared connection
+            saver.readers.size = 1
+            for _ in saver.list(None):
+                assert len(list(saver.list(None))) == 1
+            with pytest.raises(sqlite3.OperationalError):
+                with saver._read_cursor() as cur:
+                    cur.execute("DELETE FROM checkpoints")
+
+        with SqliteSaver.from_conn_string(":memory:") as saver:
+            saver.setup()
+            assert saver.readers is None
+
+        # savers created directly close the pool on exit
+        conn = sqlite3.connect(str(tmp_path / "db.sqlite"), check_same_thread=False)
+        with SqliteSaver(conn) as saver:
+            assert saver.get_tuple(config) is not None
+            readers = saver.readers
+            assert readers is not None and readers.opened == 1
+        assert readers.closed
+        assert readers.idle.empty()
+        conn.close()
+
     def test_search_where(self) -> None:
         # call method / assertions
         expected_predicate_1 = "WHERE json_extract(CAST(metadata AS TEXT), '$.source') = ? AND json_extract(CAST(metadata AS TEXT), '$.step') = ? AND json_extract(CAST(metadata AS TEXT), '$.writes') = ? AND json_extract(CAST(metadata AS TEXT), '$.score') = ? AND checkpoint_id < ?"
@@ -1,17 +1,131 @@
 from __future__ import annotations
 
 import datetime
+import heapq
 import threading
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Literal, TypedDict
 
 from langgraph.cache.base import BaseCache, FullKey, Namespace, ValueT
 from langgraph.checkpoint.serde.base import SerializerProtocol
 
 
+class CacheStats(TypedDict):
+    """Counters and current size of an in-memory cache."""
+
+    hits: int
+    """Number of keys found in the cache by `get`."""
+    misses: int
+    """Number of keys not found in the cache (or expired) by `get`."""
+    evictions: int
+    """Number of entries evicted to stay within `max_entries` or `max_bytes`."""
+    expirations: int
+    """Number of entries removed after their TTL elapsed."""
+    entries: int
+    """Number of entries currently in the cache."""
+    bytes: int
+    """Total size of the serialized values currently in the cache."""
+
+
+class _LRU:
+    """Tracks key usage, the victim is the least recently used key."""
+
+    def __init__(self) -> None:
+        self.order: dict[FullKey, None] = {}
+
+    def add(self, key: FullKey) -> None:
+        self.order.pop(key, None)
+        self.order[key] = None
+
+    touch = add
+
+    def remove(self, key: FullKey) -> None:
+        del self.order[key]
+
+    def victims(self) -> Iterator[FullKey]:
+        return iter(self.order)
+
+    def clear(self) -> None:
+        self.order.clear()
+
+
+class _LFU:
+    """Tracks key usage, the victim is the least frequently used key.
+
+    Keys are grouped in buckets by use count, ties are broken by recency.
+    """
+
+    def __init__(self) -> None:
+        self.counts: dict[FullKey, int] = {}
+        self.buckets: dict[int, dict[FullKey, None]] = {}
+
+    def add(self, key: FullKey) -> None:
+        if key in self.counts:
+            self.touch(key)
+        else:
+            self.counts[key] = 1
+            self.buckets.setdefault(1, {})[key] = None
+
+    def touch(self, key: FullKey) -> None:
+        count = self.counts[key]
+        self._unlink(key, count)
+        self.counts[key] = count + 1
+        self.buckets.setdefault(count + 1, {})[key] = None
+
+    def remove(self, key: FullKey) -> None:
+        self._unlink(key, self.counts.pop(key))
+
+    def victims(self) -> Iterator[FullKey]:
+        for count in sorted(self.buckets):
+            yield from self.buckets[count]
+
+    def clear(self) -> None:
+        self.counts.clear()
+        self.buckets.clear()
+
+    def _unlink(self, key: FullKey, count: int) -> None:
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+
+
 class InMemoryCache(BaseCache[ValueT]):
-    def __init__(self, *, serde: SerializerProtocol | None = None):
+    """In-memory cache, optionally bounded in number of entries and size.
+
+    Expired entries are swept on every operation, in order of expiry.
+
+    Args:
+        serde: Serializer to use for values.
+        max_entries: Maximum number of entries to keep. Defaults to no limit.
+        max_bytes: Maximum total size of the serialized values to keep.
+            Values larger than this are not cached. Defaults to no limit.
+        eviction: Which entries to evict when a limit is reached, "lru" for the
+            least recently used, "lfu" for the least frequently used.
+    """
+
+    def __init__(
+        self,
+        *,
+        serde: SerializerProtocol | None = None,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        eviction: Literal["lru", "lfu"] = "lru",
+    ):
         super().__init__(serde=serde)
+        if eviction not in ("lru", "lfu"):
+            raise ValueError(f"Invalid eviction policy: {eviction}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
         self._cache: dict[Namespace, dict[str, tuple[str, bytes, float | None]]] = {}
+        self._usage = _LRU() if eviction == "lru" else _LFU()
+        self._expiry: list[tuple[float, Namespace, str]] = []
+        self._size = 0
+        self._len = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
         self._lock = threading.RLock()
 
     def get(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
@@ -19,16 +133,17 @@ class InMemoryCache(BaseCache[ValueT]):
         with self._lock:
             if not keys:
                 return {}
-            now = datetime.datetime.now(datetime.timezone.utc).timestamp()
+            self._sweep(datetime.datetime.now(datetime.timezone.utc).timestamp())
             values: dict[FullKey, ValueT] = {}
             for ns_tuple, key in keys:
                 ns = Namespace(ns_tuple)
                 if ns in self._cache and key in self._cache[ns]:
-                    enc, val, expiry = self._cache[ns][key]
-                    if expiry is None or now < expiry:
-                        values[(ns, key)] = self.serde.loads_typed((enc, val))
-                    else:
-                        del self._cache[ns][key]
+                    enc, val, _ = self._cache[ns][key]
+                    values[(ns, key)] = self.serde.loads_typed((enc, val))
+                    self._usage.touch((ns, key))
+                    self._hits += 1
+                else:
+                    self._misses += 1
             return values
 
     async def aget(self, keys: Sequence[FullKey]) -> dict[FullKey, ValueT]:
@@ -39,18 +154,40 @@ class InMemoryCache(BaseCache[ValueT]):
         """Set the cached values for the given keys."""
         with self._lock:
             now = datetime.datetime.now(datetime.timezone.utc)
+            self._sweep(now.timestamp())
             for (ns, key), (value, ttl) in keys.items():
                 if ttl is not None:
                     delta = datetime.timedelta(seconds=ttl)
                     expiry: float | None = (now + delta).timestamp()
                 else:
                     expiry = None
+                enc, data = self.serde.dumps_typed(value)
+                # a zero-copy view would change with the cached value
+                val = bytes(data)
+                if self.max_bytes is not None and len(val) > self.max_bytes:
+                    self._delete(ns, key)
+                    continue
                 if ns not in self._cache:
                     self._cache[ns] = {}
-                self._cache[ns][key] = (
-                    *self.serde.dumps_typed(value),
-                    expiry,
-                )
+                if key in self._cache[ns]:
+                    self._size -= len(self._cache[ns][key][1])
+                else:
+                    self._len += 1
+                self._cache[ns][key] = (enc, val, expiry)
+                self._size += len(val)
+                self._usage.add((ns, key))
+                if expiry is not None:
+                    heapq.heappush(self._expiry, (expiry, ns, key))
+                self._evict(keep=(ns, key))
+            # drop heap entries of keys that were overwritten or deleted
+            if len(self._expiry) > 2 * self._len + 64:
+                self._expiry = [
+                    (expiry, ns, key)
+                    for ns, entries in self._cache.items()
+                    for key, (_, _, expiry) in entries.items()
+                    if expiry is not None
+                ]
+                heapq.heapify(self._expiry)
 
     async def aset(self, keys: Mapping[FullKey, tuple[ValueT, int | None]]) -> None:
         """Asynchronously set the cached values for the given keys."""
@@ -62,12 +199,62 @@ class InMemoryCache(BaseCache[ValueT]):
         with self._lock:
             if namespaces is None:
                 self._cache.clear()
+                self._usage.clear()
+                self._expiry.clear()
+                self._size = 0
+                self._len = 0
             else:
                 for ns in namespaces:
                     if ns in self._cache:
-                        del self._cache[ns]
+                        for key in list(self._cache[ns]):
+                            self._delete(ns, key)
 
     async def aclear(self, namespaces: Sequence[Namespace] | None = None) -> None:
         """Asynchronously delete the cached values for the given namespaces.
         If no namespaces are provided, clear all cached values."""
         self.clear(namespaces)
+
+    def stats(self) -> CacheStats:
+        """Get the hit, miss, eviction and expiration counters of the cache."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                entries=self._len,
+                bytes=self._size,
+            )
+
+    def _evict(self, keep: FullKey) -> None:
+        """Evict entries other than `keep` until the cache is within its limits."""
+        while (self.max_entries is not None and self._len > self.max_entries) or (
+            self.max_bytes is not None and self._size > self.max_bytes
+        ):
+            for victim in self._usage.victims():
+                if victim != keep:
+                    break
+            else:
+                return
+            self._delete(*victim)
+            self._evictions += 1
+
+    def _sweep(self, now: float) -> None:
+        """Delete all entries that expired before `now`."""
+        while self._expiry and self._expiry[0][0] <= now:
+            expiry, ns, key = heapq.heappop(self._expiry)
+            # skip heap entries for keys that were since overwritten or deleted
+            entries = self._cache.get(ns)
+            if entries is not None and key in entries and entries[key][2] == expiry:
+                self._delete(ns, key)
+                self._expirations += 1
+
+    def _delete(self, ns: Namespace, key: str) -> None:
+        entries = self._cache.get(ns)
+        if entries is None or key not in entries:
+            return
+        self._size -= len(entries.pop(key)[1])
+        self._len -= 1
+        self._usage.remove((ns, key))
+        if not entries:
+            del self._cache[ns]
@@ -16,6 +16,7 @@ from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base.id import uuid6
 from langgraph.checkpoint.serde.base import SerializerProtocol, maybe_add_typed_methods
 from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.serde.lazy import LazyChannelValues as LazyChannelValues
 from langgraph.checkpoint.serde.types import (
     ERROR,
     INTERRUPT,
@@ -70,6 +71,8 @@ class Checkpoint(TypedDict):
     channel_values: dict[str, Any]
     """The values of the channels at the time of the checkpoint.
     Mapping from channel name to deserialized channel snapshot value.
+    Checkpointers may return a `LazyChannelValues` that deserializes each
+    value on first access.
     """
     channel_versions: ChannelVersions
     """The versions of the channels at the time of the checkpoint.
@@ -174,6 +177,7 @@ class BaseCheckpointSaver(Generic[V]):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> Iterator[CheckpointTuple]:
         """List checkpoints that match the given criteria.
 
@@ -182,6 +186,9 @@ class BaseCheckpointSaver(Generic[V]):
             filter: Additional filtering criteria.
             before: List checkpoints created before this configuration.
             limit: Maximum number of checkpoints to return.
+            metadata_only: Skip loading channel values and pending writes. The
+                checkpoints returned have empty `channel_values` and no
+                `pending_writes`.
 
         Returns:
             Iterator of matching checkpoint tuples.
@@ -278,6 +285,7 @@ class BaseCheckpointSaver(Generic[V]):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> AsyncIterator[CheckpointTuple]:
         """Asynchronously list checkpoints that match the given criteria.
 
@@ -286,6 +294,9 @@ class BaseCheckpointSaver(Generic[V]):
             filter: Additional filtering criteria for metadata.
             before: List checkpoints created before this configuration.
             limit: Maximum number of checkpoints to return.
+            metadata_only: Skip loading channel values and pending writes. The
+                checkpoints returned have empty `channel_values` and no
+                `pending_writes`.
 
         Returns:
             Async iterator of matching checkpoint tuples.
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import logging
+import operator
 import os
 import pickle
 import random
 import shutil
+import struct
+import threading
+import zlib
+from bisect import bisect_left, insort
 from collections import defaultdict
-from collections.abc import AsyncIterator, Iterator, Sequence
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from contextlib import AbstractAsyncContextManager, AbstractContextManager, ExitStack
+from functools import partial
 from types import TracebackType
 from typing import Any
 
@@ -20,6 +32,7 @@ from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
     CheckpointTuple,
+    LazyChannelValues,
     SerializerProtocol,
     get_checkpoint_id,
     get_checkpoint_metadata,
@@ -27,6 +40,43 @@ from langgraph.checkpoint.base import (
 
 logger = logging.getLogger(__name__)
 
+DELTA_SUFFIX = "+delta"
+
+
+class _ThreadIndex:
+    """Keys of a mapping keyed by tuples starting with a thread ID, by thread ID."""
+
+    def __init__(self) -> None:
+        self.keys: dict[str, set[tuple]] = {}
+        self.size = 0
+
+    def add(self, key: tuple) -> None:
+        keys = self.keys.setdefault(key[0], set())
+        if key not in keys:
+            keys.add(key)
+            self.size += 1
+
+    def pop(self, thread_id: str, data: Mapping[tuple, Any]) -> set[tuple]:
+        self.sync(data)
+        keys = self.keys.get(thread_id, set())
+        if any(key not in data for key in keys):
+            # a key was replaced directly, without changing the size
+            self.rebuild(data)
+        keys = self.keys.pop(thread_id, set())
+        self.size -= len(keys)
+        return keys
+
+    def sync(self, data: Mapping[tuple, Any]) -> None:
+        # rebuild if the mapping was modified directly, e.g. loaded from disk
+        if self.size != len(data):
+            self.rebuild(data)
+
+    def rebuild(self, data: Mapping[tuple, Any]) -> None:
+        self.keys = {}
+        self.size = 0
+        for key in data:
+            self.add(key)
+
 
 class InMemorySaver(
     BaseCheckpointSaver[str], AbstractContextManager, AbstractAsyncContextManager
@@ -43,6 +93,28 @@ class InMemorySaver(
 
     Args:
         serde: The serializer to use for serializing and deserializing checkpoints. Defaults to None.
+        delta_chain_length: Enables append-delta encoding of list channel values.
+            When a new version of a channel is a list that extends the previously
+            stored version (e.g. produced by an `operator.add` or `add_messages`
+            reducer), only the appended items are stored, together with a
+            reference to the base version. After this many consecutive deltas the
+            full value is stored again, bounding the cost of rebuilding a value.
+            Items are compared to the stored version by identity, so items of
+            a saved list must be replaced rather than modified in place, as
+            reducers do. Defaults to None, which always stores full values.
+        path: File to persist checkpoints to. Changes are appended to this file
+            as they're made, and periodically compacted into a snapshot stored
+            next to it, with the `.snapshot` suffix. Checkpoints saved to the
+            file are loaded back when the saver is created. Close the saver,
+            or use it as a context manager, to make sure all changes are
+            flushed to disk. Defaults to None, which keeps checkpoints in
+            memory only.
+        dedupe_blobs: Stores identical channel values once across threads.
+            Serialized values are looked up by content, and every thread and
+            version storing the same value shares a single copy, which is
+            released once no thread references it anymore. Useful when many
+            threads share large values, such as the same system prompt or
+            documents. Defaults to False.
 
     Examples:
 
@@ -78,25 +150,71 @@ class InMemorySaver(
         ],  # thread id, checkpoint ns, channel, version
         tuple[str, bytes],
     ]
+    # (thread ID, checkpoint NS, channel) -> (version, chain length, items) of
+    # the most recent list value stored or loaded, used as base for deltas
+    delta_heads: dict[
+        tuple[str, str, str], tuple[str | int | float, int, tuple[Any, ...]]
+    ]
+    # serialized value -> (shared copy, number of blobs referencing it)
+    blob_contents: dict[tuple[str, bytes], list]
 
     def __init__(
         self,
         *,
         serde: SerializerProtocol | None = None,
         factory: type[defaultdict] = defaultdict,
+        delta_chain_length: int | None = None,
+        path: str | None = None,
+        dedupe_blobs: bool = False,
     ) -> None:
         super().__init__(serde=serde)
+        if path is not None and factory is not defaultdict:
+            raise ValueError("Cannot use both `path` and `factory`")
         self.storage = factory(lambda: defaultdict(dict))
         self.writes = factory(dict)
         self.blobs = factory()
+        self.delta_chain_length = delta_chain_length
+        self.delta_heads = {}
+        self.dedupe_blobs = dedupe_blobs
+        self.blob_contents = {}
+        self._writes_index = _ThreadIndex()
+        self._blobs_index = _ThreadIndex()
+        # thread ID -> checkpoint NS -> checkpoint IDs in ascending order
+        self._checkpoint_ids: dict[str, dict[str, list[str]]] = {}
         self.stack = ExitStack()
         if factory is not defaultdict:
             self.stack.enter_context(self.storage)  # type: ignore[arg-type]
             self.stack.enter_context(self.writes)  # type: ignore[arg-type]
             self.stack.enter_context(self.blobs)  # type: ignore[arg-type]
+        self._log: _CheckpointLog | None = None
+        # held while changing the saver, so the indexes, and the snapshots
+        # taken when compacting the log, see every change together with its
+        # log record
+        self._lock: AbstractContextManager = threading.RLock()
+        if path is not None:
+            self._log = _CheckpointLog(path)
+            self._lock = self._log.lock
+            snapshot, records = self._log.load()
+            if snapshot is not None:
+                for thread_id, namespaces in snapshot["storage"].items():
+                    for checkpoint_ns, checkpoints in namespaces.items():
+                        self.storage[thread_id][checkpoint_ns].update(checkpoints)
+                for outer_key, outer_writes in snapshot["writes"].items():
+                    self.writes[outer_key].update(outer_writes)
+                self.blobs.update(snapshot["blobs"])
+            for record in records:
+                self._replay(record)
+            self._writes_index.rebuild(self.writes)
+            self._blobs_index.rebuild(self.blobs)
+            self.stack.callback(self._log.close)
+        if dedupe_blobs:
+            # share blobs loaded from disk
+            for key, blob in self.blobs.items():
+                self.blobs[key] = self._intern_blob(blob)
 
     def __enter__(self) -> InMemorySaver:
-        return self.stack.__enter__()
+        self.stack.__enter__()
+        return self
 
     def __exit__(
         self,
@@ -107,7 +225,8 @@ class InMemorySaver(
         return self.stack.__exit__(exc_type, exc_value, traceback)
 
     async def __aenter__(self) -> InMemorySaver:
-        return self.stack.__enter__()
+        self.stack.__enter__()
+        return self
 
     async def __aexit__(
         self,
@@ -117,17 +236,183 @@ class InMemorySaver(
     ) -> bool | None:
         return self.stack.__exit__(__exc_type, __exc_value, __traceback)
 
+    def _append(self, record: tuple) -> None:
+        assert self._log is not None
+        if self._log.append(record):
+            self._log.compact(self._snapshot)
+
+    def _snapshot(self) -> dict:
+        return {
+            "storage": {
+                thread_id: {
+                    checkpoint_ns: dict(checkpoints)
+                    for checkpoint_ns, checkpoints in namespaces.items()
+                }
+                for thread_id, namespaces in self.storage.items()
+            },
+            "writes": {k: dict(v) for k, v in self.writes.items()},
+            "blobs": dict(self.blobs),
+        }
+
+    def _replay(self, record: tuple) -> None:
+        if record[0] == "put":
+            _, thread_id, checkpoint_ns, checkpoint_id, saved, blobs = record
+            self.blobs.update(blobs)
+            for key, _ in blobs:
+                self._blobs_index.add(key)
+            self._store_checkpoint(thread_id, checkpoint_ns, checkpoint_id, saved)
+        elif record[0] == "writes":
+            _, outer_key, outer_writes = record
+            self.writes[outer_key].update(outer_writes)
+            self._writes_index.add(outer_key)
+        elif record[0] == "delete":
+            self._delete_thread(record[1])
+
+    def _intern_blob(self, blob: tuple[str, bytes]) -> tuple[str, bytes]:
+        """Get the shared copy of a serialized value, and reference it."""
+        if type(blob[1]) is not bytes:
+            # e.g. a memoryview of a numpy array, which may be writable, and so
+            # unhashable, or modified after being saved
+            blob = (blob[0], bytes(blob[1]))
+        entry = self.blob_contents.get(blob)
+        if entry is None:
+            entry = self.blob_contents[blob] = [blob, 0]
+        entry[1] += 1
+        return entry[0]
+
+    def _release_blob(self, blob: tuple[str, bytes]) -> None:
+        """Drop a reference to a shared serialized value."""
+        entry = self.blob_contents.get(blob)
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del self.blob_contents[blob]
+
+    def _set_blob(
+        self, key: tuple[str, str, str, str | int | float], blob: tuple[str, bytes]
+    ) -> tuple[str, bytes]:
+        if self.dedupe_blobs:
+            if (prev := self.blobs.get(key)) is not None:
+                self._release_blob(prev)
+            blob = self._intern_blob(blob)
+        self.blobs[key] = blob
+        self._blobs_index.add(key)
+        return blob
+
+    def _checkpoint_ids_for(self, thread_id: str, checkpoint_ns: str) -> list[str]:
+        """Get the IDs of the checkpoints of a thread and namespace, in order."""
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        ids = self._checkpoint_ids.setdefault(thread_id, {}).get(checkpoint_ns)
+        # rebuild if the storage was modified directly, e.g. loaded from disk
+        if ids is None or len(ids) != len(checkpoints):
+            ids = self._checkpoint_ids[thread_id][checkpoint_ns] = sorted(checkpoints)
+        return ids
+
+    def _store_checkpoint(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+        saved: tuple[tuple[str, bytes], tuple[str, bytes], str | None],
+    ) -> None:
+        ids = self._checkpoint_ids_for(thread_id, checkpoint_ns)
+        checkpoints = self.storage[thread_id][checkpoint_ns]
+        if checkpoint_id not in checkpoints:
+            insort(ids, checkpoint_id)
+        checkpoints[checkpoint_id] = saved
+
     def _load_blobs(
-        self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions
-    ) -> dict[str, Any]:
-        channel_values: dict[str, Any] = {}
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        versions: ChannelVersions,
+        *,
+        track_heads: bool = False,
+    ) -> LazyChannelValues:
+        blobs: dict[str, tuple[str | int | float, tuple[str, bytes]]] = {}
         for k, v in versions.items():
             kk = (thread_id, checkpoint_ns, k, v)
             if kk in self.blobs:
                 vv = self.blobs[kk]
                 if vv[0] != "empty":
-                    channel_values[k] = self.serde.loads_typed(vv)
-        return channel_values
+                    blobs[k] = (v, vv)
+        return LazyChannelValues(
+            partial(self._load_blob, thread_id, checkpoint_ns, track_heads), blobs
+        )
+
+    def _load_blob(
+        self,
+        thread_id: str,
+        checkpoint_ns: str,
+        track_heads: bool,
+        channel: str,
+        blob: tuple[str | int | float, tuple[str, bytes]],
+    ) -> Any:
+        version, vv = blob
+        kk = (thread_id, checkpoint_ns, channel, version)
+        if vv[0].endswith(DELTA_SUFFIX):
+            value = self._load_delta(kk, vv)
+        else:
+            value = self.serde.loads_typed(vv)
+        if track_heads and self.delta_chain_length is not None:
+            # values loaded to resume a thread become the base for the
+            # next delta
+            self._track_delta_head(kk, value, 0)
+        return value
+
+    def _load_delta(
+        self, key: tuple[str, str, str, str | int | float], blob: tuple[str, bytes]
+    ) -> list:
+        # walk back the chain of deltas to the last full value
+        thread_id, checkpoint_ns, channel, _ = key
+        deltas: list[list] = []
+        while blob[0].endswith(DELTA_SUFFIX):
+            base_version, items = self.serde.loads_typed(
+                (blob[0][: -len(DELTA_SUFFIX)], blob[1])
+            )
+            deltas.append(items)
+            blob = self.blobs[(thread_id, checkpoint_ns, channel, base_version)]
+        value = self.serde.loads_typed(blob)
+        for items in reversed(deltas):
+            value.extend(items)
+        return value
+
+    def _dumps_typed(self, value: Any) -> tuple[str, bytes]:
+        # a zero-copy view would change with the value, and can't be pickled
+        # to the log, so store a copy
+        type_, data = self.serde.dumps_typed(value)
+        return type_, bytes(data)
+
+    def _dump_blob(
+        self, key: tuple[str, str, str, str | int | float], value: Any
+    ) -> tuple[str, bytes]:
+        if self.delta_chain_length is None or type(value) is not list:
+            return self._dumps_typed(value)
+        head = self.delta_heads.get(key[:3])
+        if head is not None:
+            base_version, chain_len, base_items = head
+            base_len = len(base_items)
+            if (
+                chain_len < self.delta_chain_length
+                and len(value) > base_len
+                # reducers extending the list keep the stored items, so compare
+                # them by identity instead of serializing them again
+                and all(map(operator.is_, value, base_items))
+            ):
+                self.delta_heads[key[:3]] = (key[3], chain_len + 1, tuple(value))
+                type_, data = self._dumps_typed([base_version, value[base_len:]])
+                return type_ + DELTA_SUFFIX, data
+        self._track_delta_head(key, value, 0)
+        return self._dumps_typed(value)
+
+    def _track_delta_head(
+        self, key: tuple[str, str, str, str | int | float], value: Any, chain_len: int
+    ) -> None:
+        if type(value) is list:
+            # a copy, as the list may be extended in place
+            self.delta_heads[key[:3]] = (key[3], chain_len, tuple(value))
+        else:
+            self.delta_heads.pop(key[:3], None)
 
     def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Get a checkpoint tuple from the in-memory storage.
@@ -148,14 +433,19 @@ class InMemorySaver(
         if checkpoint_id := get_checkpoint_id(config):
             if saved := self.storage[thread_id][checkpoint_ns].get(checkpoint_id):
                 checkpoint, metadata, parent_checkpoint_id = saved
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
+                writes = self.writes.get(
+                    (thread_id, checkpoint_ns, checkpoint_id), {}
+                ).values()
                 checkpoint_: Checkpoint = self.serde.loads_typed(checkpoint)
                 return CheckpointTuple(
                     config=config,
                     checkpoint={
                         **checkpoint_,
                         "channel_values": self._load_blobs(
-                            thread_id, checkpoint_ns, checkpoint_["channel_versions"]
+                            thread_id,
+                            checkpoint_ns,
+                            checkpoint_["channel_versions"],
+                            track_heads=True,
                         ),
                     },
                     metadata=self.serde.loads_typed(metadata),
@@ -175,10 +465,14 @@ class InMemorySaver(
                     ),
                 )
         else:
-            if checkpoints := self.storage[thread_id][checkpoint_ns]:
-                checkpoint_id = max(checkpoints.keys())
-                checkpoint, metadata, parent_checkpoint_id = checkpoints[checkpoint_id]
-                writes = self.writes[(thread_id, checkpoint_ns, checkpoint_id)].values()
+            if checkpoint_ids := self._checkpoint_ids_for(thread_id, checkpoint_ns):
+                checkpoint_id = checkpoint_ids[-1]
+                checkpoint, metadata, parent_checkpoint_id = self.storage[thread_id][
+                    checkpoint_ns
+                ][checkpoint_id]
+                writes = self.writes.get(
+                    (thread_id, checkpoint_ns, checkpoint_id), {}
+                ).values()
                 checkpoint_ = self.serde.loads_typed(checkpoint)
                 return CheckpointTuple(
                     config={
@@ -191,7 +485,10 @@ class InMemorySaver(
                     checkpoint={
                         **checkpoint_,
                         "channel_values": self._load_blobs(
-                            thread_id, checkpoint_ns, checkpoint_["channel_versions"]
+                            thread_id,
+                            checkpoint_ns,
+                            checkpoint_["channel_versions"],
+                            track_heads=True,
                         ),
                     },
                     metadata=self.serde.loads_typed(metadata),
@@ -218,6 +515,7 @@ class InMemorySaver(
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> Iterator[CheckpointTuple]:
         """List checkpoints from the in-memory storage.
 
@@ -229,6 +527,7 @@ class InMemorySaver(
             filter: Additional filtering criteria for metadata.
             before: List checkpoints created before this configuration.
             limit: Maximum number of checkpoints to return.
+            metadata_only: Skip loading channel values and pending writes.
 
         Yields:
             An iterator of matching checkpoint tuples.
@@ -238,33 +537,40 @@ class InMemorySaver(
             config["configurable"].get("checkpoint_ns") if config else None
         )
         config_checkpoint_id = get_checkpoint_id(config) if config else None
+        before_checkpoint_id = get_checkpoint_id(before) if before else None
         for thread_id in thread_ids:
-            for checkpoint_ns in self.storage[thread_id].keys():
+            for checkpoint_ns in list(self.storage[thread_id].keys()):
                 if (
                     config_checkpoint_ns is not None
                     and checkpoint_ns != config_checkpoint_ns
                 ):
                     continue
 
-                for checkpoint_id, (
-                    checkpoint,
-                    metadata_b,
-                    parent_checkpoint_id,
-                ) in sorted(
-                    self.storage[thread_id][checkpoint_ns].items(),
-                    key=lambda x: x[0],
-                    reverse=True,
-                ):
+                checkpoints = self.storage[thread_id][checkpoint_ns]
+                if config_checkpoint_id:
                     # filter by checkpoint ID from config
-                    if config_checkpoint_id and checkpoint_id != config_checkpoint_id:
-                        continue
-
+                    checkpoint_ids: Iterator[str] = iter(
+                        (config_checkpoint_id,)
+                        if config_checkpoint_id in checkpoints
+                        else ()
+                    )
+                else:
+                    checkpoint_ids_ = self._checkpoint_ids_for(thread_id, checkpoint_ns)
                     # filter by checkpoint ID from `before` config
-                    if (
-                        before
-                        and (before_checkpoint_id := get_checkpoint_id(before))
-                        and checkpoint_id >= before_checkpoint_id
-                    ):
+                    end = (
+                        bisect_left(checkpoint_ids_, before_checkpoint_id)
+                        if before_checkpoint_id
+                        else len(checkpoint_ids_)
+                    )
+                    # iterate over a copy, checkpoints can be saved while
+                    # the caller consumes the results
+                    checkpoint_ids = reversed(checkpoint_ids_[:end])
+
+                for checkpoint_id in checkpoint_ids:
+                    checkpoint, metadata_b, parent_checkpoint_id = checkpoints[
+                        checkpoint_id
+                    ]
+                    if before_checkpoint_id and checkpoint_id >= before_checkpoint_id:
                         continue
 
                     # filter by metadata
@@ -281,12 +587,37 @@ class InMemorySaver(
                     elif limit is not None:
                         limit -= 1
 
-                    writes = self.writes[
-                        (thread_id, checkpoint_ns, checkpoint_id)
-                    ].values()
-
                     checkpoint_: Checkpoint = self.serde.loads_typed(checkpoint)
 
+                    if metadata_only:
+                        yield CheckpointTuple(
+                            config={
+                                "configurable": {
+                                    "thread_id": thread_id,
+                                    "checkpoint_ns": checkpoint_ns,
+                                    "checkpoint_id": checkpoint_id,
+                                }
+                            },
+                            checkpoint={**checkpoint_, "channel_values": {}},
+                            metadata=metadata,
+                            parent_config=(
+                                {
+                                    "configurable": {
+                                        "thread_id": thread_id,
+                                        "checkpoint_ns": checkpoint_ns,
+                                        "checkpoint_id": parent_checkpoint_id,
+                                    }
+                                }
+                                if parent_checkpoint_id
+                                else None
+                            ),
+                        )
+                        continue
+
+                    writes = self.writes.get(
+                        (thread_id, checkpoint_ns, checkpoint_id), {}
+                    ).values()
+
                     yield CheckpointTuple(
                         config={
                             "configurable": {
@@ -345,19 +676,25 @@ class InMemorySaver(
         thread_id = config["configurable"]["thread_id"]
         checkpoint_ns = config["configurable"]["checkpoint_ns"]
         values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
-        for k, v in new_versions.items():
-            self.blobs[(thread_id, checkpoint_ns, k, v)] = (
-                self.serde.dumps_typed(values[k]) if k in values else ("empty", b"")
-            )
-        self.storage[thread_id][checkpoint_ns].update(
-            {
-                checkpoint["id"]: (
-                    self.serde.dumps_typed(c),
-                    self.serde.dumps_typed(get_checkpoint_metadata(config, metadata)),
-                    config["configurable"].get("checkpoint_id"),  # parent
-                )
-            }
+        blobs = []
+        saved = (
+            self._dumps_typed(c),
+            self._dumps_typed(get_checkpoint_metadata(config, metadata)),
+            config["configurable"].get("checkpoint_id"),  # parent
         )
+        with self._lock:
+            for k, v in new_versions.items():
+                key = (thread_id, checkpoint_ns, k, v)
+                if k in values:
+                    blob = self._dump_blob(key, values[k])
+                else:
+                    blob = ("empty", b"")
+                blobs.append((key, self._set_blob(key, blob)))
+            self._store_checkpoint(thread_id, checkpoint_ns, checkpoint["id"], saved)
+            if self._log is not None:
+                self._append(
+                    ("put", thread_id, checkpoint_ns, checkpoint["id"], saved, blobs)
+                )
         return {
             "configurable": {
                 "thread_id": thread_id,
@@ -391,18 +728,25 @@ class InMemorySaver(
         checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
         checkpoint_id = config["configurable"]["checkpoint_id"]
         outer_key = (thread_id, checkpoint_ns, checkpoint_id)
-        outer_writes_ = self.writes.get(outer_key)
-        for idx, (c, v) in enumerate(writes):
-            inner_key = (task_id, WRITES_IDX_MAP.get(c, idx))
-            if inner_key[1] >= 0 and outer_writes_ and inner_key in outer_writes_:
-                continue
-
-            self.writes[outer_key][inner_key] = (
-                task_id,
-                c,
-                self.serde.dumps_typed(v),
-                task_path,
-            )
+        written = []
+        with self._lock:
+            outer_writes_ = self.writes.get(outer_key)
+            for idx, (c, v) in enumerate(writes):
+                inner_key = (task_id, WRITES_IDX_MAP.get(c, idx))
+                if inner_key[1] >= 0 and outer_writes_ and inner_key in outer_writes_:
+                    continue
+
+                self.writes[outer_key][inner_key] = entry = (
+                    task_id,
+                    c,
+                    self._dumps_typed(v),
+                    task_path,
+                )
+                written.append((inner_key, entry))
+            if written:
+                self._writes_index.add(outer_key)
+            if self._log is not None and written:
+                self._append(("writes", outer_key, written))
 
     def delete_thread(self, thread_id: str) -> None:
         """Delete all checkpoints and writes associated with a thread ID.
@@ -413,14 +757,22 @@ class InMemorySaver(
         Returns:
             None
         """
+        with self._lock:
+            self._delete_thread(thread_id)
+            if self._log is not None:
+                self._append(("delete", thread_id))
+
+    def _delete_thread(self, thread_id: str) -> None:
         if thread_id in self.storage:
             del self.storage[thread_id]
-        for k in list(self.writes.keys()):
-            if k[0] == thread_id:
-                del self.writes[k]
-        for k in list(self.blobs.keys()):
-            if k[0] == thread_id:
-                del self.blobs[k]
+        self._checkpoint_ids.pop(thread_id, None)
+        for k in self._writes_index.pop(thread_id, self.writes):
+            del self.writes[k]
+        for k in self._blobs_index.pop(thread_id, self.blobs):
+            blob = self.blobs.pop(k)
+            if self.dedupe_blobs:
+                self._release_blob(blob)
+            self.delta_heads.pop(k[:3], None)
 
     async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
         """Asynchronous version of `get_tuple`.
@@ -443,6 +795,7 @@ class InMemorySaver(
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> AsyncIterator[CheckpointTuple]:
         """Asynchronous version of `list`.
 
@@ -455,7 +808,13 @@ class InMemorySaver(
         Yields:
             An asynchronous iterator of checkpoint tuples.
         """
-        for item in self.list(config, filter=filter, before=before, limit=limit):
+        for item in self.list(
+            config,
+            filter=filter,
+            before=before,
+            limit=limit,
+            metadata_only=metadata_only,
+        ):
             yield item
 
     async def aput(
@@ -527,6 +886,121 @@ class InMemorySaver(
 MemorySaver = InMemorySaver  # Kept for backwards compatibility
 
 
+class _CheckpointLog:
+    """Append-only log of the changes made to an `InMemorySaver`.
+
+    Every change is appended as a record framed with its length and CRC32, so
+    the cost of persisting it is proportional to its size, not to the size of
+    the saver. The log is compacted into a snapshot of the whole saver once it
+    grows larger than `COMPACT_RATIO` times the last snapshot.
+
+    The snapshot is written to a temporary file and moved in place, and both
+    files carry a generation number, so a crash at any point leaves either the
+    previous snapshot and its log, or the new snapshot, which is preferred to a
+    log of an older generation. A torn or corrupt record at the end of the log
+    is discarded on load, together with everything after it.
+    """
+
+    HEADER = struct.Struct("<II")
+    COMPACT_RATIO = 2
+    MIN_COMPACT_SIZE = 1 << 20
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.snapshot_path = path + ".snapshot"
+        self.generation = 0
+        self.snapshot_size = 0
+        self.size = 0
+        self.file: Any = None
+        self.lock = threading.RLock()
+
+    def load(self) -> tuple[dict | None, list[tuple]]:
+        """Read the snapshot and the records logged since."""
+        snapshot = None
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "rb") as f:
+                snapshot = pickle.load(f)
+            self.generation = snapshot["generation"]
+            self.snapshot_size = os.path.getsize(self.snapshot_path)
+        records: list[tuple] = []
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                data = f.read()
+            offset = 0
+            while offset + self.HEADER.size <= len(data):
+                length, crc = self.HEADER.unpack_from(data, offset)
+                start = offset + self.HEADER.size
+                payload = data[start : start + length]
+                if len(payload) < length or zlib.crc32(payload) != crc:
+                    break
+                records.append(pickle.loads(payload))
+                offset = start + length
+            if offset < len(data):
+                logger.warning(
+                    f"Discarding {len(data) - offset} bytes of incomplete records "
+                    f"at the end of {self.path}"
+                )
+            if records and records[0] == ("generation", self.generation):
+                self.size = offset
+                with open(self.path, "r+b") as f:
+                    f.truncate(offset)
+                self.file = open(self.path, "ab")
+                return snapshot, records[1:]
+        # no log, or the log of a generation already in the snapshot
+        self._start_log()
+        return snapshot, []
+
+    def append(self, record: tuple) -> bool:
+        """Append a record, returns whether the log should be compacted."""
+        payload = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+        frame = self.HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self.lock:
+            self.file.write(frame)
+            self.file.flush()
+            self.size += len(frame)
+            return self.size > max(
+                self.MIN_COMPACT_SIZE, self.COMPACT_RATIO * self.snapshot_size
+            )
+
+    def compact(self, take_snapshot: Callable[[], dict]) -> None:
+        """Replace the snapshot and the log with a new snapshot.
+
+        The snapshot is taken while holding the lock, so no change can be
+        logged between the snapshot and the start of the new log.
+        """
+        with self.lock:
+            snapshot = take_snapshot()
+            snapshot["generation"] = self.generation + 1
+            tempname = self.snapshot_path + ".tmp"
+            with open(tempname, "wb") as f:
+                pickle.dump(snapshot, f, pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tempname, self.snapshot_path)  # atomic commit
+            self.generation += 1
+            self.snapshot_size = os.path.getsize(self.snapshot_path)
+            self.file.close()
+            self._start_log()
+
+    def close(self) -> None:
+        with self.lock:
+            if self.file is not None and not self.file.closed:
+                self.file.flush()
+                os.fsync(self.file.fileno())
+                self.file.close()
+
+    def _start_log(self) -> None:
+        payload = pickle.dumps(("generation", self.generation))
+        tempname = self.path + ".tmp"
+        with open(tempname, "wb") as f:
+            f.write(self.HEADER.pack(len(payload), zlib.crc32(payload)) + payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tempname, self.path)
+        self.size = os.path.getsize(self.path)
+        self.file = open(self.path, "ab")
+
+
 class PersistentDict(defaultdict):
     """Persistent dictionary with an API compatible with shelve and anydbm.
 
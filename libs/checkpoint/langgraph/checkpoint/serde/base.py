@@ -15,14 +15,16 @@ class SerializerProtocol(UntypedSerializerProtocol, Protocol):
     """Protocol for serialization and deserialization of objects.
 
     - `dumps`: Serialize an object to bytes.
-    - `dumps_typed`: Serialize an object to a tuple (type, bytes).
+    - `dumps_typed`: Serialize an object to a tuple (type, bytes). The data may
+      also be a `memoryview` sharing memory with the object, which must be
+      consumed, or copied with `bytes()`, before the object is modified.
     - `loads`: Deserialize an object from bytes.
     - `loads_typed`: Deserialize an object from a tuple (type, bytes).
 
     Valid implementations include the `pickle`, `json` and `orjson` modules.
     """
 
-    def dumps_typed(self, obj: Any) -> tuple[str, bytes]: ...
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes | memoryview]: ...
 
     def loads_typed(self, data: tuple[str, bytes]) -> Any: ...
 
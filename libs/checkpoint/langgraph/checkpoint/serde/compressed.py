@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Callable, Literal, NamedTuple
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+CodecName = Literal["zstd", "lz4", "zlib"]
+
+
+class Codec(NamedTuple):
+    compress: Callable[[bytes | memoryview, int | None], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+class CompressedSerializer(SerializerProtocol):
+    """Serializer that compresses the data of another serializer.
+
+    Data of at least `threshold` bytes is compressed, and the codec name is added
+    to the type, eg. `msgpack+zstd`. Data stored without compression, such as rows
+    written before this serializer was used, is passed to the wrapped serializer
+    as is. Stacks with `EncryptedSerializer`, which should wrap this one, as
+    encrypted data doesn't compress.
+    """
+
+    def __init__(
+        self,
+        serde: SerializerProtocol = JsonPlusSerializer(),
+        *,
+        codec: CodecName = "zstd",
+        level: int | None = None,
+        threshold: int = 1024,
+        thresholds: Mapping[str, int | None] | None = None,
+    ) -> None:
+        """
+        Args:
+            serde: The serializer to compress the output of.
+            codec: The compression codec, `zstd` and `lz4` require the `zstandard`
+                and `lz4` packages.
+            level: The compression level, defaults to the codec's default.
+            threshold: The minimum size in bytes of data to compress.
+            thresholds: Thresholds overriding `threshold` for some serialization
+                types, eg. `{"bytes": None}` to never compress raw bytes.
+        """
+        self.serde = serde
+        self.codec = codec
+        self.level = level
+        self.threshold = threshold
+        self.thresholds = thresholds or {}
+        # fail early if the codec isn't installed
+        self._codecs: dict[str, Codec] = {codec: _load_codec(codec)}
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.serde.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.serde.loads(data)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes | memoryview]:
+        """Serialize an object to a tuple (type, bytes), compressing the bytes
+        if larger than the threshold for the type."""
+        typ, data = self.serde.dumps_typed(obj)
+        threshold = self.thresholds.get(typ.split(":", 1)[0], self.threshold)
+        if threshold is None or data is None or len(data) < threshold:
+            return typ, data
+        compressed = self._codecs[self.codec].compress(data, self.level)
+        # keep data that doesn't compress as is
+        if len(compressed) >= len(data):
+            return typ, data
+        return f"{typ}+{self.codec}", compressed
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        typ, payload = data
+        if "+" in typ:
+            inner, codec = typ.rsplit("+", 1)
+            if codec in CODECS:
+                if codec not in self._codecs:
+                    self._codecs[codec] = _load_codec(codec)
+                payload = self._codecs[codec].decompress(payload)
+                return self.serde.loads_typed((inner, payload))
+        # uncompressed data
+        return self.serde.loads_typed(data)
+
+
+def _zstd() -> Codec:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return Codec(lambda data, level: zstd.compress(data, level), zstd.decompress)
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstandard is not installed. Please install it with `pip install zstandard`."
+        ) from None
+
+    def compress(data: bytes | memoryview, level: int | None) -> bytes:
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress(
+            data
+        )
+
+    def decompress(data: bytes) -> bytes:
+        # frames may not record their content size, so use a streaming decoder
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+    return Codec(compress, decompress)
+
+
+def _lz4() -> Codec:
+    try:
+        import lz4.frame
+    except ImportError:
+        raise ImportError(
+            "lz4 is not installed. Please install it with `pip install lz4`."
+        ) from None
+
+    return Codec(
+        lambda data, level: lz4.frame.compress(data, compression_level=level or 0),
+        lz4.frame.decompress,
+    )
+
+
+def _zlib() -> Codec:
+    import zlib
+
+    return Codec(
+        lambda data, level: zlib.compress(data, -1 if level is None else level),
+        zlib.decompress,
+    )
+
+
+CODECS: dict[str, Callable[[], Codec]] = {"zstd": _zstd, "lz4": _lz4, "zlib": _zlib}
+
+
+def _load_codec(name: str) -> Codec:
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown compression codec: {name}, expected one of {list(CODECS)}"
+        ) from None
@@ -25,7 +25,7 @@ class EncryptedSerializer(SerializerProtocol):
         # serialize data
         typ, data = self.serde.dumps_typed(obj)
         # encrypt data
-        ciphername, ciphertext = self.cipher.encrypt(data)
+        ciphername, ciphertext = self.cipher.encrypt(bytes(data))
         # add cipher name to type
         return f"{typ}+{ciphername}", ciphertext
 
@@ -34,8 +34,8 @@ class EncryptedSerializer(SerializerProtocol):
         # unencrypted data
         if "+" not in enc_cipher:
             return self.serde.loads_typed(data)
-        # extract cipher name
-        typ, ciphername = enc_cipher.split("+", 1)
+        # extract cipher name, the type may have suffixes of its own
+        typ, ciphername = enc_cipher.rsplit("+", 1)
         # decrypt data
         decrypted_data = self.cipher.decrypt(ciphername, ciphertext)
         # deserialize data
@@ -8,10 +8,12 @@ import pathlib
 import pickle
 import re
 import sys
+import weakref
 from collections import deque
 from collections.abc import Sequence
 from datetime import date, datetime, time, timedelta, timezone
 from enum import Enum
+from functools import lru_cache, partial
 from inspect import isclass
 from ipaddress import (
     IPv4Address,
@@ -21,6 +23,7 @@ from ipaddress import (
     IPv6Interface,
     IPv6Network,
 )
+from operator import attrgetter, methodcaller
 from typing import Any, Callable, cast
 from uuid import UUID
 from zoneinfo import ZoneInfo
@@ -30,6 +33,7 @@ from langchain_core.load.load import Reviver
 from langchain_core.load.serializable import Serializable
 
 from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.lazy import LazyChannelValues
 from langgraph.checkpoint.serde.types import SendProtocol
 from langgraph.store.base import Item
 
@@ -38,15 +42,29 @@ EMPTY_BYTES = b""
 
 
 class JsonPlusSerializer(SerializerProtocol):
-    """Serializer that uses ormsgpack, with a fallback to extended JSON serializer."""
+    """Serializer that uses ormsgpack, with a fallback to extended JSON serializer.
+
+    With `zero_copy=True`, contiguous numpy arrays are serialized out-of-band,
+    like pickle protocol 5 buffers: dtype and shape go in the type string and the
+    data is a `memoryview` of the array itself, which sqlite3 and psycopg write
+    without copying. The view shares memory with the array, so it must be
+    consumed before the array is modified in place. Arrays serialized this way
+    are loaded regardless of the setting, as read-only views of the stored data.
+
+    Only enable it for checkpointers that accept any bytes-like object as the
+    serialized data, since `dumps_typed` then returns a `memoryview` where
+    `bytes` is otherwise expected.
+    """
 
     def __init__(
         self,
         *,
         pickle_fallback: bool = False,
+        zero_copy: bool = False,
         __unpack_ext_hook__: Callable[[int, bytes], Any] | None = None,
     ) -> None:
         self.pickle_fallback = pickle_fallback
+        self.zero_copy = zero_copy
         self._unpack_ext_hook = (
             __unpack_ext_hook__
             if __unpack_ext_hook__ is not None
@@ -99,6 +117,8 @@ class JsonPlusSerializer(SerializerProtocol):
             return self._encode_constructor_args(decimal.Decimal, args=(str(obj),))
         elif isinstance(obj, (set, frozenset, deque)):
             return self._encode_constructor_args(type(obj), args=(tuple(obj),))
+        elif isinstance(obj, LazyChannelValues):
+            return dict(obj.items())
         elif isinstance(obj, (IPv4Address, IPv4Interface, IPv4Network)):
             return self._encode_constructor_args(obj.__class__, args=(str(obj),))
         elif isinstance(obj, (IPv6Address, IPv6Interface, IPv6Network)):
@@ -204,13 +224,21 @@ class JsonPlusSerializer(SerializerProtocol):
             "utf-8", "ignore"
         )
 
-    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes | memoryview]:
+        """Serialize an object to a type string and its data.
+
+        The data is `bytes`, except for `bytearray` objects, and for numpy arrays
+        with `zero_copy=True`, whose data is a read-only `memoryview` of the
+        array.
+        """
         if obj is None:
             return "null", EMPTY_BYTES
         elif isinstance(obj, bytes):
             return "bytes", obj
         elif isinstance(obj, bytearray):
             return "bytearray", obj
+        elif self.zero_copy and (buffer := _ndarray_buffer(obj)) is not None:
+            return buffer
         else:
             try:
                 return "msgpack", _msgpack_enc(obj)
@@ -238,12 +266,46 @@ class JsonPlusSerializer(SerializerProtocol):
             return ormsgpack.unpackb(
                 data_, ext_hook=self._unpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
+        elif type_.startswith(NDARRAY_TYPE_PREFIX):
+            arr = _ndarray_from_buffer(type_, data_)
+            if self._unpack_ext_hook is _msgpack_ext_hook_to_json:
+                return arr.tolist()
+            return arr
         elif self.pickle_fallback and type_ == "pickle":
             return pickle.loads(data_)
         else:
             raise NotImplementedError(f"Unknown serialization type: {type_}")
 
 
+# --- out-of-band numpy arrays ---
+
+NDARRAY_TYPE_PREFIX = "ndarray:"
+
+
+def _ndarray_buffer(obj: Any) -> tuple[str, memoryview] | None:
+    """Type string and zero-copy buffer of a numpy array, if it has one."""
+    if (np_mod := sys.modules.get("numpy")) is None or not isinstance(
+        obj, np_mod.ndarray
+    ):
+        return None
+    dtype = obj.dtype
+    # record dtypes and object arrays can't be restored from the dtype string
+    if not obj.flags.c_contiguous or dtype.fields is not None or dtype.hasobject:
+        return None
+    shape = ",".join(map(str, obj.shape))
+    # a flat view of bytes supports the buffer protocol for any dtype
+    buffer = memoryview(obj.reshape(-1).view(np_mod.uint8)).toreadonly()
+    return f"{NDARRAY_TYPE_PREFIX}{dtype.str}:{shape}", buffer
+
+
+def _ndarray_from_buffer(type_: str, data: bytes) -> Any:
+    import numpy as _np
+
+    _, dtype_str, shape = type_.split(":")
+    arr = _np.frombuffer(data, dtype=_np.dtype(dtype_str))
+    return arr.reshape(tuple(int(d) for d in shape.split(",") if d))
+
+
 # --- msgpack ---
 
 EXT_CONSTRUCTOR_SINGLE_ARG = 0
@@ -256,230 +318,205 @@ EXT_NUMPY_ARRAY = 6
 
 
 def _msgpack_default(obj: Any) -> str | ormsgpack.Ext:
+    # the encoder is picked once per type
+    try:
+        encoder = _ENCODERS[type(obj)]
+    except KeyError:
+        encoder = _ENCODERS[type(obj)] = _msgpack_encoder(obj)
+    return encoder(obj)
+
+
+_ENCODERS: weakref.WeakKeyDictionary[type, Callable[[Any], Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _encode_ext(
+    code: int,
+    path: tuple[str, str],
+    get: Callable[[Any], Any],
+    extra: tuple[str, ...],
+    obj: Any,
+) -> ormsgpack.Ext:
+    return ormsgpack.Ext(code, _msgpack_enc((*path, get(obj), *extra)))
+
+
+def _ext_encoder(
+    code: int,
+    get: Callable[[Any], Any],
+    path: tuple[str, str],
+    *extra: str,
+) -> Callable[[Any], ormsgpack.Ext]:
+    return partial(_encode_ext, code, path, get, extra)
+
+
+def _message_fields(obj: Any) -> dict[str, Any]:
+    # same as model_dump() for messages holding only JSON-like values, without
+    # going through the pydantic serializer, which converts any other values,
+    # e.g. models in additional_kwargs
+    fields = obj.__dict__
+    if extra := obj.__pydantic_extra__:
+        fields = {**fields, **extra}
+    if all(_is_json_like(v) for v in fields.values()):
+        return fields
+    return obj.model_dump()
+
+
+_JSON_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _is_json_like(value: Any) -> bool:
+    """Whether `value` only holds JSON values, which model_dump() returns as is."""
+    cls = type(value)
+    if cls in _JSON_SCALAR_TYPES:
+        return True
+    elif cls is dict:
+        return all(type(k) is str and _is_json_like(v) for k, v in value.items())
+    elif cls is list or cls is tuple:
+        return all(_is_json_like(v) for v in value)
+    return False
+
+
+def _is_plain_message(obj: Any) -> bool:
+    """Whether `obj` is one of the messages of langchain_core, whose fields are
+    all stored as attributes."""
+    messages = sys.modules.get("langchain_core.messages")
+    if messages is None or not isinstance(obj, messages.BaseMessage):
+        return False
+    cls = type(obj)
+    return (
+        cls.__module__.startswith("langchain_core.")
+        and not cls.model_computed_fields
+        and not any(field.exclude for field in cls.model_fields.values())
+    )
+
+
+def _msgpack_encoder(obj: Any) -> Callable[[Any], Any]:
+    """Pick the encoder for objects of the same type as `obj`."""
+    path = (obj.__class__.__module__, obj.__class__.__name__)
     if hasattr(obj, "model_dump") and callable(obj.model_dump):  # pydantic v2
-        return ormsgpack.Ext(
-            EXT_PYDANTIC_V2,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    obj.model_dump(),
-                    "model_validate_json",
-                ),
-            ),
+        if _is_plain_message(obj):
+            return _ext_encoder(
+                EXT_PYDANTIC_V2, _message_fields, path, "model_validate_json"
+            )
+        return _ext_encoder(
+            EXT_PYDANTIC_V2, methodcaller("model_dump"), path, "model_validate_json"
         )
     elif hasattr(obj, "get_secret_value") and callable(obj.get_secret_value):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_SINGLE_ARG,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    obj.get_secret_value(),
-                ),
-            ),
+        return _ext_encoder(
+            EXT_CONSTRUCTOR_SINGLE_ARG, methodcaller("get_secret_value"), path
         )
     elif hasattr(obj, "dict") and callable(obj.dict):  # pydantic v1
-        return ormsgpack.Ext(
-            EXT_PYDANTIC_V1,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    obj.dict(),
-                ),
-            ),
-        )
+        return _ext_encoder(EXT_PYDANTIC_V1, methodcaller("dict"), path)
     elif hasattr(obj, "_asdict") and callable(obj._asdict):  # namedtuple
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_KW_ARGS,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    obj._asdict(),
-                ),
-            ),
-        )
+        return _ext_encoder(EXT_CONSTRUCTOR_KW_ARGS, methodcaller("_asdict"), path)
     elif isinstance(obj, pathlib.Path):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_POS_ARGS,
-            _msgpack_enc(
-                (obj.__class__.__module__, obj.__class__.__name__, obj.parts),
-            ),
-        )
+        return _ext_encoder(EXT_CONSTRUCTOR_POS_ARGS, attrgetter("parts"), path)
     elif isinstance(obj, re.Pattern):
-        return ormsgpack.Ext(
+        return _ext_encoder(
             EXT_CONSTRUCTOR_POS_ARGS,
-            _msgpack_enc(
-                ("re", "compile", (obj.pattern, obj.flags)),
-            ),
+            attrgetter("pattern", "flags"),
+            ("re", "compile"),
         )
     elif isinstance(obj, UUID):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_SINGLE_ARG,
-            _msgpack_enc(
-                (obj.__class__.__module__, obj.__class__.__name__, obj.hex),
-            ),
-        )
+        return _ext_encoder(EXT_CONSTRUCTOR_SINGLE_ARG, attrgetter("hex"), path)
     elif isinstance(obj, decimal.Decimal):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_SINGLE_ARG,
-            _msgpack_enc(
-                (obj.__class__.__module__, obj.__class__.__name__, str(obj)),
-            ),
-        )
+        return _ext_encoder(EXT_CONSTRUCTOR_SINGLE_ARG, str, path)
     elif isinstance(obj, (set, frozenset, deque)):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_SINGLE_ARG,
-            _msgpack_enc(
-                (obj.__class__.__module__, obj.__class__.__name__, tuple(obj)),
-            ),
-        )
+        return _ext_encoder(EXT_CONSTRUCTOR_SINGLE_ARG, tuple, path)
     elif isinstance(obj, (IPv4Address, IPv4Interface, IPv4Network)):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_SINGLE_ARG,
-            _msgpack_enc(
-                (obj.__class__.__module__, obj.__class__.__name__, str(obj)),
-            ),
-        )
+        return _ext_encoder(EXT_CONSTRUCTOR_SINGLE_ARG, str, path)
     elif isinstance(obj, (IPv6Address, IPv6Interface, IPv6Network)):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_SINGLE_ARG,
-            _msgpack_enc(
-                (obj.__class__.__module__, obj.__class__.__name__, str(obj)),
-            ),
-        )
+        return _ext_encoder(EXT_CONSTRUCTOR_SINGLE_ARG, str, path)
     elif isinstance(obj, datetime):
-        return ormsgpack.Ext(
-            EXT_METHOD_SINGLE_ARG,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    obj.isoformat(),
-                    "fromisoformat",
-                ),
-            ),
+        return _ext_encoder(
+            EXT_METHOD_SINGLE_ARG, methodcaller("isoformat"), path, "fromisoformat"
         )
     elif isinstance(obj, timedelta):
-        return ormsgpack.Ext(
+        return _ext_encoder(
             EXT_CONSTRUCTOR_POS_ARGS,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    (obj.days, obj.seconds, obj.microseconds),
-                ),
-            ),
+            attrgetter("days", "seconds", "microseconds"),
+            path,
         )
     elif isinstance(obj, date):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_POS_ARGS,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    (obj.year, obj.month, obj.day),
-                ),
-            ),
+        return _ext_encoder(
+            EXT_CONSTRUCTOR_POS_ARGS, attrgetter("year", "month", "day"), path
         )
     elif isinstance(obj, time):
-        return ormsgpack.Ext(
+        return _ext_encoder(
             EXT_CONSTRUCTOR_KW_ARGS,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    {
-                        "hour": obj.hour,
-                        "minute": obj.minute,
-                        "second": obj.second,
-                        "microsecond": obj.microsecond,
-                        "tzinfo": obj.tzinfo,
-                        "fold": obj.fold,
-                    },
-                ),
-            ),
+            lambda obj: {
+                "hour": obj.hour,
+                "minute": obj.minute,
+                "second": obj.second,
+                "microsecond": obj.microsecond,
+                "tzinfo": obj.tzinfo,
+                "fold": obj.fold,
+            },
+            path,
         )
     elif isinstance(obj, timezone):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_POS_ARGS,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    obj.__getinitargs__(),  # type: ignore[attr-defined]
-                ),
-            ),
+        return _ext_encoder(
+            EXT_CONSTRUCTOR_POS_ARGS, methodcaller("__getinitargs__"), path
         )
     elif isinstance(obj, ZoneInfo):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_SINGLE_ARG,
-            _msgpack_enc(
-                (obj.__class__.__module__, obj.__class__.__name__, obj.key),
-            ),
-        )
+        return _ext_encoder(EXT_CONSTRUCTOR_SINGLE_ARG, attrgetter("key"), path)
     elif isinstance(obj, Enum):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_SINGLE_ARG,
-            _msgpack_enc(
-                (obj.__class__.__module__, obj.__class__.__name__, obj.value),
-            ),
-        )
+        return _ext_encoder(EXT_CONSTRUCTOR_SINGLE_ARG, attrgetter("value"), path)
     elif isinstance(obj, SendProtocol):
-        return ormsgpack.Ext(
-            EXT_CONSTRUCTOR_POS_ARGS,
-            _msgpack_enc(
-                (obj.__class__.__module__, obj.__class__.__name__, (obj.node, obj.arg)),
-            ),
-        )
+        return _ext_encoder(EXT_CONSTRUCTOR_POS_ARGS, attrgetter("node", "arg"), path)
+    elif isinstance(obj, LazyChannelValues):
+        return _lazy_channel_values_to_dict
     elif dataclasses.is_dataclass(obj):
         # doesn't use dataclasses.asdict to avoid deepcopy and recursion
-        return ormsgpack.Ext(
+        names = tuple(field.name for field in dataclasses.fields(obj))
+        return _ext_encoder(
             EXT_CONSTRUCTOR_KW_ARGS,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    {
-                        field.name: getattr(obj, field.name)
-                        for field in dataclasses.fields(obj)
-                    },
-                ),
-            ),
+            lambda obj: {name: getattr(obj, name) for name in names},
+            path,
         )
     elif isinstance(obj, Item):
-        return ormsgpack.Ext(
+        return _ext_encoder(
             EXT_CONSTRUCTOR_KW_ARGS,
-            _msgpack_enc(
-                (
-                    obj.__class__.__module__,
-                    obj.__class__.__name__,
-                    {k: getattr(obj, k) for k in obj.__slots__},
-                ),
-            ),
+            lambda obj: {k: getattr(obj, k) for k in obj.__slots__},
+            path,
         )
     elif (np_mod := sys.modules.get("numpy")) is not None and isinstance(
         obj, np_mod.ndarray
     ):
-        order = "F" if obj.flags.f_contiguous and not obj.flags.c_contiguous else "C"
-        if obj.flags.c_contiguous:
-            mv = memoryview(obj)
-            try:
-                meta = (obj.dtype.str, obj.shape, order, mv)
-                return ormsgpack.Ext(EXT_NUMPY_ARRAY, _msgpack_enc(meta))
-            finally:
-                mv.release()
-        else:
-            buf = obj.tobytes(order="A")
-            meta = (obj.dtype.str, obj.shape, order, buf)
-            return ormsgpack.Ext(EXT_NUMPY_ARRAY, _msgpack_enc(meta))
-
+        return _encode_ndarray
     elif isinstance(obj, BaseException):
-        return repr(obj)
+        return repr
     else:
-        raise TypeError(f"Object of type {obj.__class__.__name__} is not serializable")
+        return _not_serializable
+
+
+def _lazy_channel_values_to_dict(obj: LazyChannelValues) -> dict[str, Any]:
+    return dict(obj.items())
+
+
+def _encode_ndarray(obj: Any) -> ormsgpack.Ext:
+    order = "F" if obj.flags.f_contiguous and not obj.flags.c_contiguous else "C"
+    if obj.flags.c_contiguous:
+        mv = memoryview(obj)
+        try:
+            meta = (obj.dtype.str, obj.shape, order, mv)
+            return ormsgpack.Ext(EXT_NUMPY_ARRAY, _msgpack_enc(meta))
+        finally:
+            mv.release()
+    else:
+        buf = obj.tobytes(order="A")
+        meta = (obj.dtype.str, obj.shape, order, buf)
+        return ormsgpack.Ext(EXT_NUMPY_ARRAY, _msgpack_enc(meta))
+
+
+def _not_serializable(obj: Any) -> Any:
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not serializable")
+
+
+@lru_cache(maxsize=1024)
+def _import_attr(module: str, name: str) -> Any:
+    return getattr(importlib.import_module(module), name)
 
 
 def _msgpack_ext_hook(code: int, data: bytes) -> Any:
@@ -489,7 +526,7 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, arg
-            return getattr(importlib.import_module(tup[0]), tup[1])(tup[2])
+            return _import_attr(tup[0], tup[1])(tup[2])
         except Exception:
             return
     elif code == EXT_CONSTRUCTOR_POS_ARGS:
@@ -498,7 +535,7 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, args
-            return getattr(importlib.import_module(tup[0]), tup[1])(*tup[2])
+            return _import_attr(tup[0], tup[1])(*tup[2])
         except Exception:
             return
     elif code == EXT_CONSTRUCTOR_KW_ARGS:
@@ -507,7 +544,7 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, args
-            return getattr(importlib.import_module(tup[0]), tup[1])(**tup[2])
+            return _import_attr(tup[0], tup[1])(**tup[2])
         except Exception:
             return
     elif code == EXT_METHOD_SINGLE_ARG:
@@ -516,9 +553,7 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, arg, method
-            return getattr(getattr(importlib.import_module(tup[0]), tup[1]), tup[3])(
-                tup[2]
-            )
+            return getattr(_import_attr(tup[0], tup[1]), tup[3])(tup[2])
         except Exception:
             return
     elif code == EXT_PYDANTIC_V1:
@@ -527,7 +562,7 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, kwargs
-            cls = getattr(importlib.import_module(tup[0]), tup[1])
+            cls = _import_attr(tup[0], tup[1])
             try:
                 return cls(**tup[2])
             except Exception:
@@ -545,7 +580,7 @@ def _msgpack_ext_hook(code: int, data: bytes) -> Any:
                 data, ext_hook=_msgpack_ext_hook, option=ormsgpack.OPT_NON_STR_KEYS
             )
             # module, name, kwargs, method
-            cls = getattr(importlib.import_module(tup[0]), tup[1])
+            cls = _import_attr(tup[0], tup[1])
             try:
                 return cls(**tup[2])
             except Exception:
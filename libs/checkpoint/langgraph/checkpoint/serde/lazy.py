@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from typing import Any
+
+
+class LazyChannelValues(MutableMapping[str, Any]):
+    """Channel values of a checkpoint that are deserialized on first access.
+
+    Checkpointers can return this in place of a dict of channel values. It holds
+    the serialized value of each channel and calls `loads(channel, blob)` the
+    first time that channel is read, so resuming a thread only pays for
+    deserializing the channels it touches.
+
+    Copies share nothing but the serialized values, and deleting or replacing a
+    channel does not deserialize it. Serializing or pickling the mapping itself
+    deserializes all values and produces a plain dict.
+
+    `source` identifies where the serialized values were loaded from, e.g. the
+    thread and namespace of the checkpoint, so a checkpointer saving the values
+    back can tell whether the ones never read are already stored there.
+    """
+
+    __slots__ = ("_loads", "_blobs", "_values", "source")
+
+    def __init__(
+        self,
+        loads: Callable[[str, Any], Any],
+        blobs: Mapping[str, Any] | None = None,
+        values: Mapping[str, Any] | None = None,
+        source: Any = None,
+    ) -> None:
+        self.source = source
+        self._loads = loads
+        self._blobs: dict[str, Any] = dict(blobs) if blobs else {}
+        self._values: dict[str, Any] = dict(values) if values else {}
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            try:
+                blob = self._blobs[key]
+            except KeyError:
+                # another thread may have deserialized it in the meantime
+                return self._values[key]
+        value = self._loads(key, blob)
+        # another thread may have deserialized it first, keep a single copy
+        value = self._values.setdefault(key, value)
+        self._blobs.pop(key, None)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._values[key] = value
+        self._blobs.pop(key, None)
+
+    def __delitem__(self, key: str) -> None:
+        if key in self._values:
+            del self._values[key]
+            self._blobs.pop(key, None)
+        else:
+            del self._blobs[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._blobs
+
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._values)
+        yield from [k for k in list(self._blobs) if k not in self._values]
+
+    def __len__(self) -> int:
+        return len(self._values) + sum(1 for k in self._blobs if k not in self._values)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (dict(self.items()),))
+
+    def copy(self) -> LazyChannelValues:
+        return LazyChannelValues(self._loads, self._blobs, self._values, self.source)
+
+    def is_loaded(self, key: str) -> bool:
+        """Whether the value of a channel is not (or no longer) serialized."""
+        return key not in self._blobs
@@ -5,8 +5,8 @@ from __future__ import annotations
 import asyncio
 import functools
 import weakref
-from collections.abc import Iterable
-from typing import Any, Callable, Literal, TypeVar
+from collections.abc import Hashable, Iterable
+from typing import Any, Callable, Literal, TypedDict, TypeVar
 
 from langgraph.store.base import (
     NOT_PROVIDED,
@@ -30,6 +30,19 @@ from langgraph.store.base import (
 F = TypeVar("F", bound=Callable)
 
 
+class BatchStats(TypedDict):
+    """Batch size metrics of an `AsyncBatchedBaseStore`."""
+
+    batches: int
+    """Number of batches sent to `abatch`."""
+    ops: int
+    """Number of operations received."""
+    dedupped_ops: int
+    """Number of operations sent to `abatch`, after deduplication."""
+    max_batch: int
+    """Size of the largest batch sent to `abatch`."""
+
+
 def _check_loop(func: F) -> F:
     @functools.wraps(func)
     def wrapper(store: AsyncBatchedBaseStore, *args: Any, **kwargs: Any) -> Any:
@@ -56,12 +69,43 @@ def _check_loop(func: F) -> F:
 
 
 class AsyncBatchedBaseStore(BaseStore):
-    """Efficiently batch operations in a background task."""
+    """Efficiently batch operations in a background task.
+
+    Operations scheduled in the same event loop tick are deduplicated and sent
+    to `abatch` together.
+
+    Args:
+        max_batch_size: Maximum number of operations sent to `abatch` at once.
+            Larger ticks are split into sub-batches, run in order, and each
+            sub-batch's results are returned as soon as it completes.
+            Defaults to no limit.
+        max_wait_ms: How long to hold a batch open for operations scheduled in
+            later ticks, in milliseconds. The batch is sent early once it holds
+            `max_batch_size` operations. Defaults to sending each tick's
+            operations right away.
+    """
 
-    __slots__ = ("_loop", "_aqueue", "_task")
+    __slots__ = (
+        "_loop",
+        "_aqueue",
+        "_task",
+        "_stats",
+        "max_batch_size",
+        "max_wait_ms",
+    )
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+    ) -> None:
         super().__init__()
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._stats = BatchStats(batches=0, ops=0, dedupped_ops=0, max_batch=0)
         self._loop = asyncio.get_running_loop()
         self._aqueue: asyncio.Queue[tuple[asyncio.Future, Op]] = asyncio.Queue()
         self._task: asyncio.Task | None = None
@@ -186,6 +230,10 @@ class AsyncBatchedBaseStore(BaseStore):
         self._aqueue.put_nowait((fut, op))
         return await fut
 
+    def batch_stats(self) -> BatchStats:
+        """Get the batch size metrics of the store."""
+        return self._stats.copy()
+
     @_check_loop
     def batch(self, ops: Iterable[Op]) -> list[Result]:
         return asyncio.run_coroutine_threadsafe(self.abatch(ops), self._loop).result()
@@ -280,6 +328,33 @@ class AsyncBatchedBaseStore(BaseStore):
         ).result()
 
 
+def _freeze(value: Any) -> Hashable:
+    """Return a hashable value that is equal for equal JSON-like values."""
+    if isinstance(value, dict):
+        return (dict, frozenset((k, _freeze(v)) for k, v in value.items()))
+    elif isinstance(value, list):
+        return (list, tuple(_freeze(v) for v in value))
+    elif isinstance(value, tuple):
+        return (tuple, tuple(_freeze(v) for v in value))
+    elif isinstance(value, set):
+        return (set, frozenset(_freeze(v) for v in value))
+    else:
+        hash(value)
+        return value
+
+
+def _op_key(op: GetOp | SearchOp | ListNamespacesOp) -> Hashable | None:
+    """Return a key that is equal for equal read operations, or None if the
+    operation can't be hashed."""
+    try:
+        if isinstance(op, SearchOp):
+            return (SearchOp, op._replace(filter=_freeze(op.filter)))  # type: ignore[arg-type]
+        hash(op)
+        return (type(op), op)
+    except TypeError:
+        return None
+
+
 def _dedupe_ops(values: list[Op]) -> tuple[list[int] | None, list[Op]]:
     """Dedupe operations while preserving order for results.
 
@@ -296,12 +371,18 @@ def _dedupe_ops(values: list[Op]) -> tuple[list[int] | None, list[Op]]:
     dedupped: list[Op] = []
     listen: list[int] = []
     puts: dict[tuple[tuple[str, ...], str], int] = {}
+    reads: dict[Hashable, int] = {}
 
     for op in values:
         if isinstance(op, (GetOp, SearchOp, ListNamespacesOp)):
-            try:
-                listen.append(dedupped.index(op))
-            except ValueError:
+            key = _op_key(op)
+            if key is None:
+                listen.append(len(dedupped))
+                dedupped.append(op)
+            elif key in reads:
+                listen.append(reads[key])
+            else:
+                reads[key] = len(dedupped)
                 listen.append(len(dedupped))
                 dedupped.append(op)
         elif isinstance(op, PutOp):
@@ -333,33 +414,80 @@ async def _run(
             try:
                 # accumulate operations scheduled in same tick
                 items = [item]
-                try:
-                    while item := aqueue.get_nowait():
-                        items.append(item)
-                except asyncio.QueueEmpty:
-                    pass
-                # get the operations to run
-                futs = [item[0] for item in items]
-                values = [item[1] for item in items]
-                # action each operation
-                try:
-                    listen, dedupped = _dedupe_ops(values)
-                    results = await s.abatch(dedupped)
-                    if listen is not None:
-                        results = [results[ix] for ix in listen]
-
-                    # set the results of each operation
-                    for fut, result in zip(futs, results):
-                        # guard against future being done (e.g. cancelled)
-                        if not fut.done():
-                            fut.set_result(result)
-                except Exception as e:
-                    for fut in futs:
-                        # guard against future being done (e.g. cancelled)
-                        if not fut.done():
-                            fut.set_exception(e)
+                _drain(aqueue, items)
+                max_size = getattr(s, "max_batch_size", None)
+                # hold the batch open for operations scheduled in later ticks
+                if (max_wait_ms := getattr(s, "max_wait_ms", None)) and (
+                    max_size is None or len(items) < max_size
+                ):
+                    await _fill(aqueue, items, max_wait_ms / 1000, max_size)
+                # split into sub-batches, run in order
+                size = max_size or len(items)
+                for start in range(0, len(items), size):
+                    await _run_batch(s, items[start : start + size])
             finally:
                 # remove strong ref to store
                 del s
         else:
             break
+
+
+def _drain(
+    aqueue: asyncio.Queue[tuple[asyncio.Future, Op]],
+    items: list[tuple[asyncio.Future, Op]],
+) -> None:
+    try:
+        while item := aqueue.get_nowait():
+            items.append(item)
+    except asyncio.QueueEmpty:
+        pass
+
+
+async def _fill(
+    aqueue: asyncio.Queue[tuple[asyncio.Future, Op]],
+    items: list[tuple[asyncio.Future, Op]],
+    timeout: float,
+    max_size: int | None,
+) -> None:
+    """Wait up to `timeout` seconds for more operations, or until `max_size`."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while max_size is None or len(items) < max_size:
+        if (remaining := deadline - loop.time()) <= 0:
+            break
+        getter = loop.create_task(aqueue.get())
+        try:
+            await asyncio.wait((getter,), timeout=remaining)
+        finally:
+            # a cancelled getter leaves the item in the queue
+            if not getter.cancel():
+                items.append(getter.result())
+        _drain(aqueue, items)
+
+
+async def _run_batch(store: BaseStore, items: list[tuple[asyncio.Future, Op]]) -> None:
+    # get the operations to run
+    futs = [item[0] for item in items]
+    values = [item[1] for item in items]
+    # action each operation
+    try:
+        listen, dedupped = _dedupe_ops(values)
+        if (stats := getattr(store, "_stats", None)) is not None:
+            stats["batches"] += 1
+            stats["ops"] += len(values)
+            stats["dedupped_ops"] += len(dedupped)
+            stats["max_batch"] = max(stats["max_batch"], len(dedupped))
+        results = await store.abatch(dedupped)
+        if listen is not None:
+            results = [results[ix] for ix in listen]
+
+        # set the results of each operation
+        for fut, result in zip(futs, results):
+            # guard against future being done (e.g. cancelled)
+            if not fut.done():
+                fut.set_result(result)
+    except Exception as e:
+        for fut in futs:
+            # guard against future being done (e.g. cancelled)
+            if not fut.done():
+                fut.set_exception(e)
@@ -106,10 +106,10 @@ import concurrent.futures as cf
 import functools
 import logging
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from importlib import util
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from langchain_core.embeddings import Embeddings
 
@@ -130,6 +130,9 @@ from langgraph.store.base import (
     tokenize_path,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -176,6 +179,8 @@ class InMemoryStore(BaseStore):
     __slots__ = (
         "_data",
         "_vectors",
+        "_index",
+        "_namespaces",
         "index_config",
         "embeddings",
     )
@@ -188,6 +193,10 @@ class InMemoryStore(BaseStore):
         self._vectors: dict[tuple[str, ...], dict[str, dict[str, list[float]]]] = (
             defaultdict(lambda: defaultdict(dict))
         )
+        # float32 matrix mirroring _vectors, used for search when numpy is installed
+        self._index: _VectorIndex | None = None
+        # prefix tree of the namespaces in _data that hold items
+        self._namespaces: _NamespaceTrie | None = None
         self.index_config = index
         if self.index_config:
             self.index_config = self.index_config.copy()
@@ -249,14 +258,7 @@ class InMemoryStore(BaseStore):
             )
 
         filtered = []
-        for namespace in self._data:
-            if not (
-                namespace[: len(namespace_prefix)] == namespace_prefix
-                if len(namespace) >= len(namespace_prefix)
-                else False
-            ):
-                continue
-
+        for namespace in self._namespace_trie().search(namespace_prefix):
             for key, item in self._data[namespace].items():
                 if filter_func(item):
                     if op.query and (embeddings := self._vectors[namespace].get(key)):
@@ -306,11 +308,28 @@ class InMemoryStore(BaseStore):
         results: list[Result],
     ) -> None:
         """Perform batch similarity search for multiple queries."""
+        item_scores: dict[int, np.ndarray] = {}
+        if queryinmem_store and (index := self._vector_index()) is not None:
+            # score the candidates of all queries with a single matrix multiply
+            scored_ops = [
+                i for i, (op, candidates) in ops.items() if op.query and candidates
+            ]
+            item_scores = dict(
+                zip(
+                    scored_ops,
+                    index.score(
+                        queryinmem_store,
+                        [(ops[i][0].query, ops[i][1]) for i in scored_ops],  # type: ignore[misc]
+                    ),
+                )
+            )
         for i, (op, candidates) in ops.items():
             if not candidates:
                 results[i] = []
                 continue
-            if op.query and queryinmem_store:
+            if i in item_scores:
+                results[i] = _top_k(op, candidates, item_scores[i])
+            elif op.query and queryinmem_store:
                 query_embedding = queryinmem_store[op.query]
                 flat_items, flat_vectors = [], []
                 scoreless = []
@@ -384,7 +403,7 @@ class InMemoryStore(BaseStore):
         ] = {}
         for i, op in enumerate(ops):
             if isinstance(op, GetOp):
-                item = self._data[op.namespace].get(op.key)
+                item = (self._data.get(op.namespace) or {}).get(op.key)
                 results.append(item)
             elif isinstance(op, SearchOp):
                 search_ops[i] = (op, self._filter_items(op))
@@ -400,11 +419,17 @@ class InMemoryStore(BaseStore):
         return results, put_ops, search_ops
 
     def _apply_put_ops(self, put_ops: dict[tuple[tuple[str, ...], str], PutOp]) -> None:
+        namespaces = self._namespace_trie()
         for (namespace, key), op in put_ops.items():
             if op.value is None:
                 self._data[namespace].pop(key, None)
                 self._vectors[namespace].pop(key, None)
+                if self._index is not None:
+                    self._index.delete(namespace, key)
+                if not self._data[namespace]:
+                    namespaces.remove(namespace)
             else:
+                namespaces.add(namespace)
                 self._data[namespace][key] = Item(
                     value=op.value,
                     key=key,
@@ -412,6 +437,17 @@ class InMemoryStore(BaseStore):
                     created_at=datetime.now(timezone.utc),
                     updated_at=datetime.now(timezone.utc),
                 )
+        namespaces.synced = len(self._data)
+
+    def _namespace_trie(self) -> _NamespaceTrie:
+        """Get the namespace trie, (re)building it if `_data` changed under it."""
+        if (
+            self._namespaces is None
+            or self._namespaces.source is not self._data
+            or self._namespaces.synced != len(self._data)
+        ):
+            self._namespaces = _NamespaceTrie(self._data)
+        return self._namespaces
 
     def _extract_texts(
         self, put_ops: dict[tuple[tuple[str, ...], str], PutOp]
@@ -452,26 +488,314 @@ class InMemoryStore(BaseStore):
                 f"Number of embeddings ({len(embeddings)}) does not"
                 f" match number of indices ({len(indices)})"
             )
+        index = self._vector_index()
         for embedding, (ns, key, path) in zip(embeddings, indices):
             self._vectors[ns][key][path] = embedding
+            if index is not None:
+                index.upsert(ns, key, path, embedding)
+
+    def _vector_index(self) -> _VectorIndex | None:
+        """Get the vector index, (re)building it if `_vectors` was replaced."""
+        if not _check_numpy():
+            return None
+        if self._index is None or self._index.source is not self._vectors:
+            self._index = _VectorIndex(self._vectors)
+        return self._index
 
     def _handle_list_namespaces(self, op: ListNamespacesOp) -> list[tuple[str, ...]]:
-        all_namespaces = list(
-            self._data.keys()
-        )  # Avoid collection size changing while iterating
-        namespaces = all_namespaces
-        if op.match_conditions:
-            namespaces = [
-                ns
-                for ns in namespaces
-                if all(_does_match(condition, ns) for condition in op.match_conditions)
-            ]
+        namespaces = self._namespace_trie().list(op.match_conditions, op.max_depth)
+        results: list[tuple[str, ...]] = []
+        for ns in namespaces:
+            if len(results) == op.offset + op.limit:
+                break
+            results.append(ns)
+        return results[op.offset :]
+
+
+class _NamespaceNode:
+    __slots__ = ("children", "present", "count")
 
-        if op.max_depth is not None:
-            namespaces = sorted({ns[: op.max_depth] for ns in namespaces})
+    def __init__(self) -> None:
+        self.children: dict[str, _NamespaceNode] = {}
+        # whether the namespace ending at this node holds items
+        self.present = False
+        # number of namespaces holding items at or below this node
+        self.count = 0
+
+
+class _NamespaceTrie:
+    """Prefix tree of the namespaces of a store that hold at least one item.
+
+    Lookups by prefix visit only the matching part of the tree. Children are
+    visited in sorted order, so namespaces come out in tuple order.
+    """
+
+    __slots__ = ("root", "order", "source", "synced")
+
+    def __init__(self, data: dict[tuple[str, ...], dict[str, Item]]) -> None:
+        self.root = _NamespaceNode()
+        # insertion order of the namespaces in data, for search results
+        self.order: dict[tuple[str, ...], int] = {}
+        self.source = data
+        for ns, items in data.items():
+            self.order[ns] = len(self.order)
+            if items:
+                self.add(ns)
+        # number of namespaces in data when last in sync with it
+        self.synced = len(data)
+
+    def add(self, ns: tuple[str, ...]) -> None:
+        path = [self.root]
+        for label in ns:
+            node = path[-1].children.get(label)
+            if node is None:
+                node = path[-1].children[label] = _NamespaceNode()
+            path.append(node)
+        if path[-1].present:
+            return
+        path[-1].present = True
+        for node in path:
+            node.count += 1
+        self.order.setdefault(ns, len(self.order))
+
+    def remove(self, ns: tuple[str, ...]) -> None:
+        path = [self.root]
+        for label in ns:
+            if (node := path[-1].children.get(label)) is None:
+                return
+            path.append(node)
+        if not path[-1].present:
+            return
+        path[-1].present = False
+        for node in path:
+            node.count -= 1
+        # prune the branches left without namespaces
+        for parent, label, node in zip(path, ns, path[1:]):
+            if not node.count:
+                del parent.children[label]
+                break
+
+    def search(self, prefix: tuple[str, ...]) -> list[tuple[str, ...]]:
+        """Get the namespaces starting with `prefix`, in insertion order."""
+        node: _NamespaceNode | None = self.root
+        for label in prefix:
+            if (node := node.children.get(label)) is None:  # type: ignore[union-attr]
+                return []
+        return sorted(self._walk(node, prefix, None), key=self.order.__getitem__)  # type: ignore[arg-type]
+
+    def list(
+        self,
+        match_conditions: tuple[MatchCondition, ...] | None,
+        max_depth: int | None,
+    ) -> Iterator[tuple[str, ...]]:
+        """Iterate the namespaces matching all conditions, in sorted order.
+
+        The first prefix condition selects the branches of the tree to visit,
+        other conditions are checked on each namespace found. Namespaces are
+        truncated to `max_depth` and deduplicated.
+        """
+        conditions = list(match_conditions or ())
+        prefix = next((c for c in conditions if c.match_type == "prefix"), None)
+        if prefix is not None:
+            conditions.remove(prefix)
+            starts = self._expand(self.root, (), prefix.path)
         else:
-            namespaces = sorted(namespaces)
-        return namespaces[op.offset : op.offset + op.limit]
+            starts = iter([(self.root, ())])
+        # can't stop at max_depth when deeper labels need to be checked
+        cut = max_depth if not conditions else None
+        last = None
+        for node, path in starts:
+            for ns in self._walk(node, path, cut):
+                if conditions and not all(_does_match(c, ns) for c in conditions):
+                    continue
+                if max_depth is not None:
+                    ns = ns[:max_depth]
+                if ns != last:
+                    last = ns
+                    yield ns
+
+    def _expand(
+        self, node: _NamespaceNode, path: tuple[str, ...], pattern: tuple[str, ...]
+    ) -> Iterator[tuple[_NamespaceNode, tuple[str, ...]]]:
+        """Iterate the nodes matching a prefix pattern with wildcards."""
+        if not pattern:
+            yield node, path
+        elif pattern[0] == "*":
+            for label in sorted(node.children):
+                yield from self._expand(
+                    node.children[label], (*path, label), pattern[1:]
+                )
+        elif (child := node.children.get(pattern[0])) is not None:
+            yield from self._expand(child, (*path, pattern[0]), pattern[1:])
+
+    def _walk(
+        self, node: _NamespaceNode, path: tuple[str, ...], max_depth: int | None
+    ) -> Iterator[tuple[str, ...]]:
+        """Iterate the namespaces at or below a node, in sorted order.
+
+        Below `max_depth` only the path at `max_depth` is yielded.
+        """
+        if max_depth is not None and len(path) >= max_depth:
+            if node.count:
+                yield path
+            return
+        if node.present:
+            yield path
+        for label in sorted(node.children):
+            yield from self._walk(node.children[label], (*path, label), max_depth)
+
+
+class _VectorIndex:
+    """Contiguous float32 matrix of the normalized embeddings of a store.
+
+    Each (namespace, key, path) embedding owns a row. Rows of deleted items are
+    zeroed and reused by later inserts.
+    """
+
+    __slots__ = ("source", "matrix", "size", "rows", "free")
+
+    def __init__(
+        self, vectors: dict[tuple[str, ...], dict[str, dict[str, list[float]]]]
+    ) -> None:
+        self.source = vectors
+        self.matrix: np.ndarray | None = None
+        self.size = 0
+        # [ns][key][path] -> row
+        self.rows: dict[tuple[str, ...], dict[str, dict[str, int]]] = {}
+        self.free: list[int] = []
+        for ns, keys in vectors.items():
+            for key, paths in keys.items():
+                for path, vector in paths.items():
+                    self.upsert(ns, key, path, vector)
+
+    def upsert(
+        self, ns: tuple[str, ...], key: str, path: str, vector: list[float]
+    ) -> None:
+        import numpy as np
+
+        arr = np.asarray(vector, dtype=np.float32)
+        if self.matrix is None:
+            self.matrix = np.zeros((16, len(arr)), dtype=np.float32)
+        paths = self.rows.setdefault(ns, {}).setdefault(key, {})
+        if (row := paths.get(path)) is None:
+            if self.free:
+                row = self.free.pop()
+            else:
+                if self.size == len(self.matrix):
+                    self.matrix = np.concatenate(
+                        [self.matrix, np.zeros_like(self.matrix)]
+                    )
+                row = self.size
+                self.size += 1
+            paths[path] = row
+        if norm := np.linalg.norm(arr):
+            arr /= norm
+        self.matrix[row] = arr
+
+    def delete(self, ns: tuple[str, ...], key: str) -> None:
+        if (keys := self.rows.get(ns)) and (paths := keys.pop(key, None)):
+            for row in paths.values():
+                self.matrix[row] = 0  # type: ignore[index]
+                self.free.append(row)
+
+    def score(
+        self,
+        queries: dict[str, list[float]],
+        requests: list[tuple[str, list[tuple[Item, list[list[float]]]]]],
+    ) -> list[np.ndarray]:
+        """Score the items of each (query, items) request.
+
+        The score of an item is the best cosine similarity among its embeddings,
+        or -inf for items without embeddings.
+        """
+        import numpy as np
+
+        results = [np.full(len(items), -np.inf) for _, items in requests]
+        # rows of each request, and for each item the offset of its first row
+        request_rows: list[tuple[list[int], list[int], list[int]]] = []
+        for _, items in requests:
+            rows: list[int] = []
+            owners: list[int] = []
+            starts: list[int] = []
+            namespace, keys = None, None
+            for j, (item, _) in enumerate(items):
+                if item.namespace is not namespace:
+                    namespace = item.namespace
+                    keys = self.rows.get(namespace, {})
+                if paths := keys.get(item.key):  # type: ignore[union-attr]
+                    owners.append(j)
+                    starts.append(len(rows))
+                    rows.extend(paths.values())
+            request_rows.append((rows, owners, starts))
+        all_rows = [row for rows, _, _ in request_rows for row in rows]
+        if not all_rows or self.matrix is None:
+            return results
+        # only copy out the rows in use when they're a small part of the matrix
+        if len(all_rows) * 2 < self.size:
+            used = np.unique(np.asarray(all_rows))
+            matrix = self.matrix[used]
+        else:
+            used = None
+            matrix = self.matrix[: self.size]
+        names = list(queries)
+        query_pos = {q: ix for ix, q in enumerate(names)}
+        query_matrix = np.asarray([queries[q] for q in names], dtype=np.float32)
+        norms = np.linalg.norm(query_matrix, axis=1, keepdims=True)
+        query_matrix /= np.where(norms == 0, 1, norms)
+        similarities = query_matrix @ matrix.T
+        for result, (query, _), (rows, owners, starts) in zip(
+            results, requests, request_rows
+        ):
+            if not rows:
+                continue
+            pos = np.asarray(rows)
+            if used is not None:
+                pos = np.searchsorted(used, pos)
+            # max pooling over the embeddings of each item
+            result[owners] = np.maximum.reduceat(
+                similarities[query_pos[query], pos], starts
+            )
+        return results
+
+
+def _top_k(
+    op: SearchOp,
+    candidates: list[tuple[Item, list[list[float]]]],
+    scores: np.ndarray,
+) -> list[SearchItem]:
+    """Select the page of best scoring candidates requested by a search op."""
+    import numpy as np
+
+    scored = np.flatnonzero(scores > -np.inf)
+    k = op.offset + op.limit
+    if len(scored) > k:
+        # keep everything tied with the k-th best score, so ties below are
+        # broken by candidate order, as in a full sort
+        kth = scored[np.argpartition(-scores[scored], k - 1)[k - 1]]
+        scored = scored[scores[scored] >= scores[kth]]
+    # stable sort, so that ties keep the order of the candidates
+    top = scored[np.argsort(-scores[scored], kind="stable")][op.offset : k]
+    kept: list[tuple[float | None, Item]] = [
+        (float(scores[j]), candidates[j][0]) for j in top
+    ]
+    if len(kept) < op.limit and len(scored) < len(candidates):
+        # Corner case: if we request more items than what we have embedded,
+        # fill the rest with non-scored items
+        kept.extend(
+            (None, candidates[j][0])
+            for j in np.flatnonzero(scores == -np.inf)[: op.limit - len(kept)]
+        )
+    return [
+        SearchItem(
+            namespace=item.namespace,
+            key=item.key,
+            value=item.value,
+            created_at=item.created_at,
+            updated_at=item.updated_at,
+            score=score,
+        )
+        for score, item in kept
+    ]
 
 
 @functools.lru_cache(maxsize=1)
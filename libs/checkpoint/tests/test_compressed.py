@@ -0,0 +1,61 @@
+import pytest
+
+from langgraph.checkpoint.serde.base import CipherProtocol
+from langgraph.checkpoint.serde.compressed import CompressedSerializer
+from langgraph.checkpoint.serde.encrypted import EncryptedSerializer
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+
+class XorCipher(CipherProtocol):
+    def encrypt(self, plaintext: bytes) -> tuple[str, bytes]:
+        return "xor", bytes(b ^ 42 for b in plaintext)
+
+    def decrypt(self, ciphername: str, ciphertext: bytes) -> bytes:
+        assert ciphername == "xor"
+        return bytes(b ^ 42 for b in ciphertext)
+
+
+def test_compressed_serializer() -> None:
+    serde = CompressedSerializer(codec="zlib", threshold=100)
+    messages = [{"role": "user", "content": "hello " * 10}] * 20
+
+    typ, data = serde.dumps_typed(messages)
+    assert typ == "msgpack+zlib"
+    assert len(data) < len(JsonPlusSerializer().dumps_typed(messages)[1])
+    assert serde.loads_typed((typ, data)) == messages
+
+    # small values are stored as is
+    assert serde.dumps_typed({"a": 1})[0] == "msgpack"
+    assert serde.loads_typed(serde.dumps_typed({"a": 1})) == {"a": 1}
+
+    # values stored without compression still load
+    assert serde.loads_typed(JsonPlusSerializer().dumps_typed(messages)) == messages
+
+
+def test_compressed_serializer_thresholds() -> None:
+    serde = CompressedSerializer(codec="zlib", threshold=0, thresholds={"bytes": None})
+    assert serde.dumps_typed(b"a" * 1000) == ("bytes", b"a" * 1000)
+    assert serde.dumps_typed(bytearray(1000))[0] == "bytearray+zlib"
+    # data that doesn't compress is stored as is
+    assert serde.dumps_typed("a")[0] == "msgpack"
+
+
+def test_compressed_serializer_unknown_codec() -> None:
+    with pytest.raises(ValueError, match="Unknown compression codec"):
+        CompressedSerializer(codec="brotli")  # type: ignore[arg-type]
+
+
+def test_compressed_serializer_encrypted() -> None:
+    compressed = CompressedSerializer(codec="zlib", threshold=100)
+    serde = EncryptedSerializer(XorCipher(), compressed)
+    value = {"docs": ["some document"] * 50}
+
+    typ, data = serde.dumps_typed(value)
+    assert typ == "msgpack+zlib+xor"
+    assert serde.loads_typed((typ, data)) == value
+
+    # rows stored before compression was added still load
+    assert (
+        serde.loads_typed(EncryptedSerializer(XorCipher()).dumps_typed(value)) == value
+    )
+    assert serde.loads_typed(JsonPlusSerializer().dumps_typed(value)) == value
@@ -12,16 +12,21 @@ from zoneinfo import ZoneInfo
 
 import dataclasses_json
 import numpy as np
+import ormsgpack
 import pandas as pd
 import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from pydantic import BaseModel, SecretStr
 from pydantic.v1 import BaseModel as BaseModelV1
 from pydantic.v1 import SecretStr as SecretStrV1
 
 from langgraph.checkpoint.serde.jsonplus import (
+    EXT_PYDANTIC_V2,
     JsonPlusSerializer,
+    _msgpack_enc,
     _msgpack_ext_hook_to_json,
 )
+from langgraph.checkpoint.serde.lazy import LazyChannelValues
 from langgraph.store.base import Item
 
 
@@ -288,6 +293,21 @@ def test_serde_jsonplus_bytes() -> None:
     assert serde.loads_typed(dumped) == some_bytes
 
 
+def test_serde_jsonplus_lazy_channel_values() -> None:
+    serde = JsonPlusSerializer()
+
+    values = LazyChannelValues(
+        lambda _, blob: serde.loads_typed(blob),
+        {"docs": serde.dumps_typed(["a", "b"])},
+        {"count": 1},
+    )
+    checkpoint = {"id": "1", "channel_values": values}
+    expected = {"id": "1", "channel_values": {"count": 1, "docs": ["a", "b"]}}
+
+    assert serde.loads_typed(serde.dumps_typed(checkpoint)) == expected
+    assert serde.loads(serde.dumps(checkpoint)) == expected
+
+
 def test_serde_jsonplus_bytearray() -> None:
     serde = JsonPlusSerializer()
 
@@ -317,6 +337,49 @@ def test_serde_jsonplus_numpy_array(arr: np.ndarray) -> None:
     assert np.array_equal(result, arr)
 
 
+@pytest.mark.parametrize(
+    "arr",
+    [
+        np.arange(9, dtype=np.int32).reshape(3, 3),
+        np.arange(4, dtype=np.complex128),
+        np.array(1.5),
+        np.zeros((0, 3), dtype=np.float32),
+        np.array(["2024-01-01"], dtype="datetime64[ns]"),
+    ],
+)
+def test_serde_jsonplus_numpy_array_zero_copy(arr: np.ndarray) -> None:
+    serde = JsonPlusSerializer(zero_copy=True)
+
+    dumped = serde.dumps_typed(arr)
+    assert dumped[0].startswith("ndarray:")
+    assert isinstance(dumped[1], memoryview)
+    if arr.size:
+        # empty arrays have no memory to share
+        assert np.shares_memory(np.frombuffer(dumped[1], dtype=np.uint8), arr)
+    # loaded from the stored bytes, also without zero_copy
+    for loader in (serde, JsonPlusSerializer()):
+        result = loader.loads_typed((dumped[0], bytes(dumped[1])))
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == arr.dtype
+        assert result.shape == arr.shape
+        assert np.array_equal(result, arr)
+
+
+@pytest.mark.parametrize(
+    "arr",
+    [
+        np.asfortranarray(np.arange(9, dtype=np.float64).reshape(3, 3)),
+        np.arange(12, dtype=np.int16)[::2].reshape(3, 2),
+    ],
+)
+def test_serde_jsonplus_numpy_array_zero_copy_fallback(arr: np.ndarray) -> None:
+    serde = JsonPlusSerializer(zero_copy=True)
+
+    dumped = serde.dumps_typed(arr)
+    assert dumped[0] == "msgpack"
+    assert np.array_equal(serde.loads_typed(dumped), arr)
+
+
 @pytest.mark.parametrize(
     "arr",
     [
@@ -469,3 +532,39 @@ def test_serde_jsonplus_pandas_series(series: pd.Series) -> None:
     result = serde.loads_typed(dumped)
 
     assert result.equals(series)
+
+
+def test_serde_jsonplus_messages() -> None:
+    serde = JsonPlusSerializer()
+    messages = [
+        HumanMessage("hi", id="1", name="user", custom="extra"),
+        AIMessage(
+            "",
+            id="2",
+            tool_calls=[{"name": "search", "args": {"q": "x"}, "id": "c1"}],
+            usage_metadata={"input_tokens": 1, "output_tokens": 2, "total_tokens": 3},
+        ),
+        ToolMessage("result", tool_call_id="c1"),
+        # values model_dump() converts don't take the fast path
+        AIMessage("", id="3", additional_kwargs={"parsed": InnerPydantic(hello="x")}),
+    ]
+
+    # the fast path for messages encodes the same as model_dump
+    for message in messages:
+        assert _msgpack_enc(message) == ormsgpack.packb(
+            ormsgpack.Ext(
+                EXT_PYDANTIC_V2,
+                _msgpack_enc(
+                    (
+                        message.__class__.__module__,
+                        message.__class__.__name__,
+                        message.model_dump(),
+                        "model_validate_json",
+                    )
+                ),
+            )
+        )
+
+    # encoders are cached per type, so encode twice
+    for _ in range(2):
+        assert serde.loads_typed(serde.dumps_typed(messages[:3])) == messages[:3]
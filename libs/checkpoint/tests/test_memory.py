@@ -6,6 +6,7 @@ from langchain_core.runnables import RunnableConfig
 from langgraph.checkpoint.base import (
     Checkpoint,
     CheckpointMetadata,
+    LazyChannelValues,
     create_checkpoint,
     empty_checkpoint,
 )
@@ -192,3 +193,310 @@ def test_memory_saver() -> None:
     from langgraph.checkpoint.memory import InMemorySaver
 
     assert isinstance(InMemorySaver(), InMemorySaver)
+
+
+def test_memory_saver_delta_chain() -> None:
+    saver = InMemorySaver(delta_chain_length=2)
+    config: RunnableConfig = {"configurable": {"thread_id": "1", "checkpoint_ns": ""}}
+    checkpoint = empty_checkpoint()
+    messages: list[str] = []
+    for i in range(5):
+        messages = messages + [f"msg-{i}"]
+        checkpoint = create_checkpoint(checkpoint, {}, i)
+        checkpoint["channel_values"] = {"messages": messages}
+        checkpoint["channel_versions"] = {"messages": i + 1}
+        config = saver.put(config, checkpoint, {}, {"messages": i + 1})
+
+    # full value, two deltas, full value (compaction), one delta
+    assert [
+        saver.blobs[("1", "", "messages", v)][0].endswith("+delta") for v in range(1, 6)
+    ] == [False, True, True, False, True]
+
+    history = list(saver.list({"configurable": {"thread_id": "1"}}))
+    assert len(history) == 5
+    for i, tup in enumerate(reversed(history)):
+        assert tup.checkpoint["channel_values"] == {
+            "messages": [f"msg-{j}" for j in range(i + 1)]
+        }
+
+    # lists extended in place only store the new items
+    messages.append("msg-5")
+    checkpoint = create_checkpoint(checkpoint, {}, 5)
+    checkpoint["channel_values"] = {"messages": messages + ["msg-6"]}
+    checkpoint["channel_versions"] = {"messages": 6}
+    config = saver.put(config, checkpoint, {}, {"messages": 6})
+    assert saver.blobs[("1", "", "messages", 6)][0].endswith("+delta")
+    tup = saver.get_tuple(config)
+    assert tup is not None
+    assert tup.checkpoint["channel_values"] == {
+        "messages": [f"msg-{j}" for j in range(7)]
+    }
+
+    # lists with replaced items are stored in full
+    items = [{"v": 1}]
+    checkpoint = create_checkpoint(checkpoint, {}, 6)
+    checkpoint["channel_values"] = {"messages": items}
+    checkpoint["channel_versions"] = {"messages": 7}
+    config = saver.put(config, checkpoint, {}, {"messages": 7})
+    checkpoint = create_checkpoint(checkpoint, {}, 7)
+    checkpoint["channel_values"] = {"messages": [{"v": 99}, {"v": 2}]}
+    checkpoint["channel_versions"] = {"messages": 8}
+    config = saver.put(config, checkpoint, {}, {"messages": 8})
+    assert not saver.blobs[("1", "", "messages", 8)][0].endswith("+delta")
+    tup = saver.get_tuple(config)
+    assert tup is not None
+    assert tup.checkpoint["channel_values"] == {"messages": [{"v": 99}, {"v": 2}]}
+
+    saver.delete_thread("1")
+    assert not saver.blobs
+    assert not saver.delta_heads
+
+
+def test_memory_saver_lazy_channel_values() -> None:
+    saver = InMemorySaver()
+    config: RunnableConfig = {"configurable": {"thread_id": "1", "checkpoint_ns": ""}}
+    checkpoint = create_checkpoint(empty_checkpoint(), {}, 1)
+    checkpoint["channel_values"] = {"docs": ["a", "b"], "count": 2}
+    checkpoint["channel_versions"] = {"docs": 1, "count": 1}
+    config = saver.put(config, checkpoint, {}, {"docs": 1, "count": 1})
+
+    tup = saver.get_tuple(config)
+    assert tup is not None
+    values = tup.checkpoint["channel_values"]
+    assert isinstance(values, LazyChannelValues)
+    assert set(values) == {"docs", "count"}
+    assert not values.is_loaded("docs")
+    assert not values.is_loaded("count")
+
+    assert values["count"] == 2
+    assert values.is_loaded("count")
+    assert not values.is_loaded("docs")
+
+    # copying and deleting don't deserialize
+    copy = values.copy()
+    del copy["docs"]
+    assert "docs" not in copy
+    assert not values.is_loaded("docs")
+    assert values == {"docs": ["a", "b"], "count": 2}
+
+
+def test_memory_saver_list_metadata_only() -> None:
+    saver = InMemorySaver()
+    config: RunnableConfig = {"configurable": {"thread_id": "1", "checkpoint_ns": ""}}
+    checkpoint = empty_checkpoint()
+    for i in range(3):
+        checkpoint = create_checkpoint(checkpoint, {}, i)
+        checkpoint["channel_values"] = {"count": i}
+        checkpoint["channel_versions"] = {"count": i + 1}
+        config = saver.put(config, checkpoint, {"step": i}, {"count": i + 1})
+        saver.put_writes(config, [("count", i + 1)], "task")
+
+    full = list(saver.list({"configurable": {"thread_id": "1"}}))
+    projected = list(
+        saver.list({"configurable": {"thread_id": "1"}}, metadata_only=True)
+    )
+    assert [t.config for t in projected] == [t.config for t in full]
+    assert [t.parent_config for t in projected] == [t.parent_config for t in full]
+    assert [t.metadata["step"] for t in projected] == [2, 1, 0]
+    assert all(t.checkpoint["channel_values"] == {} for t in projected)
+    assert all(t.pending_writes is None for t in projected)
+    assert full[0].pending_writes == [("task", "count", 3)]
+
+
+def test_memory_saver_path(tmp_path: Any, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = str(tmp_path / "checkpoints.log")
+
+    def run(saver: InMemorySaver, thread_id: str, steps: int) -> RunnableConfig:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+        }
+        checkpoint = empty_checkpoint()
+        for i in range(steps):
+            checkpoint = create_checkpoint(checkpoint, {}, i)
+            checkpoint["channel_values"] = {"count": i}
+            checkpoint["channel_versions"] = {"count": i + 1}
+            config = saver.put(config, checkpoint, {"step": i}, {"count": i + 1})
+            saver.put_writes(config, [("count", i + 1)], "task")
+        return config
+
+    def state(saver: InMemorySaver) -> tuple:
+        return (
+            {t: {ns: dict(c) for ns, c in v.items()} for t, v in saver.storage.items()},
+            dict(saver.writes),
+            dict(saver.blobs),
+        )
+
+    with InMemorySaver(path=path) as saver:
+        run(saver, "1", 3)
+        run(saver, "2", 2)
+        saver.delete_thread("2")
+        expected = state(saver)
+    assert not (tmp_path / "checkpoints.log.snapshot").exists()
+
+    # changes are replayed from the log
+    with InMemorySaver(path=path) as saver:
+        assert state(saver) == expected
+        tup = saver.get_tuple({"configurable": {"thread_id": "1"}})
+        assert tup is not None
+        assert tup.checkpoint["channel_values"] == {"count": 2}
+        assert tup.pending_writes == [("task", "count", 3)]
+
+    # the log is compacted into a snapshot once large enough
+    monkeypatch.setattr(
+        "langgraph.checkpoint.memory._CheckpointLog.MIN_COMPACT_SIZE", 0
+    )
+    with InMemorySaver(path=path) as saver:
+        config = run(saver, "3", 5)
+        expected = state(saver)
+    assert (tmp_path / "checkpoints.log.snapshot").exists()
+    monkeypatch.undo()
+    with InMemorySaver(path=path) as saver:
+        assert state(saver) == expected
+
+    # a torn record at the end of the log is discarded
+    size = (tmp_path / "checkpoints.log").stat().st_size
+    with InMemorySaver(path=path) as saver:
+        saver.put_writes(config, [("count", 10)], "other")
+    with open(path, "r+b") as f:
+        f.truncate((tmp_path / "checkpoints.log").stat().st_size - 1)
+    with InMemorySaver(path=path) as saver:
+        assert state(saver) == expected
+        saver.put_writes(config, [("count", 11)], "other")
+    assert (tmp_path / "checkpoints.log").stat().st_size > size
+    with InMemorySaver(path=path) as saver:
+        tup = saver.get_tuple(config)
+        assert tup is not None
+        assert tup.pending_writes is not None
+        assert ("other", "count", 11) in tup.pending_writes
+
+    with pytest.raises(ValueError, match="factory"):
+        InMemorySaver(path=path, factory=dict)  # type: ignore[arg-type]
+
+
+def test_memory_saver_thread_index() -> None:
+    saver = InMemorySaver()
+    configs: dict[str, list[RunnableConfig]] = {}
+    for thread_id in ("1", "2"):
+        config: RunnableConfig = {
+            "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+        }
+        checkpoint = empty_checkpoint()
+        for i in range(5):
+            checkpoint = create_checkpoint(checkpoint, {}, i)
+            checkpoint["channel_values"] = {"count": i}
+            checkpoint["channel_versions"] = {"count": i + 1}
+            config = saver.put(config, checkpoint, {"step": i}, {"count": i + 1})
+            saver.put_writes(config, [("count", i + 1)], "task")
+            configs.setdefault(thread_id, []).append(config)
+
+    thread_1: RunnableConfig = {"configurable": {"thread_id": "1"}}
+    latest = saver.get_tuple(thread_1)
+    assert latest is not None
+    assert latest.config == configs["1"][-1]
+    assert [
+        t.config for t in saver.list(thread_1, before=configs["1"][3], limit=2)
+    ] == [configs["1"][2], configs["1"][1]]
+    assert [t.config for t in saver.list(thread_1, before=configs["1"][0])] == []
+
+    # checkpoints stored directly, e.g. loaded from disk, are picked up
+    saved = saver.storage["1"][""][configs["1"][0]["configurable"]["checkpoint_id"]]
+    saver.storage["1"][""]["0"] = saved
+    assert [t.config["configurable"]["checkpoint_id"] for t in saver.list(thread_1)][
+        -1
+    ] == "0"
+
+    # checkpoints saved while listing don't change the results
+    listed = saver.list(thread_1)
+    first = next(listed)
+    saver.put(first.config, empty_checkpoint(), {"step": 5}, {})
+    assert [first.config] + [t.config for t in listed] == [
+        *reversed(configs["1"]),
+        {"configurable": {"thread_id": "1", "checkpoint_ns": "", "checkpoint_id": "0"}},
+    ]
+
+    # writes replaced directly, without changing their number, are picked up
+    outer_key = next(k for k in saver.writes if k[0] == "1")
+    saver.writes[(*outer_key[:2], "replaced")] = saver.writes.pop(outer_key)
+
+    saver.delete_thread("1")
+    assert saver.get_tuple(thread_1) is None
+    assert all(k[0] == "2" for k in saver.writes)
+    assert all(k[0] == "2" for k in saver.blobs)
+    assert len(list(saver.list({"configurable": {"thread_id": "2"}}))) == 5
+    saver.delete_thread("2")
+    assert not saver.writes
+    assert not saver.blobs
+
+
+def test_memory_saver_dedupe_blobs(tmp_path: Any) -> None:
+    path = str(tmp_path / "checkpoints.log")
+    docs = ["a shared document"] * 10
+
+    def put(saver: InMemorySaver, thread_id: str) -> RunnableConfig:
+        config: RunnableConfig = {
+            "configurable": {"thread_id": thread_id, "checkpoint_ns": ""}
+        }
+        checkpoint = empty_checkpoint()
+        checkpoint["channel_values"] = {"docs": docs, "count": int(thread_id)}
+        checkpoint["channel_versions"] = {"docs": 1, "count": 1}
+        return saver.put(config, checkpoint, {}, {"docs": 1, "count": 1})
+
+    with InMemorySaver(path=path, dedupe_blobs=True) as saver:
+        configs = [put(saver, thread_id) for thread_id in ("1", "2", "3")]
+        # identical values share a single copy
+        assert (
+            saver.blobs[("1", "", "docs", 1)][1] is saver.blobs[("2", "", "docs", 1)][1]
+        )
+        assert len(saver.blob_contents) == 4
+        saver.delete_thread("1")
+        for config in configs[1:]:
+            tup = saver.get_tuple(config)
+            assert tup is not None
+            assert tup.checkpoint["channel_values"]["docs"] == docs
+
+    # references are rebuilt when loaded back, and released on delete
+    with InMemorySaver(path=path, dedupe_blobs=True) as saver:
+        assert (
+            saver.blobs[("2", "", "docs", 1)][1] is saver.blobs[("3", "", "docs", 1)][1]
+        )
+        assert len(saver.blob_contents) == 3
+        saver.delete_thread("2")
+        assert len(saver.blob_contents) == 2
+        saver.delete_thread("3")
+        assert not saver.blob_contents
+
+
+@pytest.mark.parametrize("dedupe_blobs", [False, True])
+def test_memory_saver_zero_copy(tmp_path: Any, dedupe_blobs: bool) -> None:
+    import numpy as np
+
+    from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+    path = str(tmp_path / "checkpoints.log")
+    serde = JsonPlusSerializer(zero_copy=True)
+    arr = np.arange(4, dtype=np.int64)
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {"arr": arr}
+    checkpoint["channel_versions"] = {"arr": 1}
+    with InMemorySaver(path=path, serde=serde, dedupe_blobs=dedupe_blobs) as saver:
+        # the blob is written to the log, so can't be a memoryview
+        config = saver.put(
+            {"configurable": {"thread_id": "1", "checkpoint_ns": ""}},
+            checkpoint,
+            {},
+            {"arr": 1},
+        )
+        saver.put_writes(config, [("arr", arr)], "task")
+
+        # the saved values are copies, not views of the array
+        arr[0] = 42
+        tup = saver.get_tuple(config)
+        assert tup is not None
+        assert tup.checkpoint["channel_values"]["arr"].tolist() == [0, 1, 2, 3]
+        assert tup.pending_writes is not None
+        assert tup.pending_writes[0][2].tolist() == [0, 1, 2, 3]
+
+    with InMemorySaver(path=path, serde=serde, dedupe_blobs=dedupe_blobs) as saver:
+        tup = saver.get_tuple(config)
+        assert tup is not None
+        assert tup.checkpoint["channel_values"]["arr"].tolist() == [0, 1, 2, 3]
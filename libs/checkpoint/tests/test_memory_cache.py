@@ -0,0 +1,95 @@
+"""Unit tests for in-memory cache implementation."""
+
+import time
+
+import pytest
+
+from langgraph.cache.base import FullKey
+from langgraph.cache.memory import InMemoryCache
+
+
+def _keys(n: int) -> list[FullKey]:
+    return [(("graph", "node"), f"key{i}") for i in range(n)]
+
+
+def test_ttl_expiry() -> None:
+    cache: InMemoryCache = InMemoryCache()
+    short, long, forever = _keys(3)
+    cache.set({short: (1, 1), long: (2, 60), forever: (3, None)})
+    assert cache.get([short, long, forever]) == {short: 1, long: 2, forever: 3}
+
+    time.sleep(1.1)
+    # expired entries are swept by any operation, not only a get of that key
+    cache.set({(("other",), "key"): (4, None)})
+    assert cache.stats()["expirations"] == 1
+    assert cache.stats()["entries"] == 3
+    assert cache.get([short, long, forever]) == {long: 2, forever: 3}
+
+    # overwriting a key replaces its expiry
+    cache.set({long: (5, 1)})
+    cache.set({long: (6, None)})
+    time.sleep(1.1)
+    assert cache.get([long]) == {long: 6}
+
+
+def test_max_entries_lru() -> None:
+    cache: InMemoryCache = InMemoryCache(max_entries=3)
+    k0, k1, k2, k3 = _keys(4)
+    cache.set({k0: (0, None), k1: (1, None), k2: (2, None)})
+    cache.get([k0])
+    cache.set({k3: (3, None)})
+    assert cache.get([k0, k1, k2, k3]) == {k0: 0, k2: 2, k3: 3}
+    assert cache.stats() == {
+        "hits": 4,
+        "misses": 1,
+        "evictions": 1,
+        "expirations": 0,
+        "entries": 3,
+        "bytes": cache.stats()["bytes"],
+    }
+
+
+def test_max_entries_lfu() -> None:
+    cache: InMemoryCache = InMemoryCache(max_entries=3, eviction="lfu")
+    k0, k1, k2, k3 = _keys(4)
+    cache.set({k0: (0, None), k1: (1, None), k2: (2, None)})
+    cache.get([k0, k1, k0, k1])
+    cache.get([k2])
+    # k2 is the most recently used, but the least frequently used
+    cache.set({k3: (3, None)})
+    assert cache.get([k0, k1, k2, k3]) == {k0: 0, k1: 1, k3: 3}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_max_bytes() -> None:
+    cache: InMemoryCache = InMemoryCache(max_bytes=100)
+    k0, k1, k2 = _keys(3)
+    cache.set({k0: ("a" * 40, None), k1: ("b" * 40, None)})
+    assert cache.stats()["entries"] == 2
+    cache.set({k2: ("c" * 40, None)})
+    assert cache.get([k0, k1, k2]) == {k1: "b" * 40, k2: "c" * 40}
+    assert cache.stats()["bytes"] <= 100
+
+    # values larger than the limit are not cached, and replace older values
+    cache.set({k1: ("d" * 200, None)})
+    assert cache.get([k1]) == {}
+
+
+def test_clear_namespace() -> None:
+    cache: InMemoryCache = InMemoryCache(max_entries=2)
+    a: FullKey = (("a",), "key")
+    b: FullKey = (("b",), "key")
+    cache.set({a: (1, 60), b: (2, None)})
+    cache.clear([("a",)])
+    assert cache.stats()["entries"] == 1
+    cache.set({a: (3, None)})
+    assert cache.get([a, b]) == {a: 3, b: 2}
+    assert cache.stats()["evictions"] == 0
+    cache.clear()
+    assert cache.get([a, b]) == {}
+    assert cache.stats()["entries"] == 0
+
+
+def test_invalid_eviction() -> None:
+    with pytest.raises(ValueError, match="eviction"):
+        InMemoryCache(eviction="fifo")  # type: ignore[arg-type]
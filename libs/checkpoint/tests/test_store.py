@@ -12,19 +12,28 @@ from langgraph.store.base import (
     GetOp,
     InvalidNamespaceError,
     Item,
+    ListNamespacesOp,
+    MatchCondition,
     Op,
     PutOp,
     Result,
+    SearchOp,
     get_text_at_path,
 )
-from langgraph.store.base.batch import AsyncBatchedBaseStore
+from langgraph.store.base.batch import AsyncBatchedBaseStore, _dedupe_ops
 from langgraph.store.memory import InMemoryStore
 from tests.embed_test_utils import CharacterEmbeddings
 
 
 class MockAsyncBatchedStore(AsyncBatchedBaseStore):
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__()
+    def __init__(
+        self,
+        *,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
         self._store = InMemoryStore(**kwargs)
 
     def batch(self, ops: Iterable[Op]) -> list[Result]:
@@ -427,6 +436,75 @@ def test_list_namespaces_empty_store() -> None:
     assert result == []
 
 
+def test_list_namespaces_matches_scan() -> None:
+    store = InMemoryStore()
+    labels = ["a", "b", "c"]
+    namespaces = [
+        (x, y, z)[:depth]
+        for x in labels
+        for y in labels
+        for z in labels
+        for depth in (1, 2, 3)
+    ]
+    for i, ns in enumerate(dict.fromkeys(namespaces)):
+        store.put(ns, "key", {"i": i})
+    store.put(("a", "b", "0"), "key", {"i": 100})
+    # namespaces left without items are no longer listed
+    store.delete(("b", "a"), "key")
+    store.delete(("c",), "key")
+    present = {ns for ns, items in store._data.items() if items}
+    assert ("b", "a") not in present and ("b", "a", "a") in present
+
+    def scan(
+        prefix: tuple[str, ...] | None,
+        suffix: tuple[str, ...] | None,
+        max_depth: int | None,
+    ) -> list[tuple[str, ...]]:
+        matches = [
+            ns
+            for ns in present
+            if (prefix is None or _matches(ns, prefix))
+            and (suffix is None or _matches(ns[::-1], suffix[::-1]))
+        ]
+        return sorted({ns[:max_depth] if max_depth else ns for ns in matches})
+
+    for prefix in [None, ("a",), ("*", "b"), ("c", "*", "*"), ("b", "a")]:
+        for suffix in [None, ("a",), ("*", "c")]:
+            for max_depth in [None, 1, 2]:
+                expected = scan(prefix, suffix, max_depth)
+                assert (
+                    store.list_namespaces(
+                        prefix=prefix, suffix=suffix, max_depth=max_depth, limit=100
+                    )
+                    == expected
+                )
+                assert (
+                    store.list_namespaces(
+                        prefix=prefix,
+                        suffix=suffix,
+                        max_depth=max_depth,
+                        limit=3,
+                        offset=2,
+                    )
+                    == expected[2:5]
+                )
+
+    # search returns items in the order their namespaces were created
+    assert [item.value["i"] for item in store.search(("a", "b"), limit=100)] == [
+        5,
+        6,
+        7,
+        8,
+        100,
+    ]
+
+
+def _matches(ns: tuple[str, ...], pattern: tuple[str, ...]) -> bool:
+    return len(ns) >= len(pattern) and all(
+        p in ("*", label) for label, p in zip(ns, pattern)
+    )
+
+
 async def test_cannot_put_empty_namespace() -> None:
     store = InMemoryStore()
     doc = {"foo": "bar"}
@@ -580,6 +658,78 @@ async def test_async_batch_store_deduplication(mocker: MockerFixture) -> None:
     abatch.reset_mock()
 
 
+def test_dedupe_ops_hashes_filters() -> None:
+    ops: list[Op] = [
+        SearchOp(("a",), {"x": {"$gt": 1}, "y": [1, 2]}),
+        SearchOp(("a",), {"y": [1, 2], "x": {"$gt": 1}}),
+        SearchOp(("a",), {"y": (1, 2), "x": {"$gt": 1}}),
+        SearchOp(("a",), {"x": {"$gt": 1}}, query="q"),
+        SearchOp(("a",), {"x": {1, 2}}),
+        SearchOp(("a",), {"x": {1, 2}}),
+        GetOp(("a",), "b"),
+        ListNamespacesOp(match_conditions=(MatchCondition("prefix", ("a",)),)),
+        GetOp(("a",), "b"),
+        ListNamespacesOp(match_conditions=(MatchCondition("prefix", ("a",)),)),
+        # unhashable values are never merged
+        SearchOp(("a",), {"x": bytearray(b"1")}),
+        SearchOp(("a",), {"x": bytearray(b"1")}),
+    ]
+    listen, dedupped = _dedupe_ops(ops)
+    assert listen == [0, 0, 1, 2, 3, 3, 4, 5, 4, 5, 6, 7]
+    assert dedupped == [ops[i] for i in (0, 2, 3, 4, 6, 7, 10, 11)]
+
+
+async def test_async_batch_store_max_batch_size(mocker: MockerFixture) -> None:
+    abatch = mocker.spy(InMemoryStore, "batch")
+    store = MockAsyncBatchedStore(max_batch_size=2)
+
+    await asyncio.gather(
+        *(store.aput(("test",), f"key{i}", {"i": i}) for i in range(3)),
+        store.aget(("test",), "key2"),
+    )
+    assert [len(c.args[1]) for c in abatch.call_args_list] == [2, 2]
+    # sub-batches run in order, so reads see earlier writes
+    assert (await store.aget(("test",), "key2")).value == {"i": 2}  # type: ignore[union-attr]
+    results = await asyncio.gather(
+        *(store.aget(("test",), f"key{i}") for i in range(3))
+    )
+    assert [r.value for r in results] == [{"i": 0}, {"i": 1}, {"i": 2}]  # type: ignore[union-attr]
+
+    with pytest.raises(ValueError, match="max_batch_size"):
+        MockAsyncBatchedStore(max_batch_size=0)
+
+
+async def test_async_batch_store_max_wait(mocker: MockerFixture) -> None:
+    abatch = mocker.spy(InMemoryStore, "batch")
+    store = MockAsyncBatchedStore(max_batch_size=3, max_wait_ms=50)
+
+    async def delayed_get(delay: float, key: str) -> Item | None:
+        await asyncio.sleep(delay)
+        return await store.aget(("test",), key)
+
+    # ops from later ticks join the open batch, until it is full
+    await asyncio.gather(
+        store.aput(("test",), "a", {"v": 1}),
+        delayed_get(0.005, "a"),
+        delayed_get(0.01, "b"),
+        delayed_get(0.02, "c"),
+    )
+    assert [len(c.args[1]) for c in abatch.call_args_list] == [3, 1]
+    assert store.batch_stats() == {
+        "batches": 2,
+        "ops": 4,
+        "dedupped_ops": 4,
+        "max_batch": 3,
+    }
+
+    # the batch is sent once the window closes
+    abatch.reset_mock()
+    start = asyncio.get_running_loop().time()
+    assert await store.aget(("test",), "a") is not None
+    assert asyncio.get_running_loop().time() - start >= 0.04
+    assert len(abatch.call_args_list) == 1
+
+
 @pytest.fixture
 def fake_embeddings() -> CharacterEmbeddings:
     return CharacterEmbeddings(dims=500)
@@ -917,6 +1067,53 @@ async def test_async_vector_search_pagination(
     assert len(all_results) == 5
 
 
+def test_vector_index_matches_python_scoring(
+    fake_embeddings: CharacterEmbeddings, mocker: MockerFixture
+) -> None:
+    store = InMemoryStore(
+        index={
+            "dims": fake_embeddings.dims,
+            "embed": fake_embeddings,
+            "fields": ["text", "tags[*]"],
+        }
+    )
+    words = ["apple", "banana", "cherry", "grape", "lemon", "mango", "peach"]
+    for i in range(40):
+        store.put(
+            ("docs", f"user{i % 3}"),
+            f"doc{i}",
+            {"text": words[i % 7] * (i % 4 + 1), "tags": [words[(i * 3) % 7] + "s"]},
+        )
+    store.put(("docs", "user0"), "plain", {"other": "no text"})
+    # deleted rows are reused by later inserts
+    for i in range(0, 40, 5):
+        store.delete(("docs", f"user{i % 3}"), f"doc{i}")
+    store.put(("docs", "user1"), "doc0", {"text": "peach", "tags": []})
+    assert store._index is not None
+    assert store._index.size <= 80
+
+    def search_all() -> list[list[tuple[str, float | None]]]:
+        return [
+            [
+                (r.key, r.score)
+                for r in store.search(prefix, query=query, limit=limit, offset=offset)
+            ]
+            for prefix in [("docs",), ("docs", "user0"), ("nothing",)]
+            for query in ["apple", "mangomango", "kiwi"]
+            for limit, offset in [(5, 0), (4, 3), (50, 0)]
+        ]
+
+    indexed = search_all()
+    mocker.patch("langgraph.store.memory._check_numpy", return_value=False)
+    expected = search_all()
+    assert [[key for key, _ in r] for r in indexed] == [
+        [key for key, _ in r] for r in expected
+    ]
+    for got, want in zip(indexed, expected):
+        for (_, a), (_, b) in zip(got, want):
+            assert a == pytest.approx(b, abs=1e-5)
+
+
 async def test_embed_with_path(fake_embeddings: CharacterEmbeddings) -> None:
     # Test store-level field configuration
     store = InMemoryStore(
@@ -3,13 +3,17 @@ from uuid import uuid4
 
 from langchain_core.messages import HumanMessage
 from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
 from pyperf._runner import Runner
 from uvloop import new_event_loop
 
 from bench.fanout_to_subgraph import fanout_to_subgraph, fanout_to_subgraph_sync
+from bench.parallel_sync import parallel_sync
 from bench.pydantic_state import pydantic_state
 from bench.react_agent import react_agent
 from bench.sequential import create_sequential
+from bench.serde import dumps, loads, messages_state
+from bench.sparse_fanout import sparse_fanout
 from bench.wide_dict import wide_dict
 from bench.wide_state import wide_state
 from langgraph.graph import StateGraph
@@ -256,6 +260,38 @@ benchmarks = (
             ]
         },
     ),
+    (
+        "wide_state_25x300_500keys",
+        wide_state(300, extra_keys=500).compile(checkpointer=None),
+        wide_state(300, extra_keys=500).compile(checkpointer=None),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(5)
+                    }
+                    for i in range(5)
+                }
+            ]
+        },
+    ),
+    (
+        "wide_state_25x300_500keys_checkpoint",
+        wide_state(300, extra_keys=500).compile(checkpointer=InMemorySaver()),
+        wide_state(300, extra_keys=500).compile(checkpointer=InMemorySaver()),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(5)
+                    }
+                    for i in range(5)
+                }
+            ]
+        },
+    ),
     (
         "wide_dict_25x300",
         wide_dict(300).compile(checkpointer=None),
@@ -352,6 +388,38 @@ benchmarks = (
             ]
         },
     ),
+    (
+        "wide_dict_25x300_500keys",
+        wide_dict(300, extra_keys=500).compile(checkpointer=None),
+        wide_dict(300, extra_keys=500).compile(checkpointer=None),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(5)
+                    }
+                    for i in range(5)
+                }
+            ]
+        },
+    ),
+    (
+        "wide_dict_25x300_500keys_checkpoint",
+        wide_dict(300, extra_keys=500).compile(checkpointer=InMemorySaver()),
+        wide_dict(300, extra_keys=500).compile(checkpointer=InMemorySaver()),
+        {
+            "messages": [
+                {
+                    str(i) * 10: {
+                        str(j) * 10: ["hi?" * 10, True, 1, 6327816386138, None] * 5
+                        for j in range(5)
+                    }
+                    for i in range(5)
+                }
+            ]
+        },
+    ),
     (
         "sequential_10",
         create_sequential(10).compile(),
@@ -364,6 +432,24 @@ benchmarks = (
         create_sequential(1000).compile(),
         {"messages": []},  # Empty list of messages
     ),
+    (
+        "parallel_sync_16",
+        parallel_sync(16).compile(),
+        parallel_sync(16).compile(),
+        {"results": []},
+    ),
+    (
+        "sparse_fanout_600",
+        sparse_fanout(600).compile(),
+        sparse_fanout(600).compile(),
+        {"messages": []},  # Empty list of messages
+    ),
+    (
+        "sparse_fanout_600_checkpoint",
+        sparse_fanout(600).compile(checkpointer=InMemorySaver()),
+        sparse_fanout(600).compile(checkpointer=InMemorySaver()),
+        {"messages": []},  # Empty list of messages
+    ),
     (
         "pydantic_state_25x300",
         pydantic_state(300).compile(checkpointer=None),
@@ -513,3 +599,16 @@ compilation_benchmarks = (
 
 for name, graph in compilation_benchmarks:
     r.bench_func(name + "_compilation", compile_graph, graph)
+
+# Checkpoint serialization times
+serde = JsonPlusSerializer()
+serde_benchmarks = (
+    (
+        "serde_messages_1000",
+        messages_state(1_000),
+    ),
+)
+
+for name, value in serde_benchmarks:
+    r.bench_func(name + "_dumps", dumps, serde, value)
+    r.bench_func(name + "_loads", loads, serde, serde.dumps_typed(value))
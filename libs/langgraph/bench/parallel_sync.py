@@ -0,0 +1,56 @@
+"""Create a graph of CPU-bound sync nodes that run in parallel, to measure how
+sync runs scale across cores, eg. on a free-threaded (no-GIL) build of Python."""
+
+import operator
+from typing import Annotated
+
+from typing_extensions import TypedDict
+
+from langgraph.graph import StateGraph
+
+
+class State(TypedDict):
+    results: Annotated[list[int], operator.add]
+
+
+def parallel_sync(number_nodes: int, work: int = 100_000) -> StateGraph:
+    """Create a graph of `number_nodes` CPU-bound nodes, all triggered by the
+    start of the graph and so executed in the same step."""
+    builder = StateGraph(State)
+
+    def cpu_bound(state: State) -> dict:
+        """Pure Python busy loop, which holds the GIL when there is one."""
+        total = 0
+        for i in range(work):
+            total += i * i % 7
+        return {"results": [total]}
+
+    for i in range(number_nodes):
+        name = f"node_{i}"
+        builder.add_node(name, cpu_bound)
+        builder.add_edge("__start__", name)
+
+    return builder
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import time
+
+    graph = parallel_sync(16).compile()
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+
+    baseline = None
+    for max_concurrency in (1, 2, 4, 8, 16):
+        if max_concurrency > (os.cpu_count() or 1):
+            break
+        start = time.perf_counter()
+        graph.invoke({"results": []}, {"max_concurrency": max_concurrency})
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"max_concurrency={max_concurrency:<3} {elapsed:.4f} seconds, "
+            f"speedup {baseline / elapsed:.2f}x"
+        )
@@ -0,0 +1,40 @@
+from uuid import uuid4
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+
+def messages_state(n: int) -> dict:
+    messages = []
+    for i in range(n // 3):
+        call_id = str(uuid4())
+        messages.append(
+            HumanMessage(f"What is the weather in city {i}?", id=str(uuid4()))
+        )
+        messages.append(
+            AIMessage(
+                "",
+                id=str(uuid4()),
+                tool_calls=[
+                    {
+                        "name": "get_weather",
+                        "args": {"city": f"city {i}"},
+                        "id": call_id,
+                    }
+                ],
+            )
+        )
+        messages.append(
+            ToolMessage(
+                f"It is sunny in city {i}", id=str(uuid4()), tool_call_id=call_id
+            )
+        )
+    return {"messages": messages, "step": n, "metadata": {"source": "bench"}}
+
+
+def dumps(serde: JsonPlusSerializer, value: dict) -> None:
+    serde.dumps_typed(value)
+
+
+def loads(serde: JsonPlusSerializer, data: tuple[str, bytes]) -> None:
+    serde.loads_typed(data)
@@ -0,0 +1,52 @@
+"""Create a wide no-op graph where only a few of its many nodes run each step."""
+
+from langgraph._internal._runnable import RunnableCallable
+from langgraph.graph import MessagesState, StateGraph
+
+
+def sparse_fanout(number_nodes: int, number_chains: int = 4) -> StateGraph:
+    """Create a no-op graph of `number_chains` parallel chains of nodes.
+
+    Every step only the next node of each chain runs, so out of `number_nodes`
+    nodes just `number_chains` are triggered per step."""
+    builder = StateGraph(MessagesState)
+
+    def noop(state: MessagesState) -> None:
+        """No-op function."""
+        pass
+
+    async def anoop(state: MessagesState) -> None:
+        """No-op function."""
+        pass
+
+    length = number_nodes // number_chains
+    for c in range(number_chains):
+        prev_node = "__start__"
+        for i in range(length):
+            name = f"chain_{c}_node_{i}"
+            builder.add_node(name, RunnableCallable(noop, anoop))
+            builder.add_edge(prev_node, name)
+            prev_node = name
+        builder.add_edge(prev_node, "__end__")
+
+    return builder
+
+
+if __name__ == "__main__":
+    import asyncio
+    import time
+
+    import uvloop
+
+    graph = sparse_fanout(600).compile()
+    input = {"messages": []}  # Empty list of messages
+    config = {"recursion_limit": 20000000000}
+
+    async def run():
+        len([c async for c in graph.astream(input, config=config)])
+
+    uvloop.install()
+    start = time.time()
+    asyncio.run(run())
+    end = time.time()
+    print(f"Time taken: {end - start:.4f} seconds")
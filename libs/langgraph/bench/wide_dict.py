@@ -10,7 +10,7 @@ from langgraph.constants import END, START
 from langgraph.graph.state import StateGraph
 
 
-def wide_dict(n: int) -> StateGraph:
+def wide_dict(n: int, extra_keys: int = 0) -> StateGraph:
     class State(TypedDict):
         messages: Annotated[list, operator.add]
         trigger_events: Annotated[list, operator.add]
@@ -41,6 +41,16 @@ def wide_dict(n: int) -> StateGraph:
         """The ID of the bot user in the slack channel."""
         notified_assignees: Annotated[dict, operator.or_]
 
+    if extra_keys:
+        # keys never written to, which only add to the per-step channel overhead
+        State = TypedDict(  # type: ignore[misc]
+            "State",
+            {
+                **State.__annotations__,
+                **{f"extra_{i}": Optional[str] for i in range(extra_keys)},
+            },
+        )
+
     list_fields = {
         "messages",
         "trigger_events",
@@ -1,6 +1,6 @@
 import operator
 from collections.abc import Sequence
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, make_dataclass
 from functools import partial
 from random import choice
 from typing import Annotated, Optional
@@ -9,7 +9,7 @@ from langgraph.constants import END, START
 from langgraph.graph.state import StateGraph
 
 
-def wide_state(n: int) -> StateGraph:
+def wide_state(n: int, extra_keys: int = 0) -> StateGraph:
     @dataclass(kw_only=True)
     class State:
         messages: Annotated[list, operator.add] = field(default_factory=list)
@@ -51,6 +51,18 @@ def wide_state(n: int) -> StateGraph:
         """The ID of the bot user in the slack channel."""
         notified_assignees: Annotated[dict, operator.or_] = field(default_factory=dict)
 
+    if extra_keys:
+        # keys never written to, which only add to the per-step channel overhead
+        State = make_dataclass(  # type: ignore[misc]
+            "State",
+            [
+                (f"extra_{i}", Optional[str], field(default=None))
+                for i in range(extra_keys)
+            ],
+            bases=(State,),
+            kw_only=True,
+        )
+
     list_fields = {
         "messages",
         "trigger_events",
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import enum
 import inspect
+import multiprocessing
 import sys
+import threading
 import warnings
 from collections.abc import (
     AsyncIterator,
@@ -13,6 +16,7 @@ from collections.abc import (
     Iterator,
     Sequence,
 )
+from concurrent.futures import Executor, ProcessPoolExecutor
 from contextlib import AsyncExitStack, contextmanager
 from contextvars import Context, Token, copy_context
 from functools import partial, wraps
@@ -533,6 +537,74 @@ def coerce_to_runnable(
         )
 
 
+_PROCESS_POOL: ProcessPoolExecutor | None = None
+_PROCESS_POOL_LOCK = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get the process pool shared by all nodes run in a process pool,
+    creating it on first use.
+
+    Workers are spawned rather than forked, as forking a process running other
+    threads (e.g. the graph's own executor) can deadlock the child, and the
+    pool is shut down when the interpreter exits."""
+    global _PROCESS_POOL
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is None:
+            _PROCESS_POOL = ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(_PROCESS_POOL.shutdown)
+        return _PROCESS_POOL
+
+
+def coerce_to_process_pool_runnable(
+    thing: RunnableLike, *, name: str | None, executor: Executor | None = None
+) -> Runnable:
+    """Coerce a function into a Runnable that calls it in a process pool.
+
+    The function receives only its input, and both input and output are pickled
+    to and from the worker process, so it must be a sync function defined at
+    module level that doesn't accept `config`, `store`, `runtime` etc.
+
+    Args:
+        thing: The function to run in a process pool.
+        name: The name of the Runnable.
+        executor: The executor to submit calls to. Defaults to a process pool
+            shared by all such Runnables.
+
+    Returns:
+        A Runnable.
+    """
+    if (
+        isinstance(thing, Runnable)
+        or not callable(thing)
+        or is_async_callable(thing)
+        or is_async_generator(thing)
+        or inspect.isgeneratorfunction(thing)
+    ):
+        raise TypeError(
+            f"Only sync functions can be run in a process pool, got {thing!r}"
+        )
+    params = inspect.signature(thing).parameters
+    if injected := sorted({kw for kw, *_ in KWARGS_CONFIG_KEYS if kw in params}):
+        raise ValueError(
+            f"Functions run in a process pool receive only their input, "
+            f"but {name or thing!r} accepts {', '.join(injected)}"
+        )
+    func = cast(Callable[[Any], Any], thing)
+
+    def call(input: Any) -> Any:
+        return (executor or get_process_pool()).submit(func, input).result()
+
+    async def acall(input: Any) -> Any:
+        return await asyncio.wrap_future(
+            (executor or get_process_pool()).submit(func, input)
+        )
+
+    return RunnableCallable(call, acall, name=name, trace=False)
+
+
 class RunnableSeq(Runnable):
     """Sequence of `Runnable`, where the output of each is the input of the next.
 
@@ -18,6 +18,9 @@ class AnyValue(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("typ", "value")
 
+    needs_empty_update = True
+    needs_finish = False
+
     value: Value | Any
 
     def __init__(self, typ: Any, key: str = "") -> None:
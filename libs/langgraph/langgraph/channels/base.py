@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import Any, Generic, TypeVar
+from typing import Any, ClassVar, Generic, TypeVar
 
 from typing_extensions import Self
 
@@ -21,6 +21,16 @@ class BaseChannel(Generic[Value, Update, Checkpoint], ABC):
 
     __slots__ = ("key", "typ")
 
+    needs_empty_update: ClassVar[bool] = True
+    """Whether `update()` must be called with an empty sequence at the end of
+    steps in which the channel received no writes. Channels whose value can't
+    change without writes set this to `False`, and are skipped by Pregel."""
+
+    needs_finish: ClassVar[bool] = True
+    """Whether `finish()` must be called when the Pregel run is finishing.
+    Channels that don't implement `finish()` set this to `False`, and are
+    skipped by Pregel."""
+
     def __init__(self, typ: Any, key: str = "") -> None:
         self.typ = typ
         self.key = key
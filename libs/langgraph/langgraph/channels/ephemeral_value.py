@@ -17,6 +17,9 @@ class EphemeralValue(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("value", "guard")
 
+    needs_empty_update = True
+    needs_finish = False
+
     value: Value | Any
     guard: bool
 
@@ -22,6 +22,9 @@ class LastValue(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("value",)
 
+    needs_empty_update = False
+    needs_finish = False
+
     value: Value | Any
 
     def __init__(self, typ: Any, key: str = "") -> None:
@@ -86,6 +89,9 @@ class LastValueAfterFinish(
 
     __slots__ = ("value", "finished")
 
+    needs_empty_update = False
+    needs_finish = True
+
     value: Value | Any
     finished: bool
 
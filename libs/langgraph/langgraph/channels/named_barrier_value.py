@@ -15,6 +15,9 @@ class NamedBarrierValue(Generic[Value], BaseChannel[Value, Value, set[Value]]):
 
     __slots__ = ("names", "seen")
 
+    needs_empty_update = False
+    needs_finish = False
+
     names: set[Value]
     seen: set[Value]
 
@@ -88,6 +91,9 @@ class NamedBarrierValueAfterFinish(
 
     __slots__ = ("names", "seen", "finished")
 
+    needs_empty_update = False
+    needs_finish = True
+
     names: set[Value]
     seen: set[Value]
 
@@ -33,6 +33,8 @@ class Topic(
 
     __slots__ = ("values", "accumulate")
 
+    needs_finish = False
+
     def __init__(self, typ: type[Value], accumulate: bool = False) -> None:
         super().__init__(typ)
         # attrs
@@ -43,6 +45,11 @@ class Topic(
     def __eq__(self, value: object) -> bool:
         return isinstance(value, Topic) and value.accumulate == self.accumulate
 
+    @property
+    def needs_empty_update(self) -> bool:
+        """Non-accumulating topics are cleared at the end of each step."""
+        return not self.accumulate
+
     @property
     def ValueType(self) -> Any:
         """The type of the value stored in the channel."""
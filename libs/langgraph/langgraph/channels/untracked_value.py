@@ -17,6 +17,9 @@ class UntrackedValue(Generic[Value], BaseChannel[Value, Value, Value]):
 
     __slots__ = ("value", "guard")
 
+    needs_empty_update = False
+    needs_finish = False
+
     guard: bool
     value: Value | Any
 
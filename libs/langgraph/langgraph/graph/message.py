@@ -22,9 +22,11 @@ from langchain_core.messages import (
     convert_to_messages,
     message_chunk_to_message,
 )
-from typing_extensions import TypedDict, deprecated
+from typing_extensions import Self, TypedDict, deprecated
 
 from langgraph._internal._constants import CONF, CONFIG_KEY_SEND, NS_SEP
+from langgraph._internal._typing import MISSING
+from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.graph.state import StateGraph
 from langgraph.warnings import LangGraphDeprecatedSinceV10
 
@@ -182,32 +184,11 @@ def add_messages(
         ```
 
     """
-    remove_all_idx = None
-    # coerce to list
-    if not isinstance(left, list):
-        left = [left]  # type: ignore[assignment]
-    if not isinstance(right, list):
-        right = [right]  # type: ignore[assignment]
-    # coerce to message
-    left = [
-        message_chunk_to_message(cast(BaseMessageChunk, m))
-        for m in convert_to_messages(left)
-    ]
-    right = [
-        message_chunk_to_message(cast(BaseMessageChunk, m))
-        for m in convert_to_messages(right)
-    ]
-    # assign missing ids
-    for m in left:
-        if m.id is None:
-            m.id = str(uuid.uuid4())
-    for idx, m in enumerate(right):
-        if m.id is None:
-            m.id = str(uuid.uuid4())
-        if isinstance(m, RemoveMessage) and m.id == REMOVE_ALL_MESSAGES:
-            remove_all_idx = idx
+    # coerce to messages with ids
+    left = _coerce_messages(left)
+    right = _coerce_messages(right)
 
-    if remove_all_idx is not None:
+    if (remove_all_idx := _remove_all_index(right)) is not None:
         return right[remove_all_idx + 1 :]
 
     # merge
@@ -242,6 +223,138 @@ def add_messages(
     return merged
 
 
+def _coerce_messages(messages: Messages) -> list[BaseMessage]:
+    """Coerce to a list of messages, assigning ids to messages without one."""
+    if not isinstance(messages, list):
+        messages = [messages]
+    coerced = [
+        message_chunk_to_message(cast(BaseMessageChunk, m))
+        for m in convert_to_messages(messages)
+    ]
+    for m in coerced:
+        if m.id is None:
+            m.id = str(uuid.uuid4())
+    return coerced
+
+
+def _remove_all_index(messages: list[BaseMessage]) -> int | None:
+    remove_all_idx = None
+    for idx, m in enumerate(messages):
+        if isinstance(m, RemoveMessage) and m.id == REMOVE_ALL_MESSAGES:
+            remove_all_idx = idx
+    return remove_all_idx
+
+
+class _AddMessagesAggregate(BinaryOperatorAggregate):
+    """`BinaryOperatorAggregate` for the default `add_messages` reducer.
+
+    Produces the same values as `add_messages`, but keeps the id to index map of
+    the current list across updates, so each update only coerces the incoming
+    messages rather than the whole history. Appending or replacing a message
+    costs O(1), plus a single copy of the list per update, as the previous one may
+    still be referenced by node inputs, a checkpoint being saved or a copy of the
+    channel. Removing messages rebuilds the map.
+
+    The map is extended in place, so copies of the channel don't copy it: they
+    read the map of the channel they were copied from, trusting only the entries
+    below the length of the list at the time of the copy, and keep the messages
+    they add in a map of their own.
+    """
+
+    __slots__ = ("index", "base", "base_len")
+
+    def __init__(self, typ: Any, operator: Callable = add_messages) -> None:
+        super().__init__(typ, operator)
+        # id -> index of self.value, None until the first update
+        self.index: dict[str, int] | None = None
+        # id -> index of the first base_len messages, shared with the channel
+        # this was copied from
+        self.base: dict[str, int] | None = None
+        self.base_len = 0
+
+    def copy(self) -> Self:
+        empty = super().copy()
+        if self.index is None:
+            pass
+        elif self.base is None:
+            empty.base = self.index
+            empty.base_len = len(self.value)
+            empty.index = {}
+        else:
+            # a copy of a copy only copies the messages added since the first copy
+            empty.base = self.base
+            empty.base_len = self.base_len
+            empty.index = self.index.copy()
+        return empty
+
+    def update(self, values: Sequence[Messages]) -> bool:
+        if not values:
+            return False
+        if self.value is MISSING:
+            self.value = values[0]
+            values = values[1:]
+        for value in values:
+            self.value = self._merge(value)
+        return True
+
+    def _find(
+        self, index: dict[str, int], merged: list[BaseMessage], id: str
+    ) -> int | None:
+        # entries of failed updates may point past the list, or to another message
+        if (
+            (idx := index.get(id)) is not None
+            and idx < len(merged)
+            and merged[idx].id == id
+        ):
+            return idx
+        if (
+            self.base is not None
+            and (idx := self.base.get(id)) is not None
+            and idx < self.base_len
+        ):
+            return idx
+        return None
+
+    def _merge(self, right: Messages) -> list[BaseMessage]:
+        if self.index is None:
+            merged = _coerce_messages(cast(Messages, self.value))
+            index = {cast(str, m.id): i for i, m in enumerate(merged)}
+        else:
+            merged = cast(list[BaseMessage], self.value).copy()
+            index = self.index
+        right = _coerce_messages(right)
+
+        if (remove_all_idx := _remove_all_index(right)) is not None:
+            merged = right[remove_all_idx + 1 :]
+            self.index = {cast(str, m.id): i for i, m in enumerate(merged)}
+            self.base = None
+            return merged
+
+        # merge
+        ids_to_remove = set()
+        for m in right:
+            if (existing_idx := self._find(index, merged, cast(str, m.id))) is not None:
+                if isinstance(m, RemoveMessage):
+                    ids_to_remove.add(m.id)
+                else:
+                    ids_to_remove.discard(m.id)
+                    merged[existing_idx] = m
+            else:
+                if isinstance(m, RemoveMessage):
+                    raise ValueError(
+                        f"Attempting to delete a message with an ID that doesn't exist ('{m.id}')"
+                    )
+
+                index[cast(str, m.id)] = len(merged)
+                merged.append(m)
+        if ids_to_remove:
+            merged = [m for m in merged if m.id not in ids_to_remove]
+            index = {cast(str, m.id): i for i, m in enumerate(merged)}
+            self.base = None
+        self.index = index
+        return merged
+
+
 @deprecated(
     "MessageGraph is deprecated in langgraph 1.0.0, to be removed in 2.0.0. Please use StateGraph with a `messages` key instead.",
     category=None,
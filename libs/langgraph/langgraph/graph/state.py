@@ -7,6 +7,7 @@ import typing
 import warnings
 from collections import defaultdict
 from collections.abc import Awaitable, Hashable, Sequence
+from concurrent.futures import Executor
 from functools import partial
 from inspect import isclass, isfunction, ismethod, signature
 from types import FunctionType
@@ -42,7 +43,10 @@ from langgraph._internal._fields import (
     get_update_as_tuples,
 )
 from langgraph._internal._pydantic import create_model
-from langgraph._internal._runnable import coerce_to_runnable
+from langgraph._internal._runnable import (
+    coerce_to_process_pool_runnable,
+    coerce_to_runnable,
+)
 from langgraph._internal._typing import EMPTY_SEQ, MISSING, DeprecatedKwargs
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.binop import BinaryOperatorAggregate
@@ -293,6 +297,9 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
         destinations: dict[str, str] | tuple[str, ...] | None = None,
+        process_pool: bool | Executor = False,
+        max_concurrency: int | None = None,
+        priority: int = 0,
         **kwargs: Unpack[DeprecatedKwargs],
     ) -> Self:
         """Add a new node to the state graph, input schema is inferred as the state schema.
@@ -311,6 +318,9 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
         destinations: dict[str, str] | tuple[str, ...] | None = None,
+        process_pool: bool | Executor = False,
+        max_concurrency: int | None = None,
+        priority: int = 0,
         **kwargs: Unpack[DeprecatedKwargs],
     ) -> Self:
         """Add a new node to the state graph, input schema is specified.
@@ -330,6 +340,9 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
         destinations: dict[str, str] | tuple[str, ...] | None = None,
+        process_pool: bool | Executor = False,
+        max_concurrency: int | None = None,
+        priority: int = 0,
         **kwargs: Unpack[DeprecatedKwargs],
     ) -> Self:
         """Add a new node to the state graph, input schema is inferred as the state schema."""
@@ -347,6 +360,9 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
         destinations: dict[str, str] | tuple[str, ...] | None = None,
+        process_pool: bool | Executor = False,
+        max_concurrency: int | None = None,
+        priority: int = 0,
         **kwargs: Unpack[DeprecatedKwargs],
     ) -> Self:
         """Add a new node to the state graph, input schema is specified."""
@@ -363,6 +379,9 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
         destinations: dict[str, str] | tuple[str, ...] | None = None,
+        process_pool: bool | Executor = False,
+        max_concurrency: int | None = None,
+        priority: int = 0,
         **kwargs: Unpack[DeprecatedKwargs],
     ) -> Self:
         """Add a new node to the state graph.
@@ -385,6 +404,19 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
 
                 !!! note
                     This is only used for graph rendering and doesn't have any effect on the graph execution.
+            process_pool: Whether to run the node's function in a process pool, for CPU-bound
+                nodes that would otherwise hold the GIL. If an executor is provided, it will be
+                used instead of the process pool shared by all such nodes.
+
+                !!! note
+                    The function must be a sync function defined at module level, and receives
+                    only the state: its input and output are pickled to and from the worker
+                    process. Writes to channels happen in the main process as for any node.
+            max_concurrency: The maximum number of tasks of this node to run at the same time,
+                eg. to respect the rate limits of an API the node calls. Applies to async runs,
+                on top of the `max_concurrency` of the run config.
+            priority: When tasks are waiting on `max_concurrency` limits, tasks of nodes with
+                higher priority are started first. Applies to async runs.
 
         Example:
             ```python
@@ -473,6 +505,10 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
                 raise ValueError(
                     f"'{character}' is a reserved character and is not allowed in the node names."
                 )
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                f"Node `{node}` max_concurrency must be at least 1, got {max_concurrency}."
+            )
 
         inferred_input_schema = None
 
@@ -524,35 +560,50 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         if destinations is not None:
             ends = destinations
 
+        if process_pool:
+            runnable = coerce_to_process_pool_runnable(
+                action,  # type: ignore[arg-type]
+                name=node,
+                executor=process_pool if isinstance(process_pool, Executor) else None,
+            )
+        else:
+            runnable = coerce_to_runnable(action, name=node, trace=False)  # type: ignore[arg-type]
+
         if input_schema is not None:
             self.nodes[node] = StateNodeSpec[NodeInputT, ContextT](
-                coerce_to_runnable(action, name=node, trace=False),  # type: ignore[arg-type]
+                runnable,
                 metadata,
                 input_schema=input_schema,
                 retry_policy=retry_policy,
                 cache_policy=cache_policy,
                 ends=ends,
                 defer=defer,
+                max_concurrency=max_concurrency,
+                priority=priority,
             )
         elif inferred_input_schema is not None:
             self.nodes[node] = StateNodeSpec(
-                coerce_to_runnable(action, name=node, trace=False),  # type: ignore[arg-type]
+                runnable,
                 metadata,
                 input_schema=inferred_input_schema,
                 retry_policy=retry_policy,
                 cache_policy=cache_policy,
                 ends=ends,
                 defer=defer,
+                max_concurrency=max_concurrency,
+                priority=priority,
             )
         else:
             self.nodes[node] = StateNodeSpec[StateT, ContextT](
-                coerce_to_runnable(action, name=node, trace=False),  # type: ignore[arg-type]
+                runnable,
                 metadata,
                 input_schema=self.state_schema,
                 retry_policy=retry_policy,
                 cache_policy=cache_policy,
                 ends=ends,
                 defer=defer,
+                max_concurrency=max_concurrency,
+                priority=priority,
             )
 
         input_schema = input_schema or inferred_input_schema
@@ -813,6 +864,7 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
         interrupt_after: All | list[str] | None = None,
         debug: bool = False,
         name: str | None = None,
+        eager_steps: bool = False,
     ) -> CompiledStateGraph[StateT, ContextT, InputT, OutputT]:
         """Compiles the state graph into a `CompiledStateGraph` object.
 
@@ -829,6 +881,13 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
             interrupt_after: An optional list of node names to interrupt after.
             debug: A flag indicating whether to enable debug mode.
             name: The name to use for the compiled graph.
+            eager_steps: A flag indicating whether to start nodes as soon as the
+                nodes they depend on finished, instead of at the end of each step.
+                Checkpoints are unchanged, but a node may run twice if its input
+                changed by the end of the step, so nodes should be idempotent.
+                Eager runs use the graph's store and callbacks, so their writes
+                to the store and their callback events happen even when their
+                writes are discarded.
 
         Returns:
             CompiledStateGraph: The compiled state graph.
@@ -887,6 +946,7 @@ class StateGraph(Generic[StateT, ContextT, InputT, OutputT]):
             store=store,
             cache=cache,
             name=name or "LangGraph",
+            eager_steps=eager_steps,
         )
 
         compiled.attach_node(START, None)
@@ -1043,6 +1103,8 @@ class CompiledStateGraph(
                 retry_policy=node.retry_policy,
                 cache_policy=node.cache_policy,
                 bound=node.runnable,  # type: ignore[arg-type]
+                max_concurrency=node.max_concurrency,
+                priority=node.priority,
             )
         else:
             raise RuntimeError
@@ -1396,6 +1458,14 @@ def _is_field_binop(typ: type[Any]) -> BinaryOperatorAggregate | None:
                 )
                 == 2
             ):
+                from langgraph.graph.message import (
+                    _AddMessagesAggregate,
+                    add_messages,
+                )
+
+                if meta[-1] is add_messages:
+                    # incremental channel for the default messages reducer
+                    return _AddMessagesAggregate(typ, meta[-1])
                 return BinaryOperatorAggregate(typ, meta[-1])
             else:
                 raise ValueError(
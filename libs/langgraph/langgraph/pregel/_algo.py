@@ -10,6 +10,7 @@ from copy import copy
 from functools import partial
 from hashlib import sha1
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     Literal,
@@ -66,7 +67,7 @@ from langgraph._internal._typing import EMPTY_SEQ, MISSING
 from langgraph.channels.base import BaseChannel
 from langgraph.channels.topic import Topic
 from langgraph.constants import TAG_HIDDEN
-from langgraph.managed.base import ManagedValueMapping
+from langgraph.managed.base import ManagedValueMapping, ManagedValueSpec
 from langgraph.pregel._call import get_runnable_for_task, identifier
 from langgraph.pregel._io import read_channels
 from langgraph.pregel._log import logger
@@ -82,6 +83,9 @@ from langgraph.types import (
     Send,
 )
 
+if TYPE_CHECKING:
+    from _hashlib import HASH
+
 GetNextVersion = Callable[[Optional[V], None], V]
 SUPPORTS_EXC_NOTES = sys.version_info >= (3, 11)
 
@@ -113,6 +117,90 @@ class PregelTaskWrites(NamedTuple):
     triggers: Sequence[str]
 
 
+class ChannelNotifications(NamedTuple):
+    """Channels to be notified at the end of each step, besides those written to.
+    Precomputed from the channel specs when compiling a graph, so that applying
+    writes doesn't need to visit every channel of a wide state on every step."""
+
+    empty_update: Sequence[str]
+    """Channels to call `update()` on with no values, when not written to."""
+    finish: Sequence[str]
+    """Channels to call `finish()` on, when the run is finishing."""
+
+
+def channel_notifications(
+    specs: Mapping[str, BaseChannel | ManagedValueSpec],
+) -> ChannelNotifications:
+    """Index of the channels that need empty-step or finish notifications."""
+    return ChannelNotifications(
+        tuple(
+            k
+            for k, v in specs.items()
+            if isinstance(v, BaseChannel) and v.needs_empty_update
+        ),
+        tuple(
+            k for k, v in specs.items() if isinstance(v, BaseChannel) and v.needs_finish
+        ),
+    )
+
+
+class TriggerToNodes(dict[str, Sequence[str]]):
+    """Index from a trigger channel to the nodes it triggers.
+
+    Precomputed when compiling a graph. Alongside the mapping, the nodes of each
+    channel are kept as a bitset over all triggered nodes in sorted order, so
+    that the nodes triggered by a set of channels are found by OR-ing integers
+    rather than building and sorting a set of names on every step."""
+
+    __slots__ = ("nodes", "index", "masks")
+
+    def __init__(self, trigger_to_nodes: Mapping[str, Sequence[str]]) -> None:
+        super().__init__(trigger_to_nodes)
+        self.nodes: tuple[str, ...] = tuple(
+            sorted({node for nodes in trigger_to_nodes.values() for node in nodes})
+        )
+        self.index: dict[str, int] = {node: i for i, node in enumerate(self.nodes)}
+        self.masks: dict[str, int] = {}
+        for chan, nodes in trigger_to_nodes.items():
+            mask = 0
+            for node in nodes:
+                mask |= 1 << self.index[node]
+            self.masks[chan] = mask
+
+    def triggered(self, channels: Iterable[str]) -> list[str]:
+        """Nodes triggered by any of the channels, in sorted order."""
+        masks = self.masks
+        mask = 0
+        for chan in channels:
+            mask |= masks.get(chan, 0)
+        return self._nodes_in(mask)
+
+    def available(
+        self, channels: Mapping[str, BaseChannel], nodes: Iterable[str]
+    ) -> list[str]:
+        """Nodes with at least one available trigger, in the order given."""
+        mask = 0
+        for chan, chan_mask in self.masks.items():
+            if chan in channels and channels[chan].is_available():
+                mask |= chan_mask
+        if not mask:
+            return []
+        index = self.index
+        return [node for node in nodes if node in index and mask >> index[node] & 1]
+
+    def _nodes_in(self, mask: int) -> list[str]:
+        nodes = self.nodes
+        result: list[str] = []
+        while mask:
+            low = mask & -mask
+            result.append(nodes[low.bit_length() - 1])
+            mask ^= low
+        return result
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (TriggerToNodes, (dict(self),))
+
+
 class Call:
     __slots__ = ("func", "input", "retry_policy", "cache_policy", "callbacks")
 
@@ -197,7 +285,9 @@ def local_read(
     if fresh:
         # apply writes
         local_channels: dict[str, BaseChannel] = {}
-        for k in channels:
+        for k in [select] if isinstance(select, str) else select:
+            if k not in channels:
+                continue
             cc = channels[k].copy()
             cc.update(updated[k])
             local_channels[k] = cc
@@ -221,6 +311,7 @@ def apply_writes(
     tasks: Iterable[WritesProtocol],
     get_next_version: GetNextVersion | None,
     trigger_to_nodes: Mapping[str, Sequence[str]],
+    notifications: ChannelNotifications | None = None,
 ) -> set[str]:
     """Apply writes from a set of tasks (usually the tasks from a Pregel step)
     to the checkpoint and channels, and return managed values writes to be applied
@@ -232,6 +323,7 @@ def apply_writes(
         tasks: The tasks to apply writes from.
         get_next_version: Optional function to determine the next version of a channel.
         trigger_to_nodes: Mapping of channel names to the set of nodes that can be triggered by updates to that channel.
+        notifications: Optional index of the channels that need empty-step or finish notifications. If not provided, all channels are notified.
 
     Returns:
         Set of channels that were updated in this step.
@@ -239,20 +331,20 @@ def apply_writes(
     # sort tasks on path, to ensure deterministic order for update application
     # any path parts after the 3rd are ignored for sorting
     # (we use them for eg. task ids which aren't good for sorting)
-    tasks = sorted(tasks, key=lambda t: task_path_str(t.path[:3]))
+    tasks = sorted(tasks, key=_task_path_key)
     # if no task has triggers this is applying writes from the null task only
     # so we don't do anything other than update the channels written to
     bump_step = any(t.triggers for t in tasks)
 
-    # update seen versions
+    # update seen versions, replacing the mapping of each node rather than
+    # updating it in place, as it may be shared with earlier checkpoints
+    versions_seen = checkpoint["versions_seen"]
     for task in tasks:
-        checkpoint["versions_seen"].setdefault(task.name, {}).update(
-            {
-                chan: checkpoint["channel_versions"][chan]
-                for chan in task.triggers
-                if chan in checkpoint["channel_versions"]
-            }
-        )
+        seen = dict(versions_seen.get(task.name, ()))
+        for chan in task.triggers:
+            if chan in checkpoint["channel_versions"]:
+                seen[chan] = checkpoint["channel_versions"][chan]
+        versions_seen[task.name] = seen
 
     # Find the highest version of all channels
     if get_next_version is None:
@@ -300,7 +392,7 @@ def apply_writes(
 
     # Channels that weren't updated in this step are notified of a new step
     if bump_step:
-        for chan in channels:
+        for chan in channels if notifications is None else notifications.empty_update:
             if channels[chan].is_available() and chan not in updated_channels:
                 if channels[chan].update(EMPTY_SEQ) and next_version is not None:
                     checkpoint["channel_versions"][chan] = next_version
@@ -310,7 +402,7 @@ def apply_writes(
 
     # If this is (tentatively) the last superstep, notify all channels of finish
     if bump_step and updated_channels.isdisjoint(trigger_to_nodes):
-        for chan in channels:
+        for chan in channels if notifications is None else notifications.finish:
             if channels[chan].finish() and next_version is not None:
                 checkpoint["channel_versions"][chan] = next_version
                 # unavailable channels can't trigger tasks, so don't add them
@@ -412,6 +504,12 @@ def prepare_next_tasks(
     """
     input_cache: dict[INPUT_CACHE_KEY_TYPE, Any] = {}
     checkpoint_id_bytes = binascii.unhexlify(checkpoint["id"].replace("-", ""))
+    task_ids = TaskIds(
+        checkpoint,
+        checkpoint_id_bytes,
+        config.get(CONF, {}).get(CONFIG_KEY_CHECKPOINT_NS, ""),
+        step,
+    )
     null_version = checkpoint_null_version(checkpoint)
     tasks: list[PregelTask | PregelExecutableTask] = []
     # Consume pending tasks
@@ -438,6 +536,7 @@ def prepare_next_tasks(
                 input_cache=input_cache,
                 cache_policy=cache_policy,
                 retry_policy=retry_policy,
+                task_ids=task_ids,
             ):
                 tasks.append(task)
 
@@ -449,15 +548,24 @@ def prepare_next_tasks(
     # Then we can determine which nodes should be triggered in the next step
     # without having to cycle through all nodes.
     if updated_channels and trigger_to_nodes:
-        triggered_nodes: set[str] = set()
-        # Get all nodes that have triggers associated with an updated channel
-        for channel in updated_channels:
-            if node_ids := trigger_to_nodes.get(channel):
-                triggered_nodes.update(node_ids)
-        # Sort the nodes to ensure deterministic order
-        candidate_nodes: Iterable[str] = sorted(triggered_nodes)
+        if isinstance(trigger_to_nodes, TriggerToNodes):
+            candidate_nodes: Iterable[str] = trigger_to_nodes.triggered(
+                updated_channels
+            )
+        else:
+            triggered_nodes: set[str] = set()
+            # Get all nodes that have triggers associated with an updated channel
+            for channel in updated_channels:
+                if node_ids := trigger_to_nodes.get(channel):
+                    triggered_nodes.update(node_ids)
+            # Sort the nodes to ensure deterministic order
+            candidate_nodes = sorted(triggered_nodes)
     elif not checkpoint["channel_versions"]:
         candidate_nodes = ()
+    elif isinstance(trigger_to_nodes, TriggerToNodes):
+        # Only nodes with an available trigger can run, the version check
+        # below decides which of them do
+        candidate_nodes = trigger_to_nodes.available(channels, processes)
     else:
         candidate_nodes = processes.keys()
 
@@ -484,6 +592,7 @@ def prepare_next_tasks(
             input_cache=input_cache,
             cache_policy=cache_policy,
             retry_policy=retry_policy,
+            task_ids=task_ids,
         ):
             tasks.append(task)
     return {t.id: t for t in tasks}
@@ -513,12 +622,14 @@ def prepare_single_task(
     input_cache: dict[INPUT_CACHE_KEY_TYPE, Any] | None = None,
     cache_policy: CachePolicy | None = None,
     retry_policy: Sequence[RetryPolicy] = (),
+    task_ids: TaskIds | None = None,
 ) -> None | PregelTask | PregelExecutableTask:
     """Prepares a single task for the next Pregel step, given a task path, which
     uniquely identifies a PUSH or PULL task within the graph."""
     configurable = config.get(CONF, {})
     parent_ns = configurable.get(CONFIG_KEY_CHECKPOINT_NS, "")
-    task_id_func = _xxhash_str if checkpoint["v"] > 1 else _uuid5_str
+    if task_ids is None:
+        task_ids = TaskIds(checkpoint, checkpoint_id_bytes, parent_ns, step)
 
     if task_path[0] == PUSH and isinstance(task_path[-1], Call):
         # (PUSH, parent task path, idx of PUSH write, id of parent task, Call)
@@ -531,10 +642,7 @@ def prepare_single_task(
         # create task id
         triggers: Sequence[str] = PUSH_TRIGGER
         checkpoint_ns = f"{parent_ns}{NS_SEP}{name}" if parent_ns else name
-        task_id = task_id_func(
-            checkpoint_id_bytes,
-            checkpoint_ns,
-            str(step),
+        task_id = task_ids(
             name,
             PUSH,
             task_path_str(task_path[1]),
@@ -622,6 +730,7 @@ def prepare_single_task(
                 cache_key,
                 task_id,
                 task_path,
+                path_key=_path_key(task_path),
             )
         else:
             return PregelTask(task_id, name, task_path)
@@ -656,14 +765,7 @@ def prepare_single_task(
             checkpoint_ns = (
                 f"{parent_ns}{NS_SEP}{packet.node}" if parent_ns else packet.node
             )
-            task_id = task_id_func(
-                checkpoint_id_bytes,
-                checkpoint_ns,
-                str(step),
-                packet.node,
-                PUSH,
-                str(idx),
-            )
+            task_id = task_ids(packet.node, PUSH, str(idx))
         else:
             logger.warning(f"Ignoring invalid PUSH task path {task_path}")
             return
@@ -761,6 +863,9 @@ def prepare_single_task(
                 task_path,
                 writers=proc.flat_writers,
                 subgraphs=proc.subgraphs,
+                max_concurrency=proc.max_concurrency,
+                priority=proc.priority,
+                path_key=_path_key(task_path),
             )
         else:
             return PregelTask(task_id, packet.node, task_path)
@@ -783,14 +888,7 @@ def prepare_single_task(
             triggers = tuple(sorted(proc.triggers))
             # create task id
             checkpoint_ns = f"{parent_ns}{NS_SEP}{name}" if parent_ns else name
-            task_id = task_id_func(
-                checkpoint_id_bytes,
-                checkpoint_ns,
-                str(step),
-                name,
-                PULL,
-                *triggers,
-            )
+            task_id = task_ids(name, PULL, *triggers)
             task_checkpoint_ns = f"{checkpoint_ns}{NS_END}{task_id}"
             # create scratchpad
             scratchpad = _scratchpad(
@@ -914,6 +1012,9 @@ def prepare_single_task(
                         task_path[:3],
                         writers=proc.flat_writers,
                         subgraphs=proc.subgraphs,
+                        max_concurrency=proc.max_concurrency,
+                        priority=proc.priority,
+                        path_key=_path_key(task_path[:3]),
                     )
             else:
                 return PregelTask(task_id, name, task_path[:3])
@@ -1080,6 +1181,54 @@ def _xxhash_str(namespace: bytes, *parts: str | bytes) -> str:
     return f"{hex[:8]}-{hex[8:12]}-{hex[12:16]}-{hex[16:20]}-{hex[20:32]}"
 
 
+class TaskIds:
+    """Generates the ids of the tasks of a step.
+
+    A task id hashes the checkpoint id, the task's namespace, the step, the node
+    name and finally the task's path. All but the path are shared by every task
+    of a node in a step, so they're encoded (and for `_uuid5_str` ids, hashed)
+    once per node, and only the path is added for each task. The ids are the
+    same as those of `_xxhash_str` and `_uuid5_str`."""
+
+    __slots__ = ("prefix", "step", "use_xxhash", "heads", "sha_heads")
+
+    def __init__(
+        self,
+        checkpoint: Checkpoint,
+        checkpoint_id_bytes: bytes,
+        parent_ns: str,
+        step: int,
+    ) -> None:
+        self.prefix = (
+            checkpoint_id_bytes + f"{parent_ns}{NS_SEP}".encode()
+            if parent_ns
+            else checkpoint_id_bytes
+        )
+        self.step = str(step)
+        self.use_xxhash = checkpoint["v"] > 1
+        # encoded heads for xxhash ids, hashed heads for uuid5 ids
+        self.heads: dict[tuple[str, str], bytes] = {}
+        self.sha_heads: dict[tuple[str, str], HASH] = {}
+
+    def __call__(self, name: str, kind: str, *parts: str) -> str:
+        if self.use_xxhash:
+            if (head := self.heads.get((name, kind))) is None:
+                head = self.heads[(name, kind)] = self._head(name, kind)
+            hex = xxh3_128_hexdigest(head + "".join(parts).encode())
+        else:
+            if (sha_head := self.sha_heads.get((name, kind))) is None:
+                sha_head = self.sha_heads[(name, kind)] = sha1(
+                    self._head(name, kind), usedforsecurity=False
+                )
+            sha = sha_head.copy()
+            sha.update("".join(parts).encode())
+            hex = sha.hexdigest()
+        return f"{hex[:8]}-{hex[8:12]}-{hex[12:16]}-{hex[16:20]}-{hex[20:32]}"
+
+    def _head(self, name: str, kind: str) -> bytes:
+        return self.prefix + f"{name}{self.step}{name}{kind}".encode()
+
+
 def task_path_str(tup: str | int | tuple) -> str:
     """Generate a string representation of the task path."""
     return (
@@ -1091,6 +1240,27 @@ def task_path_str(tup: str | int | tuple) -> str:
     )
 
 
+def _task_path_key(task: WritesProtocol) -> str:
+    """The key tasks are sorted on when applying writes, computed once when
+    preparing executable tasks."""
+    if (key := getattr(task, "path_key", None)) is not None:
+        return key
+    return _path_key(task.path)
+
+
+def _path_key(path: tuple[str | int | tuple, ...]) -> str:
+    """Equivalent to `task_path_str(path[:3])`, with the shapes of PULL and Send
+    task paths formatted directly rather than recursively."""
+    if len(path) == 2:
+        # (PULL, node name)
+        if type(path[1]) is str:
+            return f"~{path[0]}, {path[1]}"
+    elif len(path) > 2 and type(path[1]) is int and type(path[2]) in (int, bool):
+        # (PUSH, idx of pending send, False)
+        return f"~{path[0]}, {path[1]:010d}, {path[2]:010d}"
+    return task_path_str(path[:3])
+
+
 LAZY_ATOMIC_COUNTER_LOCK = threading.Lock()
 
 
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from datetime import datetime, timezone
 
-from langgraph.checkpoint.base import Checkpoint
+from langgraph.checkpoint.base import Checkpoint, LazyChannelValues
 from langgraph.checkpoint.base.id import uuid6
 
 from langgraph._internal._typing import MISSING
@@ -36,6 +36,22 @@ def create_checkpoint(
     ts = datetime.now(timezone.utc).isoformat()
     if channels is None:
         values = checkpoint["channel_values"]
+    elif isinstance(channels, LazyChannels):
+        # channels never read since restored keep their value as loaded,
+        # which may still be serialized
+        versions = checkpoint["channel_versions"]
+        values = channels._values.copy()
+        for k in list(values):
+            if k not in channels or k not in versions:
+                del values[k]
+        for k in channels:
+            if k not in versions or not channels.is_loaded(k):
+                continue
+            v = channels[k].checkpoint()
+            if v is MISSING:
+                values.pop(k, None)
+            else:
+                values[k] = v
     else:
         values = {}
         for k in channels:
@@ -67,6 +83,8 @@ def channels_from_checkpoint(
             channel_specs[k] = v
         else:
             managed_specs[k] = v
+    if isinstance(values := checkpoint["channel_values"], LazyChannelValues):
+        return LazyChannels(channel_specs, values), managed_specs
     return (
         {
             k: v.from_checkpoint(checkpoint["channel_values"].get(k, MISSING))
@@ -76,6 +94,43 @@ def channels_from_checkpoint(
     )
 
 
+class LazyChannels(Mapping[str, BaseChannel]):
+    """Channels restored from lazily deserialized checkpoint values.
+
+    Each channel is created from its checkpoint value the first time it is
+    accessed, so channels that a run never reads never deserialize their value.
+    """
+
+    __slots__ = ("specs", "_values", "channels")
+
+    def __init__(
+        self, specs: Mapping[str, BaseChannel], values: LazyChannelValues
+    ) -> None:
+        self.specs = specs
+        self._values = values
+        self.channels: dict[str, BaseChannel] = {}
+
+    def __getitem__(self, key: str) -> BaseChannel:
+        try:
+            return self.channels[key]
+        except KeyError:
+            spec = self.specs[key]
+        channel = spec.from_checkpoint(self._values.get(key, MISSING))
+        return self.channels.setdefault(key, channel)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.specs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.specs)
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self.channels
+
+
 def copy_checkpoint(checkpoint: Checkpoint) -> Checkpoint:
     return Checkpoint(
         v=checkpoint["v"],
@@ -86,3 +141,18 @@ def copy_checkpoint(checkpoint: Checkpoint) -> Checkpoint:
         versions_seen={k: v.copy() for k, v in checkpoint["versions_seen"].items()},
         updated_channels=checkpoint.get("updated_channels", None),
     )
+
+
+def fork_checkpoint(checkpoint: Checkpoint) -> Checkpoint:
+    """Copy a checkpoint, sharing the channel values and the versions seen by
+    each node with the original. Cheaper than `copy_checkpoint`, for when the
+    copy is only changed by `apply_writes`, which doesn't mutate either."""
+    return Checkpoint(
+        v=checkpoint["v"],
+        ts=checkpoint["ts"],
+        id=checkpoint["id"],
+        channel_values=checkpoint["channel_values"],
+        channel_versions=checkpoint["channel_versions"].copy(),
+        versions_seen=checkpoint["versions_seen"].copy(),
+        updated_channels=checkpoint.get("updated_channels", None),
+    )
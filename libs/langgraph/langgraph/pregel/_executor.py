@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+import heapq
+import itertools
 import time
-from collections.abc import Awaitable, Coroutine
+from collections.abc import Awaitable, Coroutine, Sequence
 from contextlib import AbstractAsyncContextManager, AbstractContextManager, ExitStack
 from contextvars import copy_context
 from types import TracebackType
@@ -34,6 +36,9 @@ class Submit(Protocol[P, T]):
         __cancel_on_exit__: bool = False,
         __reraise_on_exit__: bool = True,
         __next_tick__: bool = False,
+        __priority__: int = 0,
+        __max_concurrency__: int | None = None,
+        __on_start__: Callable[[float], None] | None = None,
         **kwargs: P.kwargs,
     ) -> concurrent.futures.Future[T]: ...
 
@@ -60,6 +65,10 @@ class BackgroundExecutor(AbstractContextManager):
         __cancel_on_exit__: bool = False,  # for sync, can cancel only if not started
         __reraise_on_exit__: bool = True,
         __next_tick__: bool = False,
+        # scheduling options, currently not used in sync version
+        __priority__: int = 0,
+        __max_concurrency__: int | None = None,
+        __on_start__: Callable[[float], None] | None = None,
         **kwargs: P.kwargs,
     ) -> concurrent.futures.Future[T]:
         ctx = copy_context()
@@ -127,18 +136,24 @@ class AsyncBackgroundExecutor(AbstractAsyncContextManager):
     - cancels any tasks with `__cancel_on_exit__=True`
     - waits for all tasks to finish
     - re-raises the first exception from tasks with `__reraise_on_exit__=True`
-      ignoring CancelledError"""
+      ignoring CancelledError
+
+    Tasks are limited by `max_concurrency` from the config, and by the
+    `__max_concurrency__` of tasks submitted with the same `__name__`. Tasks
+    waiting on either limit start in order of `__priority__`, then submission."""
 
     def __init__(self, config: RunnableConfig) -> None:
         self.tasks: dict[asyncio.Future, tuple[bool, bool]] = {}
         self.sentinel = object()
         self.loop = asyncio.get_running_loop()
         if max_concurrency := config.get("max_concurrency"):
-            self.semaphore: asyncio.Semaphore | None = asyncio.Semaphore(
+            self.semaphore: PrioritySemaphore | None = PrioritySemaphore(
                 max_concurrency
             )
         else:
             self.semaphore = None
+        # per-name semaphores, created on first use
+        self.semaphores: dict[str, PrioritySemaphore] = {}
 
     def submit(  # type: ignore[valid-type]
         self,
@@ -148,11 +163,21 @@ class AsyncBackgroundExecutor(AbstractAsyncContextManager):
         __cancel_on_exit__: bool = False,
         __reraise_on_exit__: bool = True,
         __next_tick__: bool = False,  # noop in async (always True)
+        __priority__: int = 0,
+        __max_concurrency__: int | None = None,
+        __on_start__: Callable[[float], None] | None = None,
         **kwargs: P.kwargs,
     ) -> asyncio.Future[T]:
         coro = cast(Coroutine[None, None, T], fn(*args, **kwargs))
+        semaphores: list[PrioritySemaphore] = []
+        if __max_concurrency__ and __name__ is not None:
+            if __name__ not in self.semaphores:
+                self.semaphores[__name__] = PrioritySemaphore(__max_concurrency__)
+            semaphores.append(self.semaphores[__name__])
         if self.semaphore:
-            coro = gated(self.semaphore, coro)
+            semaphores.append(self.semaphore)
+        if semaphores:
+            coro = gated(semaphores, coro, __priority__, __on_start__)
         if CONTEXT_NOT_SUPPORTED:
             task = run_coroutine_threadsafe(
                 coro, self.loop, name=__name__, lazy=__next_tick__
@@ -212,10 +237,63 @@ class AsyncBackgroundExecutor(AbstractAsyncContextManager):
                     pass
 
 
-async def gated(semaphore: asyncio.Semaphore, coro: Coroutine[None, None, T]) -> T:
-    """A coroutine that waits for a semaphore before running another coroutine."""
-    async with semaphore:
+class PrioritySemaphore:
+    """A semaphore that wakes up waiters in order of priority (highest first),
+    then in the order they started waiting."""
+
+    __slots__ = ("value", "waiters", "counter")
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+        self.waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self.counter = itertools.count()
+
+    async def acquire(self, priority: int = 0) -> None:
+        if self.value > 0:
+            self.value -= 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.waiters, (-priority, next(self.counter), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # if woken up before being cancelled, pass the slot on
+            if fut.done() and not fut.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self.waiters:
+            _, _, fut = heapq.heappop(self.waiters)
+            # skip waiters that were cancelled
+            if not fut.done():
+                fut.set_result(None)
+                return
+        self.value += 1
+
+
+async def gated(
+    semaphores: Sequence[PrioritySemaphore],
+    coro: Coroutine[None, None, T],
+    priority: int = 0,
+    on_start: Callable[[float], None] | None = None,
+) -> T:
+    """A coroutine that waits for semaphores, in order, before running another
+    coroutine, optionally reporting the time spent waiting."""
+    acquired: list[PrioritySemaphore] = []
+    try:
+        start = time.monotonic()
+        for semaphore in semaphores:
+            await semaphore.acquire(priority)
+            acquired.append(semaphore)
+        if on_start is not None:
+            on_start(time.monotonic() - start)
         return await coro
+    finally:
+        for semaphore in reversed(acquired):
+            semaphore.release()
+        # close the coroutine if it was never started
+        coro.close()
 
 
 def next_tick(fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
@@ -3,21 +3,26 @@ from __future__ import annotations
 import asyncio
 import binascii
 import concurrent.futures
+import threading
+from abc import ABC, abstractmethod
 from collections import defaultdict, deque
-from collections.abc import Iterator, Mapping, Sequence
+from collections.abc import Awaitable, Iterable, Iterator, Mapping, Sequence
 from contextlib import (
     AbstractAsyncContextManager,
     AbstractContextManager,
     AsyncExitStack,
     ExitStack,
 )
+from dataclasses import replace
 from datetime import datetime, timezone
+from functools import partial
 from inspect import signature
 from types import TracebackType
 from typing import (
     Any,
     Callable,
     Literal,
+    NamedTuple,
     Optional,
     TypeVar,
     cast,
@@ -44,6 +49,8 @@ from langgraph._internal._constants import (
     CONFIG_KEY_CHECKPOINT_ID,
     CONFIG_KEY_CHECKPOINT_MAP,
     CONFIG_KEY_CHECKPOINT_NS,
+    CONFIG_KEY_CHECKPOINTER,
+    CONFIG_KEY_READ,
     CONFIG_KEY_RESUME_MAP,
     CONFIG_KEY_RESUMING,
     CONFIG_KEY_SCRATCHPAD,
@@ -56,9 +63,11 @@ from langgraph._internal._constants import (
     NS_END,
     NS_SEP,
     NULL_TASK_ID,
+    PULL,
     PUSH,
     RESUME,
 )
+from langgraph._internal._runnable import RunnableCallable
 from langgraph._internal._scratchpad import PregelScratchpad
 from langgraph._internal._typing import EMPTY_SEQ, MISSING
 from langgraph.channels.base import BaseChannel
@@ -73,9 +82,11 @@ from langgraph.managed.base import (
 )
 from langgraph.pregel._algo import (
     Call,
+    ChannelNotifications,
     GetNextVersion,
     PregelTaskWrites,
     apply_writes,
+    channel_notifications,
     checkpoint_null_version,
     increment,
     prepare_next_tasks,
@@ -85,9 +96,9 @@ from langgraph.pregel._algo import (
 )
 from langgraph.pregel._checkpoint import (
     channels_from_checkpoint,
-    copy_checkpoint,
     create_checkpoint,
     empty_checkpoint,
+    fork_checkpoint,
 )
 from langgraph.pregel._executor import (
     AsyncBackgroundExecutor,
@@ -102,6 +113,7 @@ from langgraph.pregel._io import (
     read_channels,
 )
 from langgraph.pregel._read import PregelNode
+from langgraph.pregel._retry import arun_with_retry, run_with_retry
 from langgraph.pregel._utils import get_new_channel_versions, is_xxh3_128_hexdigest
 from langgraph.pregel.debug import (
     map_debug_checkpoint,
@@ -135,7 +147,102 @@ def DuplexStream(*streams: StreamProtocol) -> StreamProtocol:
     return StreamProtocol(__call__, {mode for s in streams for mode in s.modes})
 
 
-class PregelLoop:
+class EagerTask(NamedTuple):
+    """A task of the next step, started before the current step finished."""
+
+    task: PregelExecutableTask
+    """The task, prepared from the writes of the tasks that had finished."""
+    future: concurrent.futures.Future | asyncio.Future
+    """The future of the submitted task."""
+    started: threading.Event
+    """Set once the task started running, ie. it no longer waits for a slot."""
+    finished: frozenset[str]
+    """Ids of the tasks of the current step whose writes the task saw."""
+    reads: set[str]
+    """Channels read by the task, added to while it runs."""
+
+
+def _record_reads(
+    reads: set[str],
+    read: Callable[..., Any],
+    select: list[str] | str,
+    fresh: bool = False,
+) -> Any:
+    reads.update((select,) if isinstance(select, str) else select)
+    return read(select, fresh)
+
+
+def _run_eager(
+    started: threading.Event, fn: Callable[P, V], *args: P.args, **kwargs: P.kwargs
+) -> V:
+    started.set()
+    return fn(*args, **kwargs)
+
+
+async def _arun_eager(
+    started: threading.Event,
+    fn: Callable[P, Awaitable[V]],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> V:
+    started.set()
+    return await fn(*args, **kwargs)
+
+
+def _eager_stale_channels(
+    eager: EagerTask, prev_tasks: Iterable[PregelExecutableTask]
+) -> set[str]:
+    """Channels whose value after the full step may differ from the one seen
+    by an eager task, ie. consumed or written by the tasks that finished after
+    it was started. Channel versions can't be compared instead, as the same
+    update gets a new version each time it's applied with most checkpointers."""
+    return {
+        c
+        for t in prev_tasks
+        if t.id not in eager.finished
+        for c in (*t.triggers, *(w[0] for w in t.writes))
+    }
+
+
+def _eager_proc(
+    eager: EagerTask, stale: set[str], task: PregelExecutableTask
+) -> RunnableCallable:
+    """Replace the proc of a task with one that reuses the writes of the
+    matching eager task, or runs the original proc if those can't be used."""
+    proc = task.proc
+
+    def func(input: Any, config: RunnableConfig) -> Any:
+        # an eager task still waiting for a slot is cancelled, never waited for
+        if eager.started.is_set() or not eager.future.cancel():
+            try:
+                eager.future.result()
+            except Exception:
+                pass
+            else:
+                if eager.reads.isdisjoint(stale):
+                    task.writes.extend(eager.task.writes)
+                    return None
+        return proc.invoke(input, config)
+
+    async def afunc(input: Any, config: RunnableConfig) -> Any:
+        future = cast(asyncio.Future, eager.future)
+        if eager.started.is_set():
+            await asyncio.wait((future,))
+            if (
+                not future.cancelled()
+                and future.exception() is None
+                and eager.reads.isdisjoint(stale)
+            ):
+                task.writes.extend(eager.task.writes)
+                return None
+        else:
+            future.cancel()
+        return await proc.ainvoke(input, config)
+
+    return RunnableCallable(func, afunc, name=task.name, trace=False, recurse=False)
+
+
+class PregelLoop(ABC):
     config: RunnableConfig
     store: BaseStore | None
     stream: StreamProtocol | None
@@ -158,6 +265,8 @@ class PregelLoop:
     durability: Durability
     retry_policy: Sequence[RetryPolicy]
     cache_policy: CachePolicy | None
+    channel_notifications: ChannelNotifications | None
+    eager_steps: bool
 
     checkpointer_get_next_version: GetNextVersion
     checkpointer_put_writes: Callable[[RunnableConfig, WritesT, str], Any] | None
@@ -185,6 +294,10 @@ class PregelLoop:
     checkpoint_config: RunnableConfig
     checkpoint_metadata: CheckpointMetadata
     checkpoint_pending_writes: list[PendingWrite]
+    checkpoint_pending_writes_lock: threading.Lock
+    eager_tasks: dict[str, EagerTask]
+    eager_finished: set[str]
+    eager_lock: threading.Lock
     checkpoint_previous_versions: dict[str, str | float | int]
     prev_checkpoint_config: RunnableConfig | None
 
@@ -224,6 +337,8 @@ class PregelLoop:
         migrate_checkpoint: Callable[[Checkpoint], None] | None = None,
         retry_policy: Sequence[RetryPolicy] = (),
         cache_policy: CachePolicy | None = None,
+        channel_notifications: ChannelNotifications | None = None,
+        eager_steps: bool = False,
     ) -> None:
         self.stream = stream
         self.config = config
@@ -245,9 +360,16 @@ class PregelLoop:
         self.skip_done_tasks = CONFIG_KEY_CHECKPOINT_ID not in config[CONF]
         self._migrate_checkpoint = migrate_checkpoint
         self.trigger_to_nodes = trigger_to_nodes
+        self.channel_notifications = channel_notifications
         self.retry_policy = retry_policy
         self.cache_policy = cache_policy
         self.durability = durability
+        # tasks finishing in other threads put their writes concurrently
+        self.checkpoint_pending_writes_lock = threading.Lock()
+        self.eager_steps = eager_steps
+        self.eager_tasks = {}
+        self.eager_finished = set()
+        self.eager_lock = threading.Lock()
         if self.stream is not None and CONFIG_KEY_STREAM in config[CONF]:
             self.stream = DuplexStream(self.stream, config[CONF][CONFIG_KEY_STREAM])
         scratchpad: PregelScratchpad | None = config[CONF].get(CONFIG_KEY_SCRATCHPAD)
@@ -306,24 +428,25 @@ class PregelLoop:
         # deduplicate writes to special channels, last write wins
         if all(w[0] in WRITES_IDX_MAP for w in writes):
             writes = list({w[0]: w for w in writes}.values())
-        if task_id == NULL_TASK_ID:
-            # writes for the null task are accumulated
-            self.checkpoint_pending_writes = [
-                w
-                for w in self.checkpoint_pending_writes
-                if w[0] != task_id or w[1] not in WRITES_IDX_MAP
-            ]
-            writes_to_save: WritesT = [
-                w[1:] for w in self.checkpoint_pending_writes if w[0] == task_id
-            ] + list(writes)
-        else:
-            # remove existing writes for this task
-            self.checkpoint_pending_writes = [
-                w for w in self.checkpoint_pending_writes if w[0] != task_id
-            ]
-            writes_to_save = writes
-        # save writes
-        self.checkpoint_pending_writes.extend((task_id, c, v) for c, v in writes)
+        with self.checkpoint_pending_writes_lock:
+            if task_id == NULL_TASK_ID:
+                # writes for the null task are accumulated
+                self.checkpoint_pending_writes = [
+                    w
+                    for w in self.checkpoint_pending_writes
+                    if w[0] != task_id or w[1] not in WRITES_IDX_MAP
+                ]
+                writes_to_save: WritesT = [
+                    w[1:] for w in self.checkpoint_pending_writes if w[0] == task_id
+                ] + list(writes)
+            else:
+                # remove existing writes for this task
+                self.checkpoint_pending_writes = [
+                    w for w in self.checkpoint_pending_writes if w[0] != task_id
+                ]
+                writes_to_save = writes
+            # save writes
+            self.checkpoint_pending_writes.extend((task_id, c, v) for c, v in writes)
         if self.durability != "exit" and self.checkpointer_put_writes is not None:
             config = patch_configurable(
                 self.checkpoint_config,
@@ -356,6 +479,9 @@ class PregelLoop:
         # output writes
         if hasattr(self, "tasks"):
             self.output_writes(task_id, writes)
+            # start tasks of the next step that don't depend on running tasks
+            if self.eager_steps and task_id in self.tasks:
+                self._start_eager_tasks(task_id, writes)
 
     def _put_pending_writes(self) -> None:
         if self.checkpointer_put_writes is None:
@@ -436,6 +562,111 @@ class PregelLoop:
             # return the new task, to be started if not run before
             return pushed
 
+    def _start_eager_tasks(self, task_id: str, writes: WritesT) -> None:
+        """Start the tasks of the next step that are triggered by the writes of
+        the tasks of this step that finished, while the others are still running.
+        Their writes are only used if nothing they read was changed by the tasks
+        that finished after them, see `_match_eager_tasks`."""
+        if self.step + 1 > self.stop:
+            return
+        if any(w[0] in (ERROR, INTERRUPT) for w in writes):
+            return
+        with self.eager_lock:
+            self.eager_finished.add(task_id)
+            tasks = list(self.tasks.values())
+            finished = [t for t in tasks if t.id in self.eager_finished]
+            if len(finished) == len(tasks):
+                # the next step is about to start anyway
+                return
+            if self.interrupt_after == "*" or any(
+                t.name in self.interrupt_after for t in finished
+            ):
+                return
+            # apply the writes of the finished tasks to a copy of the state
+            checkpoint = fork_checkpoint(self.checkpoint)
+            channels = {k: c.copy() for k, c in self.channels.items()}
+            notifications = (
+                self.channel_notifications or channel_notifications(self.specs)
+            )._replace(finish=())
+            updated_channels = apply_writes(
+                checkpoint,
+                channels,
+                finished,
+                self.checkpointer_get_next_version,
+                self.trigger_to_nodes,
+                notifications,
+            )
+            if not updated_channels:
+                return
+            next_tasks = prepare_next_tasks(
+                checkpoint,
+                [],
+                self.nodes,
+                channels,
+                self.managed,
+                self.config,
+                self.step + 1,
+                self.stop,
+                for_execution=True,
+                store=self.store,
+                checkpointer=self.checkpointer,
+                manager=self.manager,
+                trigger_to_nodes=self.trigger_to_nodes,
+                updated_channels=updated_channels,
+                retry_policy=self.retry_policy,
+                cache_policy=self.cache_policy,
+            )
+            seen = frozenset(t.id for t in finished)
+            for task in next_tasks.values():
+                if (
+                    task.path[0] != PULL
+                    or task.name in self.eager_tasks
+                    or task.subgraphs
+                    or self.interrupt_before == "*"
+                    or task.name in self.interrupt_before
+                ):
+                    continue
+                node = self.nodes[task.name]
+                reads = set(task.triggers)
+                reads.update(
+                    (node.channels,)
+                    if isinstance(node.channels, str)
+                    else node.channels
+                )
+                configurable = task.config[CONF]
+                configurable[CONFIG_KEY_CHECKPOINTER] = None
+                configurable[CONFIG_KEY_READ] = partial(
+                    _record_reads, reads, configurable[CONFIG_KEY_READ]
+                )
+                started = threading.Event()
+                self.eager_tasks[task.name] = EagerTask(
+                    task,
+                    self._submit_eager(task, started),
+                    started,
+                    seen,
+                    reads,
+                )
+
+    @abstractmethod
+    def _submit_eager(
+        self, task: PregelExecutableTask, started: threading.Event
+    ) -> concurrent.futures.Future | asyncio.Future:
+        """Submit an eager task, setting `started` once it starts running."""
+
+    def _match_eager_tasks(self, prev_tasks: Iterable[PregelExecutableTask]) -> None:
+        """Hand the tasks started eagerly during the previous step over to the
+        matching tasks of this step. Eager tasks with no match are dropped."""
+        with self.eager_lock:
+            eager_tasks, self.eager_tasks = self.eager_tasks, {}
+        for task in list(self.tasks.values()):
+            if task.path[0] != PULL or task.name not in eager_tasks:
+                continue
+            eager = eager_tasks.pop(task.name)
+            stale = _eager_stale_channels(eager, prev_tasks)
+            self.tasks[task.id] = replace(task, proc=_eager_proc(eager, stale, task))
+        for eager in eager_tasks.values():
+            eager.future.cancel()
+
     def tick(self) -> bool:
         """Execute a single iteration of the Pregel loop.
 
@@ -452,6 +683,7 @@ class PregelLoop:
             return False
 
         # prepare next tasks
+        prev_tasks = self.tasks.values() if hasattr(self, "tasks") else ()
         self.tasks = prepare_next_tasks(
             self.checkpoint,
             self.checkpoint_pending_writes,
@@ -471,6 +703,10 @@ class PregelLoop:
             cache_policy=self.cache_policy,
         )
 
+        # hand over tasks started during the previous step
+        if self.eager_tasks:
+            self._match_eager_tasks(prev_tasks)
+
         # produce debug output
         if self._checkpointer_put_after_previous is not None:
             self._emit(
@@ -501,6 +737,10 @@ class PregelLoop:
         if self.skip_done_tasks and self.checkpoint_pending_writes:
             self._match_writes(self.tasks)
 
+        # tasks with writes already won't run again
+        if self.eager_steps:
+            self.eager_finished = {t.id for t in self.tasks.values() if t.writes}
+
         # before execution, check if we should interrupt
         if self.interrupt_before and should_interrupt(
             self.checkpoint, self.interrupt_before, self.tasks.values()
@@ -528,6 +768,7 @@ class PregelLoop:
             self.tasks.values(),
             self.checkpointer_get_next_version,
             self.trigger_to_nodes,
+            self.channel_notifications,
         )
         # produce values output
         if not self.updated_channels.isdisjoint(
@@ -658,16 +899,17 @@ class PregelLoop:
                 [PregelTaskWrites((), INPUT, null_writes, [])],
                 self.checkpointer_get_next_version,
                 self.trigger_to_nodes,
+                self.channel_notifications,
             )
             if updated_channels is not None:
                 updated_channels.update(null_updated_channels)
         # proceed past previous checkpoint
         if is_resuming:
-            self.checkpoint["versions_seen"].setdefault(INTERRUPT, {})
+            seen = dict(self.checkpoint["versions_seen"].get(INTERRUPT, ()))
             for k in self.channels:
                 if k in self.checkpoint["channel_versions"]:
-                    version = self.checkpoint["channel_versions"][k]
-                    self.checkpoint["versions_seen"][INTERRUPT][k] = version
+                    seen[k] = self.checkpoint["channel_versions"][k]
+            self.checkpoint["versions_seen"][INTERRUPT] = seen
             # produce values output
             self._emit(
                 "values", map_output_values, self.output_keys, True, self.channels
@@ -700,6 +942,7 @@ class PregelLoop:
                 ],
                 self.checkpointer_get_next_version,
                 self.trigger_to_nodes,
+                self.channel_notifications,
             )
             # save input checkpoint
             self.updated_channels = updated_channels
@@ -755,7 +998,10 @@ class PregelLoop:
                 },
             }
 
-            channel_versions = self.checkpoint["channel_versions"].copy()
+            # the copy handed to the checkpointer shares all but the mappings
+            # updated in place by later steps
+            checkpoint = fork_checkpoint(self.checkpoint)
+            channel_versions = checkpoint["channel_versions"]
             new_versions = get_new_channel_versions(
                 self.checkpoint_previous_versions, channel_versions
             )
@@ -768,7 +1014,7 @@ class PregelLoop:
                 self._checkpointer_put_after_previous,
                 getattr(self, "_put_checkpoint_fut", None),
                 self.checkpoint_config,
-                copy_checkpoint(self.checkpoint),
+                checkpoint,
                 self.checkpoint_metadata,
                 new_versions,
             )
@@ -815,6 +1061,7 @@ class PregelLoop:
                     self.tasks.values(),
                     self.checkpointer_get_next_version,
                     self.trigger_to_nodes,
+                    self.channel_notifications,
                 )
                 if not updated_channels.isdisjoint(
                     (self.output_keys,)
@@ -949,6 +1196,8 @@ class SyncPregelLoop(PregelLoop, AbstractContextManager):
         migrate_checkpoint: Callable[[Checkpoint], None] | None = None,
         retry_policy: Sequence[RetryPolicy] = (),
         cache_policy: CachePolicy | None = None,
+        channel_notifications: ChannelNotifications | None = None,
+        eager_steps: bool = False,
     ) -> None:
         super().__init__(
             input,
@@ -967,9 +1216,11 @@ class SyncPregelLoop(PregelLoop, AbstractContextManager):
             manager=manager,
             migrate_checkpoint=migrate_checkpoint,
             trigger_to_nodes=trigger_to_nodes,
+            channel_notifications=channel_notifications,
             retry_policy=retry_policy,
             cache_policy=cache_policy,
             durability=durability,
+            eager_steps=eager_steps,
         )
         self.stack = ExitStack()
         if checkpointer:
@@ -985,6 +1236,20 @@ class SyncPregelLoop(PregelLoop, AbstractContextManager):
             self.checkpointer_put_writes = None
             self.checkpointer_put_writes_accepts_task_path = False
 
+    def _submit_eager(
+        self, task: PregelExecutableTask, started: threading.Event
+    ) -> concurrent.futures.Future:
+        return self.submit(
+            _run_eager,
+            started,
+            run_with_retry,
+            task,
+            self.retry_policy,
+            __name__=task.name,
+            __cancel_on_exit__=True,
+            __reraise_on_exit__=False,
+        )
+
     def _checkpointer_put_after_previous(
         self,
         prev: concurrent.futures.Future | None,
@@ -1125,6 +1390,8 @@ class AsyncPregelLoop(PregelLoop, AbstractAsyncContextManager):
         migrate_checkpoint: Callable[[Checkpoint], None] | None = None,
         retry_policy: Sequence[RetryPolicy] = (),
         cache_policy: CachePolicy | None = None,
+        channel_notifications: ChannelNotifications | None = None,
+        eager_steps: bool = False,
     ) -> None:
         super().__init__(
             input,
@@ -1143,9 +1410,11 @@ class AsyncPregelLoop(PregelLoop, AbstractAsyncContextManager):
             manager=manager,
             migrate_checkpoint=migrate_checkpoint,
             trigger_to_nodes=trigger_to_nodes,
+            channel_notifications=channel_notifications,
             retry_policy=retry_policy,
             cache_policy=cache_policy,
             durability=durability,
+            eager_steps=eager_steps,
         )
         self.stack = AsyncExitStack()
         if checkpointer:
@@ -1161,6 +1430,22 @@ class AsyncPregelLoop(PregelLoop, AbstractAsyncContextManager):
             self.checkpointer_put_writes = None
             self.checkpointer_put_writes_accepts_task_path = False
 
+    def _submit_eager(
+        self, task: PregelExecutableTask, started: threading.Event
+    ) -> asyncio.Future:
+        return self.submit(
+            _arun_eager,
+            started,
+            arun_with_retry,
+            task,
+            self.retry_policy,
+            __name__=task.name,
+            __cancel_on_exit__=True,
+            __reraise_on_exit__=False,
+            __priority__=task.priority,
+            __max_concurrency__=task.max_concurrency,
+        )
+
     async def _checkpointer_put_after_previous(
         self,
         prev: asyncio.Task | None,
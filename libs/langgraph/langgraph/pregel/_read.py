@@ -134,6 +134,13 @@ class PregelNode:
     subgraphs: Sequence[PregelProtocol]
     """Subgraphs used by the node."""
 
+    max_concurrency: int | None
+    """Maximum number of tasks of the node to run at the same time, in async runs."""
+
+    priority: int
+    """Tasks of nodes with higher priority are started first, when waiting on
+    `max_concurrency` limits in async runs."""
+
     def __init__(
         self,
         *,
@@ -147,6 +154,8 @@ class PregelNode:
         retry_policy: RetryPolicy | Sequence[RetryPolicy] | None = None,
         cache_policy: CachePolicy | None = None,
         subgraphs: Sequence[PregelProtocol] | None = None,
+        max_concurrency: int | None = None,
+        priority: int = 0,
     ) -> None:
         self.channels = channels
         self.triggers = list(triggers)
@@ -160,6 +169,8 @@ class PregelNode:
             self.retry_policy = retry_policy
         self.tags = tags
         self.metadata = metadata
+        self.max_concurrency = max_concurrency
+        self.priority = priority
         if subgraphs is not None:
             self.subgraphs = subgraphs
         elif self.bound is not DEFAULT_BOUND:
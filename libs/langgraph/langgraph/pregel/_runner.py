@@ -91,13 +91,24 @@ class FuturesDict(Generic[F, E], dict[F, Optional[PregelExecutableTask]]):
         key: F,
         value: PregelExecutableTask | None,
     ) -> None:
-        super().__setitem__(key, value)  # type: ignore[index]
-        if value is not None:
-            with self.lock:
+        # tasks add futures from other threads while the runner waits on them
+        with self.lock:
+            super().__setitem__(key, value)  # type: ignore[index]
+            if value is not None:
                 self.event.clear()
                 self.counter += 1
+        if value is not None:
             key.add_done_callback(partial(self.on_done, value))
 
+    def pop(self, key: F) -> PregelExecutableTask | None:
+        with self.lock:
+            return dict.pop(self, key)
+
+    def snapshot(self) -> dict[F, PregelExecutableTask | None]:
+        """Copy of the futures, safe to iterate while other threads add to it."""
+        with self.lock:
+            return self.copy()
+
     def on_done(
         self,
         task: PregelExecutableTask,
@@ -180,7 +191,8 @@ class PregelRunner:
                     # will be re-raised after futures are done
                     fut: concurrent.futures.Future = concurrent.futures.Future()
                     fut.set_exception(exc)
-                    futures.done.add(fut)
+                    with futures.lock:
+                        futures.done.add(fut)
                 elif reraise:
                     if tb := exc.__traceback__:
                         while tb.tb_next is not None and any(
@@ -222,7 +234,7 @@ class PregelRunner:
         end_time = timeout + time.monotonic() if timeout else None
         while len(futures) > (1 if get_waiter is not None else 0):
             done, inflight = concurrent.futures.wait(
-                futures,
+                futures.snapshot(),
                 return_when=concurrent.futures.FIRST_COMPLETED,
                 timeout=(max(0, end_time - time.monotonic()) if end_time else None),
             )
@@ -251,7 +263,9 @@ class PregelRunner:
         # panic on failure or timeout
         try:
             _panic_or_proceed(
-                futures.done.union(f for f, t in futures.items() if t is not None),
+                futures.done.union(
+                    f for f, t in futures.snapshot().items() if t is not None
+                ),
                 panic=reraise,
             )
         except Exception as exc:
@@ -357,6 +371,9 @@ class PregelRunner:
                     __name__=t.name,
                     __cancel_on_exit__=True,
                     __reraise_on_exit__=reraise,
+                    __priority__=t.priority,
+                    __max_concurrency__=t.max_concurrency,
+                    __on_start__=partial(_record_queue_wait, t),
                 ),
             )
             futures[fut] = t
@@ -450,6 +467,13 @@ class PregelRunner:
             self.put_writes()(task.id, task.writes)  # type: ignore[misc]
 
 
+def _record_queue_wait(task: PregelExecutableTask, seconds: float) -> None:
+    """Record in the task's metadata how long it waited on concurrency limits,
+    before it starts and so before callbacks read its metadata."""
+    if task.config is not None and (metadata := task.config.get("metadata")):
+        metadata["langgraph_queue_wait"] = seconds
+
+
 def _should_stop_others(
     done: set[F],
 ) -> bool:
@@ -556,7 +580,7 @@ def _call(
         if fut := next(
             (
                 f
-                for f, t in futures().items()  # type: ignore[union-attr]
+                for f, t in futures().snapshot().items()  # type: ignore[union-attr]
                 if t is not None and t == next_task.id
             ),
             None,
@@ -699,7 +723,7 @@ async def _acall_impl(
             if fut := next(
                 (
                     f
-                    for f, t in futures().items()  # type: ignore[union-attr]
+                    for f, t in futures().snapshot().items()  # type: ignore[union-attr]
                     if t is not None and t == next_task.id
                 ),
                 None,
@@ -746,6 +770,9 @@ async def _acall_impl(
                         # starting a new task in the next tick ensures
                         # updates from this tick are committed/streamed first
                         __next_tick__=True,
+                        __priority__=next_task.priority,
+                        __max_concurrency__=next_task.max_concurrency,
+                        __on_start__=partial(_record_queue_wait, next_task),
                     ),
                 )
                 # exceptions for call() tasks are raised into the parent task
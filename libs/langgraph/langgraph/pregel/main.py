@@ -101,9 +101,12 @@ from langgraph.errors import (
 )
 from langgraph.managed.base import ManagedValueSpec
 from langgraph.pregel._algo import (
+    ChannelNotifications,
     PregelTaskWrites,
+    TriggerToNodes,
     _scratchpad,
     apply_writes,
+    channel_notifications,
     local_read,
     prepare_next_tasks,
 )
@@ -579,6 +582,15 @@ class Pregel(
     """Whether to force emitting stream events eagerly, automatically turned on
     for stream_mode "messages" and "custom"."""
 
+    eager_steps: bool = False
+    """Whether to start the nodes of the next step as soon as the nodes they
+    depend on finished, instead of waiting for the whole step to finish.
+    Checkpoints and final state are the same as without it, but eager nodes
+    may run twice, if their input changed by the end of the step, so they
+    should be idempotent. Eager runs use the graph's store and callbacks, so
+    their writes to the store, and their callback events (including streamed
+    messages), happen even when their writes are discarded."""
+
     output_channels: str | Sequence[str]
 
     stream_channels: str | Sequence[str] | None = None
@@ -620,6 +632,8 @@ class Pregel(
 
     trigger_to_nodes: Mapping[str, Sequence[str]]
 
+    channel_notifications: ChannelNotifications | None
+
     def __init__(
         self,
         *,
@@ -628,6 +642,7 @@ class Pregel(
         auto_validate: bool = True,
         stream_mode: StreamMode = "values",
         stream_eager: bool = False,
+        eager_steps: bool = False,
         output_channels: str | Sequence[str],
         stream_channels: str | Sequence[str] | None = None,
         interrupt_after_nodes: All | Sequence[str] = (),
@@ -643,6 +658,7 @@ class Pregel(
         context_schema: type[ContextT] | None = None,
         config: RunnableConfig | None = None,
         trigger_to_nodes: Mapping[str, Sequence[str]] | None = None,
+        channel_notifications: ChannelNotifications | None = None,
         name: str = "LangGraph",
         **deprecated_kwargs: Unpack[DeprecatedKwargs],
     ) -> None:
@@ -670,6 +686,7 @@ class Pregel(
             self.channels[TASKS] = Topic(Send, accumulate=False)
         self.stream_mode = stream_mode
         self.stream_eager = stream_eager
+        self.eager_steps = eager_steps
         self.output_channels = output_channels
         self.stream_channels = stream_channels
         self.interrupt_after_nodes = interrupt_after_nodes
@@ -687,6 +704,7 @@ class Pregel(
         self.context_schema = context_schema
         self.config = config
         self.trigger_to_nodes = trigger_to_nodes or {}
+        self.channel_notifications = channel_notifications
         self.name = name
         if auto_validate:
             self.validate()
@@ -791,6 +809,7 @@ class Pregel(
             self.interrupt_before_nodes,
         )
         self.trigger_to_nodes = _trigger_to_nodes(self.nodes)
+        self.channel_notifications = channel_notifications(self.channels)
         return self
 
     @deprecated(
@@ -1313,8 +1332,15 @@ class Pregel(
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> Iterator[StateSnapshot]:
-        """Get the history of the state of the graph."""
+        """Get the history of the state of the graph.
+
+        If `metadata_only` is True, channel values and pending writes are not
+        loaded, and only the `config`, `metadata`, `created_at` and
+        `parent_config` of each snapshot are set. The checkpointer's `list`
+        must support `metadata_only`.
+        """
         config = ensure_config(config)
         checkpointer: BaseCheckpointSaver | None = config[CONF].get(
             CONFIG_KEY_CHECKPOINTER, self.checkpointer
@@ -1334,6 +1360,7 @@ class Pregel(
                     filter=filter,
                     before=before,
                     limit=limit,
+                    metadata_only=metadata_only,
                 )
                 return
             else:
@@ -1350,6 +1377,18 @@ class Pregel(
             },
         )
         # eagerly consume list() to avoid holding up the db cursor
+        if metadata_only:
+            for checkpoint_tuple in list(
+                checkpointer.list(
+                    config,
+                    before=before,
+                    limit=limit,
+                    filter=filter,
+                    metadata_only=True,
+                )
+            ):
+                yield _metadata_state_snapshot(checkpoint_tuple)
+            return
         for checkpoint_tuple in list(
             checkpointer.list(config, before=before, limit=limit, filter=filter)
         ):
@@ -1364,8 +1403,12 @@ class Pregel(
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
     ) -> AsyncIterator[StateSnapshot]:
-        """Asynchronously get the history of the state of the graph."""
+        """Asynchronously get the history of the state of the graph.
+
+        See `get_state_history` for `metadata_only`.
+        """
         config = ensure_config(config)
         checkpointer: BaseCheckpointSaver | None = ensure_config(config)[CONF].get(
             CONFIG_KEY_CHECKPOINTER, self.checkpointer
@@ -1385,6 +1428,7 @@ class Pregel(
                     filter=filter,
                     before=before,
                     limit=limit,
+                    metadata_only=metadata_only,
                 ):
                     yield state
                 return
@@ -1402,6 +1446,19 @@ class Pregel(
             },
         )
         # eagerly consume list() to avoid holding up the db cursor
+        if metadata_only:
+            for checkpoint_tuple in [
+                c
+                async for c in checkpointer.alist(
+                    config,
+                    before=before,
+                    limit=limit,
+                    filter=filter,
+                    metadata_only=True,
+                )
+            ]:
+                yield _metadata_state_snapshot(checkpoint_tuple)
+            return
         for checkpoint_tuple in [
             c
             async for c in checkpointer.alist(
@@ -2623,6 +2680,8 @@ class Pregel(
                 manager=run_manager,
                 durability=durability_,
                 trigger_to_nodes=self.trigger_to_nodes,
+                channel_notifications=self.channel_notifications,
+                eager_steps=self.eager_steps,
                 migrate_checkpoint=self._migrate_checkpoint,
                 retry_policy=self.retry_policy,
                 cache_policy=self.cache_policy,
@@ -2923,6 +2982,8 @@ class Pregel(
                 manager=run_manager,
                 durability=durability_,
                 trigger_to_nodes=self.trigger_to_nodes,
+                channel_notifications=self.channel_notifications,
+                eager_steps=self.eager_steps,
                 migrate_checkpoint=self._migrate_checkpoint,
                 retry_policy=self.retry_policy,
                 cache_policy=self.cache_policy,
@@ -3249,13 +3310,27 @@ class Pregel(
         await self.cache.aclear(namespaces)
 
 
+def _metadata_state_snapshot(saved: CheckpointTuple) -> StateSnapshot:
+    """State snapshot of a checkpoint listed without its values."""
+    return StateSnapshot(
+        values={},
+        next=(),
+        config=patch_checkpoint_map(saved.config, saved.metadata),
+        metadata=saved.metadata,
+        created_at=saved.checkpoint["ts"],
+        parent_config=patch_checkpoint_map(saved.parent_config, saved.metadata),
+        tasks=(),
+        interrupts=(),
+    )
+
+
 def _trigger_to_nodes(nodes: dict[str, PregelNode]) -> Mapping[str, Sequence[str]]:
     """Index from a trigger to nodes that depend on it."""
     trigger_to_nodes: defaultdict[str, list[str]] = defaultdict(list)
     for name, node in nodes.items():
         for trigger in node.triggers:
             trigger_to_nodes[trigger].append(name)
-    return dict(trigger_to_nodes)
+    return TriggerToNodes(trigger_to_nodes)
 
 
 def _output(
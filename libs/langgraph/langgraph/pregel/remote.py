@@ -281,7 +281,13 @@ class RemoteGraph(PregelProtocol):
             edges=[DrawableEdge(**edge) for edge in graph["edges"]],
         )
 
-    def _create_state_snapshot(self, state: ThreadState) -> StateSnapshot:
+    def _create_state_snapshot(
+        self, state: ThreadState, metadata_only: bool = False
+    ) -> StateSnapshot:
+        if metadata_only:
+            return self._create_state_snapshot(state)._replace(
+                values={}, next=(), tasks=(), interrupts=()
+            )
         tasks: list[PregelTask] = []
         for task in state["tasks"]:
             interrupts = tuple(
@@ -474,6 +480,7 @@ class RemoteGraph(PregelProtocol):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
         headers: dict[str, str] | None = None,
         params: QueryParamTypes | None = None,
     ) -> Iterator[StateSnapshot]:
@@ -487,6 +494,9 @@ class RemoteGraph(PregelProtocol):
             filter: Metadata to filter on.
             before: A `RunnableConfig` that includes checkpoint metadata.
             limit: Max number of states to return.
+            metadata_only: Whether to leave out the values, next nodes, tasks
+                and interrupts of each state. The API has no projection for
+                this, so full states are still fetched, and only dropped here.
 
         Returns:
             States of the thread.
@@ -504,7 +514,7 @@ class RemoteGraph(PregelProtocol):
             params=params,
         )
         for state in states:
-            yield self._create_state_snapshot(state)
+            yield self._create_state_snapshot(state, metadata_only)
 
     async def aget_state_history(
         self,
@@ -513,6 +523,7 @@ class RemoteGraph(PregelProtocol):
         filter: dict[str, Any] | None = None,
         before: RunnableConfig | None = None,
         limit: int | None = None,
+        metadata_only: bool = False,
         headers: dict[str, str] | None = None,
         params: QueryParamTypes | None = None,
     ) -> AsyncIterator[StateSnapshot]:
@@ -526,6 +537,9 @@ class RemoteGraph(PregelProtocol):
             filter: Metadata to filter on.
             before: A `RunnableConfig` that includes checkpoint metadata.
             limit: Max number of states to return.
+            metadata_only: Whether to leave out the values, next nodes, tasks
+                and interrupts of each state. The API has no projection for
+                this, so full states are still fetched, and only dropped here.
             headers: Optional custom headers to include with the request.
             params: Optional query parameters to include with the request.
 
@@ -545,7 +559,7 @@ class RemoteGraph(PregelProtocol):
             params=params,
         )
         for state in states:
-            yield self._create_state_snapshot(state)
+            yield self._create_state_snapshot(state, metadata_only)
 
     def bulk_update_state(
         self,
@@ -1,6 +1,33 @@
+import binascii
+import operator
+
+from langgraph.checkpoint.base import LazyChannelValues
+
 from langgraph._internal._constants import PULL, PUSH
-from langgraph.pregel._algo import prepare_next_tasks, task_path_str
-from langgraph.pregel._checkpoint import channels_from_checkpoint, empty_checkpoint
+from langgraph.channels.binop import BinaryOperatorAggregate
+from langgraph.channels.ephemeral_value import EphemeralValue
+from langgraph.channels.last_value import LastValue, LastValueAfterFinish
+from langgraph.channels.topic import Topic
+from langgraph.pregel._algo import (
+    PregelTaskWrites,
+    TaskIds,
+    TriggerToNodes,
+    _task_path_key,
+    _uuid5_str,
+    _xxhash_str,
+    apply_writes,
+    channel_notifications,
+    prepare_next_tasks,
+    task_path_str,
+)
+from langgraph.pregel._checkpoint import (
+    channels_from_checkpoint,
+    copy_checkpoint,
+    create_checkpoint,
+    empty_checkpoint,
+    fork_checkpoint,
+)
+from langgraph.pregel._read import PregelNode
 
 
 def test_prepare_next_tasks() -> None:
@@ -44,6 +71,71 @@ def test_prepare_next_tasks() -> None:
     # TODO: add more tests
 
 
+def test_prepare_next_tasks_trigger_to_nodes() -> None:
+    # a wide graph of 600 nodes, with every third node triggered by 2 channels
+    specs = {f"chan_{i}": LastValue(int) for i in range(600)}
+    processes = {
+        f"node_{i}": PregelNode(
+            channels=[f"chan_{i}"],
+            triggers=[f"chan_{i}"] + ([f"chan_{i + 1}"] if i % 3 == 0 else []),
+        )
+        for i in reversed(range(600))
+    }
+    index = {
+        chan: [name for name, proc in processes.items() if chan in proc.triggers]
+        for chan in specs
+    }
+    trigger_to_nodes = TriggerToNodes(index)
+    assert dict(trigger_to_nodes) == index
+    assert trigger_to_nodes.triggered(["chan_4", "chan_1", "chan_3", "other"]) == [
+        "node_0",
+        "node_1",
+        "node_3",
+        "node_4",
+    ]
+    assert trigger_to_nodes.triggered([]) == []
+
+    checkpoint = empty_checkpoint()
+    channels, managed = channels_from_checkpoint(specs, checkpoint)
+    updated = ["chan_7", "chan_10", "chan_598", "chan_1"]
+    for chan in updated:
+        channels[chan].update([1])
+        checkpoint["channel_versions"][chan] = 1
+    # node_9 has seen the update to its second trigger
+    checkpoint["versions_seen"]["node_9"] = {"chan_10": 1}
+
+    for updated_channels in (set(updated), None):
+        tasks = [
+            prepare_next_tasks(
+                checkpoint,
+                {},
+                processes,
+                channels,
+                managed,
+                {"configurable": {}},
+                0,
+                -1,
+                for_execution=False,
+                trigger_to_nodes=t,
+                updated_channels=updated_channels,
+            )
+            for t in (index, trigger_to_nodes)
+        ]
+        # the dispatch table selects the same tasks as the plain index
+        assert [list(t) for t in tasks[0].values()] == [
+            list(t) for t in tasks[1].values()
+        ]
+        assert sorted(t.name for t in tasks[1].values()) == [
+            "node_0",
+            "node_1",
+            "node_10",
+            "node_597",
+            "node_598",
+            "node_6",
+            "node_7",
+        ]
+
+
 def test_tuple_str() -> None:
     push_path_a = (PUSH, 2)
     pull_path_a = (PULL, "abc")
@@ -65,3 +157,168 @@ def test_tuple_str() -> None:
         f"~{PUSH}, ~{PUSH}, 0000000002, 0000000001",
         f"~{PUSH}, ~{PUSH}, ~{PUSH}, 0000000002, 0000000001, 0000000003",
     ]
+
+
+def test_task_ids() -> None:
+    checkpoint = empty_checkpoint()
+    checkpoint_id_bytes = binascii.unhexlify(checkpoint["id"].replace("-", ""))
+    for v, task_id_func in ((1, _uuid5_str), (2, _xxhash_str)):
+        checkpoint["v"] = v
+        for parent_ns in ("", "parent:1234"):
+            task_ids = TaskIds(checkpoint, checkpoint_id_bytes, parent_ns, 3)
+            ns = f"{parent_ns}|node" if parent_ns else "node"
+            # ids are unchanged from those computed in a single pass
+            for idx in range(3):
+                assert task_ids("node", PUSH, str(idx)) == task_id_func(
+                    checkpoint_id_bytes, ns, "3", "node", PUSH, str(idx)
+                )
+            assert task_ids("node", PULL, "a", "b") == task_id_func(
+                checkpoint_id_bytes, ns, "3", "node", PULL, "a", "b"
+            )
+            assert task_ids("other", PUSH, "0") == task_id_func(
+                checkpoint_id_bytes,
+                f"{parent_ns}|other" if parent_ns else "other",
+                "3",
+                "other",
+                PUSH,
+                "0",
+            )
+
+
+def test_task_path_key() -> None:
+    paths = [
+        (PULL, "abc"),
+        (PUSH, 2, False),
+        (PUSH, 12, True),
+        (PUSH, (PULL, "abc"), 1, True),
+        (PUSH, (PUSH, (PULL, "abc"), 1, True), 3, True),
+        (PUSH, 2),
+    ]
+    for path in paths:
+        task = PregelTaskWrites(path, "node", [], [])
+        assert _task_path_key(task) == task_path_str(path[:3])
+
+
+def test_apply_writes_channel_notifications() -> None:
+    specs = {
+        "value": LastValue(int),
+        "total": BinaryOperatorAggregate(int, operator.add),
+        "ephemeral": EphemeralValue(int),
+        "topic": Topic(int),
+        "acc_topic": Topic(int, accumulate=True),
+        "after_finish": LastValueAfterFinish(int),
+    }
+    notifications = channel_notifications(specs)
+    assert notifications.empty_update == ("ephemeral", "topic")
+    assert notifications.finish == ("after_finish",)
+
+    results = []
+    for notify in (None, notifications):
+        checkpoint = empty_checkpoint()
+        channels, _ = channels_from_checkpoint(specs, checkpoint)
+        updated = [
+            apply_writes(
+                checkpoint,
+                channels,
+                [PregelTaskWrites((), "a", writes, ["value"])],
+                lambda v, _: (v or 0) + 1,
+                {"value": ["a"]},
+                notify,
+            )
+            for writes in (
+                [
+                    ("value", 1),
+                    ("total", 1),
+                    ("ephemeral", 1),
+                    ("topic", 1),
+                    ("acc_topic", 1),
+                    ("after_finish", 1),
+                ],
+                [("total", 2)],
+                [],
+            )
+        ]
+        results.append(
+            (
+                updated,
+                checkpoint["channel_versions"],
+                {k: c.checkpoint() for k, c in channels.items()},
+            )
+        )
+
+    # notifying only the indexed channels is equivalent to notifying all
+    assert results[0] == results[1]
+    assert results[1][0] == [
+        {"value", "total", "ephemeral", "topic", "acc_topic"},
+        {"total", "after_finish"},
+        set(),
+    ]
+
+
+def test_channels_from_lazy_checkpoint() -> None:
+    specs = {
+        "docs": BinaryOperatorAggregate(list, operator.add),
+        "count": LastValue(int),
+    }
+    loaded: list[str] = []
+
+    def loads(channel: str, blob: object) -> object:
+        loaded.append(channel)
+        return blob
+
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_versions"] = {"docs": 1, "count": 1}
+    checkpoint["channel_values"] = LazyChannelValues(
+        loads, {"docs": ["a", "b"], "count": 1}
+    )
+    channels, _ = channels_from_checkpoint(specs, checkpoint)
+    assert set(channels) == {"docs", "count"}
+    assert loaded == []
+
+    apply_writes(
+        checkpoint,
+        channels,
+        [PregelTaskWrites((), "a", [("count", 2)], ["count"])],
+        lambda v, _: (v or 0) + 1,
+        {},
+        channel_notifications(specs),
+    )
+    assert loaded == ["count"]
+
+    # unread channels are carried over to the next checkpoint still serialized
+    next_checkpoint = create_checkpoint(checkpoint, channels, 1)
+    values = next_checkpoint["channel_values"]
+    assert isinstance(values, LazyChannelValues)
+    assert not values.is_loaded("docs")
+    assert values == {"docs": ["a", "b"], "count": 2}
+
+
+def test_fork_checkpoint() -> None:
+    specs = {"a": LastValue(int), "b": LastValue(int)}
+    checkpoint = empty_checkpoint()
+    channels, _ = channels_from_checkpoint(specs, checkpoint)
+    for chan in ("a", "b"):
+        apply_writes(
+            checkpoint,
+            channels,
+            [PregelTaskWrites((), chan, [(chan, 1)], [chan])],
+            lambda v, _: (v or 0) + 1,
+            {},
+        )
+    checkpoint = create_checkpoint(checkpoint, channels, 1)
+    saved = copy_checkpoint(checkpoint)
+    forked = fork_checkpoint(checkpoint)
+    assert forked == saved
+    assert forked["versions_seen"]["b"] is checkpoint["versions_seen"]["b"]
+
+    # applying writes to the original leaves the fork as it was
+    apply_writes(
+        checkpoint,
+        channels,
+        [PregelTaskWrites((), "a", [("b", 2)], ["a", "b"])],
+        lambda v, _: (v or 0) + 1,
+        {},
+    )
+    assert checkpoint["versions_seen"]["a"] == {"a": 1, "b": 2}
+    assert forked == saved
+    assert forked["versions_seen"]["b"] is checkpoint["versions_seen"]["b"]
@@ -14,9 +14,15 @@ from langchain_core.messages import (
 from pydantic import BaseModel
 from typing_extensions import TypedDict
 
+from langgraph.channels.binop import BinaryOperatorAggregate
 from langgraph.constants import END, START
 from langgraph.graph import add_messages
-from langgraph.graph.message import REMOVE_ALL_MESSAGES, MessagesState, push_message
+from langgraph.graph.message import (
+    REMOVE_ALL_MESSAGES,
+    MessagesState,
+    _AddMessagesAggregate,
+    push_message,
+)
 from langgraph.graph.state import StateGraph
 from tests.messages import _AnyIdHumanMessage
 
@@ -177,6 +183,106 @@ def test_delete_all():
     assert result == expected_result
 
 
+def test_add_messages_channel_matches_reducer():
+    updates = [
+        [HumanMessage(content="Hello")],
+        AIMessage(content="Hi there!", id="2"),
+        [HumanMessage(content="Hi again", id="3"), AIMessage(content="Yo", id="4")],
+        [HumanMessage(content="Hi again!", id="3"), RemoveMessage(id="2")],
+        [AIMessage(content="Hello", id="2"), AIMessage(content="Hello", id="2")],
+        [RemoveMessage(id="4"), AIMessage(content="back", id="4")],
+        [],
+        [RemoveMessage(id=REMOVE_ALL_MESSAGES), HumanMessage(content="reset", id="5")],
+        [AIMessage(content="after reset", id="6")],
+    ]
+    channel = _AddMessagesAggregate(list).from_checkpoint(
+        [HumanMessage(content="System", id="0")]
+    )
+    expected = [HumanMessage(content="System", id="0")]
+    for update in updates:
+        previous = channel.get()
+        channel.update([update])
+        expected = add_messages(expected, update)
+        assert channel.get() == expected
+        # previous values are never modified in place
+        assert channel.get() is not previous
+
+    # several updates in the same step are applied in order
+    channel.update([[AIMessage(content="a", id="7")], [RemoveMessage(id="7")]])
+    assert channel.get() == add_messages(
+        add_messages(expected, [AIMessage(content="a", id="7")]),
+        [RemoveMessage(id="7")],
+    )
+
+    # failed updates leave the channel unchanged and usable
+    before = channel.get()
+    with pytest.raises(ValueError):
+        channel.update([[AIMessage(content="b", id="8"), RemoveMessage(id="9")]])
+    assert channel.get() == before
+    channel.update([[AIMessage(content="b", id="8")]])
+    assert channel.get() == add_messages(before, [AIMessage(content="b", id="8")])
+
+    # appends extend the index in place
+    index = channel.index
+    channel.update([[AIMessage(content="c", id="9")], [RemoveMessage(id="9")]])
+    channel.update([[HumanMessage(content="f", id="10")]])
+    assert channel.index is not index
+    index = channel.index
+    channel.update([[HumanMessage(content="f!", id="10"), AIMessage(content="g")]])
+    assert channel.index is index
+
+    # copies share the index without affecting each other
+    copy = channel.copy()
+    assert copy.base is channel.index
+    before = channel.get()
+    copy.update([[AIMessage(content="c", id="9")]])
+    channel.update([[AIMessage(content="d", id="9"), AIMessage(content="e", id="8")]])
+    copy.update([[AIMessage(content="c!", id="9"), AIMessage(content="e!", id="8")]])
+    assert copy.get() == add_messages(
+        before,
+        [
+            AIMessage(content="c!", id="9"),
+            AIMessage(content="e!", id="8"),
+        ],
+    )
+    assert channel.get() == add_messages(
+        before, [AIMessage(content="d", id="9"), AIMessage(content="e", id="8")]
+    )
+    # and so do copies of copies
+    nested = copy.copy()
+    assert nested.base is channel.index
+    nested.update([[AIMessage(content="h", id="9"), AIMessage(content="i", id="11")]])
+    channel.update([[AIMessage(content="j", id="11")]])
+    assert nested.get() == add_messages(
+        copy.get(), [AIMessage(content="h", id="9"), AIMessage(content="i", id="11")]
+    )
+    assert copy.get() == add_messages(
+        before,
+        [
+            AIMessage(content="c!", id="9"),
+            AIMessage(content="e!", id="8"),
+        ],
+    )
+    assert channel.get() == add_messages(
+        before,
+        [
+            AIMessage(content="d", id="9"),
+            AIMessage(content="e", id="8"),
+            AIMessage(content="j", id="11"),
+        ],
+    )
+
+
+def test_add_messages_channel_selection():
+    class State(TypedDict):
+        messages: Annotated[list[AnyMessage], add_messages]
+        formatted: Annotated[list[AnyMessage], add_messages(format="langchain-openai")]
+
+    graph = StateGraph(State)
+    assert type(graph.channels["messages"]) is _AddMessagesAggregate
+    assert type(graph.channels["formatted"]) is BinaryOperatorAggregate
+
+
 class MessagesStatePydantic(BaseModel):
     messages: Annotated[list[AnyMessage], add_messages]
 
@@ -1467,6 +1467,11 @@ def test_invoke_checkpoint_three(
     )
     assert len(cursored) == 1
     assert cursored[0].config == thread_1_history[1].config
+    # metadata-only history doesn't load values or tasks
+    light_history = list(app.get_state_history(thread_1, metadata_only=True))
+    assert [c.config for c in light_history] == [c.config for c in thread_1_history]
+    assert [c.metadata for c in light_history] == [c.metadata for c in thread_1_history]
+    assert all(c.values == {} and c.tasks == () for c in light_history)
     # the last checkpoint
     assert thread_1_history[0].values["total"] == 16
     # the first "loop" checkpoint
@@ -8613,3 +8618,69 @@ def test_multiple_writes_same_channel_from_same_node(
             "values": {"foo": ""},
         },
     ]
+
+
+def test_eager_steps(sync_checkpointer: BaseCheckpointSaver) -> None:
+    """Test that nodes of the next step start before the slowest node of the
+    current step finished, and only rerun if it changed what they read."""
+
+    class State(TypedDict):
+        a: Annotated[str, operator.add]
+        b: str
+        c: str
+
+    class CState(TypedDict):
+        a: str
+
+    c_started = threading.Event()
+    c_calls = 0
+
+    def a(state: State) -> dict:
+        return {"a": "a"}
+
+    def c(state: CState) -> dict:
+        nonlocal c_calls
+        c_calls += 1
+        c_started.set()
+        return {"c": state["a"] + "c"}
+
+    def build(b: Any) -> Any:
+        return (
+            StateGraph(State)
+            .add_node("a", a)
+            .add_node("b", b)
+            .add_node("c", c, input_schema=CState)
+            .add_edge(START, "a")
+            .add_edge(START, "b")
+            .add_edge("a", "c")
+            .compile(checkpointer=sync_checkpointer, eager_steps=True)
+        )
+
+    # b doesn't write to what c reads, so c runs once, while b is running
+    def b(state: State) -> dict:
+        assert c_started.wait(5)
+        return {"b": "b"}
+
+    graph = build(b)
+    config = {"configurable": {"thread_id": "1"}}
+    assert graph.invoke({"a": ""}, config) == {"a": "a", "b": "b", "c": "ac"}
+    assert c_calls == 1
+    assert [s.next for s in graph.get_state_history(config)] == [
+        (),
+        ("c",),
+        ("a", "b"),
+        ("__start__",),
+    ]
+
+    # b writes to what c reads, so c runs again with the state of the full step
+    c_started.clear()
+    c_calls = 0
+
+    def b_writes_a(state: State) -> dict:
+        assert c_started.wait(5)
+        return {"a": "b"}
+
+    graph = build(b_writes_a)
+    config = {"configurable": {"thread_id": "2"}}
+    assert graph.invoke({"a": ""}, config) == {"a": "ab", "c": "abc"}
+    assert c_calls == 2
@@ -54,7 +54,7 @@ from langgraph.func import entrypoint, task
 from langgraph.graph import END, START, StateGraph
 from langgraph.graph.message import MessagesState, add_messages
 from langgraph.pregel import NodeBuilder, Pregel
-from langgraph.pregel._loop import AsyncPregelLoop
+from langgraph.pregel._loop import AsyncPregelLoop, _arun_eager
 from langgraph.pregel._runner import PregelRunner
 from langgraph.types import (
     CachePolicy,
@@ -3579,6 +3579,163 @@ graph TD;
     assert await graph.ainvoke(None, thread1) == ["0", "1", *range(100), "3"]
 
 
+async def test_node_max_concurrency_and_priority() -> None:
+    currently: dict[str, int] = {"llm": 0, "tool": 0}
+    max_currently: dict[str, int] = {"llm": 0, "tool": 0}
+
+    def counting(name: str):
+        async def node(state) -> list:
+            currently[name] += 1
+            max_currently[name] = max(max_currently[name], currently[name])
+            await asyncio.sleep(0.01)
+            currently[name] -= 1
+            return [name]
+
+        return node
+
+    async def fan_out(state) -> list:
+        return [Send("llm", 0) for _ in range(20)] + [
+            Send("tool", 0) for _ in range(20)
+        ]
+
+    builder = StateGraph(Annotated[list, operator.add])
+    builder.add_node("llm", counting("llm"), max_concurrency=3)
+    builder.add_node("tool", counting("tool"))
+    builder.add_conditional_edges(START, fan_out)
+    graph = builder.compile()
+
+    assert sorted(await graph.ainvoke([])) == ["llm"] * 20 + ["tool"] * 20
+    # the capped node doesn't hold back other nodes
+    assert max_currently == {"llm": 3, "tool": 20}
+
+    started: list[str] = []
+    queue_wait: dict[str, float] = {}
+
+    def recording(name: str):
+        async def node(state, config: RunnableConfig) -> list:
+            started.append(name)
+            queue_wait[name] = config["metadata"]["langgraph_queue_wait"]
+            await asyncio.sleep(0.01)
+            return [name]
+
+        return node
+
+    builder = StateGraph(Annotated[list, operator.add])
+    builder.add_node("a_first", recording("a_first"))
+    builder.add_node("b_low", recording("b_low"))
+    builder.add_node("c_high", recording("c_high"), priority=1)
+    for node in ("a_first", "b_low", "c_high"):
+        builder.add_edge(START, node)
+    graph = builder.compile()
+
+    await graph.ainvoke([], {"max_concurrency": 1})
+    # waiting tasks start in order of priority
+    assert started == ["a_first", "c_high", "b_low"]
+    assert queue_wait["c_high"] > 0
+    assert queue_wait["b_low"] > queue_wait["c_high"]
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        builder.add_node("d", recording("d"), max_concurrency=0)
+
+
+async def test_eager_steps(
+    mocker: MockerFixture, async_checkpointer: BaseCheckpointSaver
+) -> None:
+    """Test that nodes of the next step start before the slowest node of the
+    current step finished, and only rerun if it changed what they read."""
+
+    class State(TypedDict):
+        a: Annotated[str, operator.add]
+        b: str
+        c: str
+
+    class CState(TypedDict):
+        a: str
+
+    c_started = asyncio.Event()
+    c_calls = 0
+
+    async def a(state: State) -> dict:
+        return {"a": "a"}
+
+    async def c(state: CState) -> dict:
+        nonlocal c_calls
+        c_calls += 1
+        c_started.set()
+        return {"c": state["a"] + "c"}
+
+    def build(b: Any, **kwargs: Any) -> Any:
+        return (
+            StateGraph(State)
+            .add_node("a", a)
+            .add_node("b", b)
+            .add_node("c", c, input_schema=CState, **kwargs)
+            .add_edge(START, "a")
+            .add_edge(START, "b")
+            .add_edge("a", "c")
+            .compile(checkpointer=async_checkpointer, eager_steps=True)
+        )
+
+    # b doesn't write to what c reads, so c runs once, while b is running
+    async def b(state: State) -> dict:
+        await asyncio.wait_for(c_started.wait(), 5)
+        return {"b": "b"}
+
+    graph = build(b)
+    config = {"configurable": {"thread_id": "1"}}
+    assert await graph.ainvoke({"a": ""}, config) == {"a": "a", "b": "b", "c": "ac"}
+    assert c_calls == 1
+    assert [s.next async for s in graph.aget_state_history(config)] == [
+        (),
+        ("c",),
+        ("a", "b"),
+        ("__start__",),
+    ]
+
+    # b writes to what c reads, so c runs again with the state of the full step
+    c_started.clear()
+    c_calls = 0
+
+    async def b_writes_a(state: State) -> dict:
+        await asyncio.wait_for(c_started.wait(), 5)
+        return {"a": "b"}
+
+    graph = build(b_writes_a)
+    config = {"configurable": {"thread_id": "2"}}
+    assert await graph.ainvoke({"a": ""}, config) == {"a": "ab", "c": "abc"}
+    assert c_calls == 2
+
+    # an eager task of a capped node that hasn't started when the step ends,
+    # eg. still waiting for a slot, is cancelled and the node runs with the
+    # state of the full step instead
+    c_calls = 0
+    c_queued = asyncio.Event()
+    eager_started = False
+
+    async def waiting_for_slot(*args: Any, **kwargs: Any) -> Any:
+        nonlocal eager_started
+        c_queued.set()
+        await asyncio.Event().wait()
+        eager_started = True
+        return await _arun_eager(*args, **kwargs)
+
+    mocker.patch("langgraph.pregel._loop._arun_eager", waiting_for_slot)
+
+    async def b_waits_for_c(state: State) -> dict:
+        await asyncio.wait_for(c_queued.wait(), 5)
+        return {"b": "b"}
+
+    graph = build(b_waits_for_c, max_concurrency=1)
+    config = {"configurable": {"thread_id": "3"}}
+    assert await asyncio.wait_for(graph.ainvoke({"a": ""}, config), 5) == {
+        "a": "a",
+        "b": "b",
+        "c": "ac",
+    }
+    assert c_calls == 1
+    assert not eager_started
+
+
 async def test_invoke_checkpoint_three(
     mocker: MockerFixture, async_checkpointer: BaseCheckpointSaver
 ) -> None:
@@ -314,6 +314,9 @@ def test_get_state_history():
         interrupts=(),
     )
 
+    (metadata_snapshot,) = remote_pregel.get_state_history(config, metadata_only=True)
+    assert metadata_snapshot == state_history_snapshot[0]._replace(values={})
+
 
 @pytest.mark.anyio
 async def test_aget_state_history():
@@ -1,6 +1,8 @@
 import inspect
 import operator
+import os
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Annotated, Any, Optional, Union
 from typing import Annotated as Annotated2
@@ -371,3 +373,51 @@ def test_is_field_channel() -> None:
     # No channel cases
     assert _is_field_channel(int) is None
     assert _is_field_channel(Annotated[int, "just_metadata"]) is None
+
+
+class PidState(TypedDict):
+    n: int
+    pids: Annotated[list[int], operator.add]
+
+
+def _square_in_process(state: PidState) -> dict:
+    return {"n": state["n"] ** 2, "pids": [os.getpid()]}
+
+
+def _square_with_config(state: PidState, config: RunnableConfig) -> dict:
+    return {"n": state["n"] ** 2}
+
+
+def test_add_node_process_pool() -> None:
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        for process_pool in (True, executor):
+            builder = StateGraph(PidState)
+            builder.add_node("square", _square_in_process, process_pool=process_pool)
+            builder.add_edge("__start__", "square")
+            graph = builder.compile()
+
+            result = graph.invoke({"n": 3, "pids": []})
+            assert result["n"] == 9
+            assert result["pids"][0] != os.getpid()
+
+    builder = StateGraph(PidState)
+    with pytest.raises(ValueError, match="config"):
+        builder.add_node("square", _square_with_config, process_pool=True)
+
+    async def asquare(state: PidState) -> dict:
+        return {"n": state["n"] ** 2}
+
+    with pytest.raises(TypeError):
+        builder.add_node("square", asquare, process_pool=True)
+
+
+@pytest.mark.anyio
+async def test_add_node_process_pool_async() -> None:
+    builder = StateGraph(PidState)
+    builder.add_node("square", _square_in_process, process_pool=True)
+    builder.add_edge("__start__", "square")
+    graph = builder.compile()
+
+    result = await graph.ainvoke({"n": 4, "pids": []})
+    assert result["n"] == 16
+    assert result["pids"][0] != os.getpid()